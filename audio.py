@@ -0,0 +1,270 @@
+import os
+import time
+import logging
+import threading
+
+import numpy as np
+import pygame.mixer
+
+import perfil
+
+# ============================================================================
+# CARREGAMENTO DE SONS EM SEGUNDO PLANO
+# ============================================================================
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+
+# Arquivo -> nome do som no banco (mesmo nome dos antigos atributos do GameApp)
+ARQUIVOS_SOM = {
+    'acerto_letra.wav': 'som_acerto',
+    'erro_letra.wav': 'som_erro',
+    'vitoria_palavra.wav': 'som_vitoria_palavra',
+    'musica_menu.wav': 'musica_menu',
+    'teclado.wav': 'som_teclado',
+    'fim_jogo.wav': 'som_fim_jogo',
+    'iniciar_rodada.wav': 'som_iniciar_rodada'
+}
+
+SONS_MUSICA = {'musica_menu'}
+FATOR_VOLUME = {'som_teclado': 0.4}  # Volume menor para teclado
+
+# Formato das amostras do mixer (tamanho retornado por get_init) -> dtype do NumPy
+DTYPE_AMOSTRA = {-16: np.int16, 16: np.uint16, -8: np.int8, 8: np.uint8, 32: np.float32}
+
+
+def pastas_busca_sons(pasta_base=PASTA_JOGO):
+    """Pastas onde os sons podem estar, resolvidas a partir da pasta do script"""
+    return [
+        pasta_base,  # Arquivo na mesma pasta do jogo
+        os.path.join(pasta_base, "sons"),  # Pasta sons
+        os.path.normpath(os.path.join(pasta_base, "..", "sons")),  # Pasta sons um nível acima
+        os.path.normpath(os.path.join(pasta_base, "..", "..", "sons")),  # Pasta sons dois níveis acima
+    ]
+
+
+def resolver_arquivos_som(nomes_arquivos, pasta_base=PASTA_JOGO):
+    """Lista cada pasta candidata uma única vez e devolve {arquivo: caminho absoluto}"""
+    caminhos = {}
+    pendentes = set(nomes_arquivos)
+    for pasta in pastas_busca_sons(pasta_base):
+        if not pendentes:
+            break
+        try:
+            conteudo = set(os.listdir(pasta))
+        except OSError:
+            continue
+        for nome in list(pendentes):
+            if nome in conteudo:
+                caminhos[nome] = os.path.join(pasta, nome)
+                pendentes.discard(nome)
+    return caminhos
+
+
+def aplicar_volume_no_buffer(som, volume):
+    """Devolve um novo Sound com o volume multiplicado direto nas amostras.
+
+    Se o formato do mixer não for suportado, cai para set_volume.
+    """
+    if volume >= 1.0:
+        return som
+    formato = pygame.mixer.get_init()
+    dtype = DTYPE_AMOSTRA.get(formato[1]) if formato else None
+    if dtype is None:
+        som.set_volume(volume)
+        return som
+
+    # Em lote no NumPy: a thread de carregamento não segura o GIL amostra por amostra
+    amostras = np.frombuffer(som.get_raw(), dtype=dtype)
+    if formato[1] == 32:
+        escaladas = amostras * np.float32(volume)
+    elif formato[1] < 0:
+        escaladas = amostras * volume
+    else:
+        # Amostras sem sinal: o silêncio fica no meio da escala
+        meio = 1 << (formato[1] - 1)
+        escaladas = meio + (amostras.astype(np.float32) - meio) * volume
+    return pygame.mixer.Sound(buffer=escaladas.astype(dtype).tobytes())
+
+
+class BancoSons:
+    """Sons decodificados e com volume já aplicado, compartilhados pelo jogo.
+
+    O carregamento roda numa thread; cada som fica disponível em obter()
+    assim que termina de ser decodificado. Arquivos ausentes ou corrompidos
+    só geram aviso no log.
+    """
+
+    def __init__(self, volume_efeitos, volume_musica, pasta_base=PASTA_JOGO):
+        self.volume_efeitos = volume_efeitos
+        self.volume_musica = volume_musica
+        self.pasta_base = pasta_base
+        self.sons = {}
+        self.falhas = {}
+        self.concluido = threading.Event()
+        self.thread = None
+
+    def obter(self, nome):
+        return self.sons.get(nome)
+
+    def volume_do_som(self, nome):
+        if nome in SONS_MUSICA:
+            return self.volume_musica
+        return self.volume_efeitos * FATOR_VOLUME.get(nome, 1.0)
+
+    def carregar_em_segundo_plano(self):
+        """Um carregador por banco: se já há um rodando, devolve ele (para outro volume, use um banco novo)"""
+        if self.thread is not None and not self.concluido.is_set():
+            return self.thread
+        self.concluido.clear()
+        self.thread = threading.Thread(target=self.carregar_todos, name="carregador-sons", daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def carregar_todos(self):
+        with perfil.trecho("carregar_sons"):
+            self._carregar_todos()
+
+    def _carregar_todos(self):
+        try:
+            caminhos = resolver_arquivos_som(ARQUIVOS_SOM, self.pasta_base)
+            for nome_arquivo, nome in ARQUIVOS_SOM.items():
+                caminho = caminhos.get(nome_arquivo)
+                if not caminho:
+                    self.falhas[nome] = "arquivo não encontrado"
+                    logging.warning(f"Arquivo de som não encontrado: {nome_arquivo}")
+                    continue
+                try:
+                    som = pygame.mixer.Sound(caminho)
+                    # Atribuição de chave é atômica: a thread principal já pode tocar este som
+                    self.sons[nome] = aplicar_volume_no_buffer(som, self.volume_do_som(nome))
+                    self.falhas.pop(nome, None)
+                    logging.info(f"Som carregado: {caminho}")
+                except Exception as e:
+                    self.falhas[nome] = str(e)
+                    logging.warning(f"Erro ao carregar {nome_arquivo}: {e}")
+            logging.info(f"{len(self.sons)}/{len(ARQUIVOS_SOM)} sons carregados em segundo plano.")
+        finally:
+            self.concluido.set()
+
+
+# ============================================================================
+# GERENCIADOR DE CANAIS DE BAIXA LATÊNCIA
+# ============================================================================
+
+# Classe de efeito de cada som e quantos canais reservados ela recebe
+CLASSE_DO_SOM = {
+    'som_teclado': 'teclado',
+    'som_acerto': 'acerto',
+    'som_erro': 'erro',
+    'som_vitoria_palavra': 'rodada',
+    'som_fim_jogo': 'rodada',
+    'som_iniciar_rodada': 'rodada',
+    'musica_menu': 'musica',
+}
+CANAIS_POR_CLASSE = {'teclado': 3, 'acerto': 2, 'erro': 2, 'rodada': 1, 'musica': 1}
+
+
+class GerenciadorAudio:
+    """Toca os efeitos em canais reservados por classe, com buffer pequeno no mixer.
+
+    Cliques de teclado muito próximos são aglutinados e, se todos os canais
+    do teclado estiverem ocupados, a voz mais antiga é roubada. Funciona sem
+    placa de som com SDL_AUDIODRIVER=dummy.
+    """
+
+    def __init__(self, banco, canais_por_classe=None, janela_aglutinacao_ms=25.0, relogio=time.perf_counter):
+        self.banco = banco
+        self.canais_por_classe = dict(CANAIS_POR_CLASSE)
+        if canais_por_classe:
+            self.canais_por_classe.update(canais_por_classe)
+        self.janela_aglutinacao = janela_aglutinacao_ms / 1000
+        self.relogio = relogio
+        self.canais = {}            # classe -> lista de pygame.mixer.Channel
+        self.inicio_canal = {}      # id do canal -> instante em que começou a tocar
+        self.ultimo_teclado = float('-inf')
+        self.latencia_buffer_ms = 0.0
+        self.contadores = {'tocados': 0, 'aglutinados': 0, 'roubados': 0, 'descartados': 0}
+        self.despacho_total_ms = 0.0
+        self.despacho_max_ms = 0.0
+
+    def inicializar_mixer(self, buffer=256, frequencia=44100):
+        """Inicializa o mixer com um buffer pequeno (menos latência entre tecla e som)"""
+        pygame.mixer.pre_init(frequency=frequencia, size=-16, channels=2, buffer=buffer)
+        pygame.mixer.init()
+        frequencia_real = pygame.mixer.get_init()[0]
+        self.latencia_buffer_ms = buffer / frequencia_real * 1000
+        self.reservar_canais()
+
+    def reservar_canais(self):
+        """Separa canais dedicados para cada classe de efeito; exige o mixer iniciado"""
+        total = sum(self.canais_por_classe.values())
+        pygame.mixer.set_num_channels(total + 4)  # Alguns canais livres para a alocação padrão
+        pygame.mixer.set_reserved(total)
+        proximo = 0
+        for classe, quantidade in self.canais_por_classe.items():
+            self.canais[classe] = [pygame.mixer.Channel(proximo + i) for i in range(quantidade)]
+            proximo += quantidade
+        logging.info(f"Canais de áudio reservados: {self.canais_por_classe} (latência do buffer: {self.latencia_buffer_ms:.1f} ms).")
+
+    def tocar(self, nome, loops=0):
+        """Toca o som pelo canal da sua classe. Retorna True se uma voz começou a tocar"""
+        som = self.banco.obter(nome)
+        if som is None:
+            return False
+        classe = CLASSE_DO_SOM.get(nome, 'rodada')
+        agora = self.relogio()
+
+        if classe == 'teclado':
+            if agora - self.ultimo_teclado < self.janela_aglutinacao:
+                self.contadores['aglutinados'] += 1
+                return False
+            self.ultimo_teclado = agora
+
+        canais = self.canais.get(classe)
+        if not canais:
+            # Sem canais reservados (mixer sem reserva): usa a alocação padrão do pygame
+            if som.play(loops=loops) is None:
+                self.contadores['descartados'] += 1
+                return False
+            self._registrar_despacho(agora)
+            return True
+
+        canal = next((c for c in canais if not c.get_busy()), None)
+        if canal is None:
+            # Rouba a voz mais antiga da classe
+            canal = min(canais, key=lambda c: self.inicio_canal.get(id(c), 0.0))
+            canal.stop()
+            self.contadores['roubados'] += 1
+        canal.play(som, loops=loops)
+        self.inicio_canal[id(canal)] = agora
+        self._registrar_despacho(agora)
+        return True
+
+    def _registrar_despacho(self, inicio):
+        despacho_ms = (self.relogio() - inicio) * 1000
+        self.contadores['tocados'] += 1
+        self.despacho_total_ms += despacho_ms
+        self.despacho_max_ms = max(self.despacho_max_ms, despacho_ms)
+
+    def parar(self, classe):
+        for canal in self.canais.get(classe, []):
+            canal.stop()
+
+    def tocando(self, classe):
+        return any(canal.get_busy() for canal in self.canais.get(classe, []))
+
+    def encerrar(self):
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+            logging.info("Pygame mixer encerrado.")
+
+    def estatisticas(self):
+        """Contadores de vozes e latências (buffer do mixer e despacho do play)"""
+        tocados = self.contadores['tocados']
+        return {
+            **self.contadores,
+            'vozes_perdidas': self.contadores['aglutinados'] + self.contadores['roubados'] + self.contadores['descartados'],
+            'latencia_buffer_ms': round(self.latencia_buffer_ms, 2),
+            'despacho_medio_ms': round(self.despacho_total_ms / tocados, 4) if tocados else 0.0,
+            'despacho_max_ms': round(self.despacho_max_ms, 4),
+        }
@@ -0,0 +1,371 @@
+"""Teste de carga do servidor de partidas, todo em localhost.
+
+Sobe o servidor.py num processo separado (ou usa um que já esteja rodando,
+com --endereco), conecta robôs em N salas de J jogadores e, quando todas as
+salas estão cheias, joga as partidas ao mesmo tempo: o definidor manda uma
+palavra, o adivinhador tenta as letras embaralhadas uma a uma esperando a
+resposta de cada uma, como um jogador de verdade.
+
+Com --espectadores, cada sala ganha também espectadores (só leitura)
+que entram antes da largada e leem o estado até a sala fechar; os de
+--espectadores-lentos só leem depois que a sala fecha, como um telão
+travado, para exercitar o controle de fluxo do servidor.
+
+Mede a latência letra -> resposta (p50/p95/p99), mensagens por segundo, e
+a CPU e a memória do processo do servidor durante o jogo (Linux).
+
+Uso:
+    python carga_servidor.py --salas 2000
+    python carga_servidor.py --salas 5000 --jogadores 3 --partidas 2 --processos 2
+    python carga_servidor.py --endereco 127.0.0.1:5050 --salas 100 --tecla-ms 150
+    python carga_servidor.py --modo corrida --salas 500 --jogadores 8
+    python carga_servidor.py --salas 5 --espectadores 200 --espectadores-lentos 20 --tecla-ms 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rede import codificar, decodificar, separar_endereco, aumentar_limite_arquivos
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+LETRAS_PALAVRAS = "abcdefghijlmnoprstuvçãéó"
+
+
+class Robo:
+    """Um jogador sintético; o anfitrião da sala também cria a sala e inicia as partidas"""
+
+    def __init__(self, nome, parametros, estatisticas, rng):
+        self.nome = nome
+        self.parametros = parametros
+        self.estatisticas = estatisticas
+        self.rng = rng
+        self.leitor = self.escritor = None
+
+    async def conectar(self, host, porta):
+        self.leitor, self.escritor = await asyncio.open_connection(host, porta)
+
+    def enviar(self, tipo, **campos):
+        self.escritor.write(codificar({'tipo': tipo, **campos}))
+        self.estatisticas['enviadas'] += 1
+
+    async def receber(self):
+        linha = await self.leitor.readline()
+        if not linha:
+            raise ConnectionError("servidor fechou a conexão")
+        self.estatisticas['recebidas'] += 1
+        mensagem = decodificar(linha)
+        if mensagem['tipo'] == 'erro':
+            self.estatisticas['erros_servidor'] += 1
+        return mensagem
+
+    async def esperar(self, *tipos):
+        while True:
+            mensagem = await self.receber()
+            if mensagem['tipo'] in tipos:
+                return mensagem
+
+    async def entrar(self, codigo):
+        """Entra na sala (cria uma se `codigo` é vazio) e devolve o código dela"""
+        self.enviar('entrar', sala=codigo, nome=self.nome)
+        return (await self.esperar('entrou'))['sala']
+
+    def palavra_aleatoria(self):
+        tamanho = self.rng.randint(self.parametros['tamanho_min'], self.parametros['tamanho_max'])
+        return ''.join(self.rng.choice(LETRAS_PALAVRAS) for _ in range(tamanho))
+
+    async def jogar(self, anfitriao):
+        partidas = 0
+        modo = self.parametros['modo']
+        if anfitriao:
+            self.enviar('iniciar', modo=modo)
+        while partidas < self.parametros['partidas']:
+            mensagem = await self.receber()
+            tipo = mensagem['tipo']
+            if tipo == 'definir':
+                self.enviar('palavra', palavra=self.palavra_aleatoria())
+            elif tipo == 'rodada' and (mensagem['adivinhador'] == self.nome
+                                       or (modo == 'corrida' and mensagem['definidor'] != self.nome)):
+                await self.adivinhar(mensagem['letras'])
+            elif tipo == 'placar':
+                partidas += 1
+                self.estatisticas['partidas'] += anfitriao
+                if anfitriao and partidas < self.parametros['partidas']:
+                    self.enviar('iniciar', modo=modo)
+            elif tipo == 'encerrada':
+                raise ConnectionError(mensagem['motivo'])
+
+    async def adivinhar(self, letras):
+        """Tenta, posição por posição, as letras ainda não usadas, esperando cada resposta"""
+        restantes = list(letras)
+        pausa = self.parametros['tecla_ms'] / 1000
+        while restantes:
+            candidatas = restantes[:]
+            self.rng.shuffle(candidatas)
+            for letra in candidatas:
+                if pausa:
+                    await asyncio.sleep(pausa)
+                inicio = time.perf_counter()
+                self.enviar('letra', letra=letra)
+                resposta = await self.esperar('tentativa', 'erro')
+                if resposta['tipo'] == 'erro':
+                    return  # Corrida encerrada pelo tempo limite enquanto a letra viajava
+                self.estatisticas['latencias_ms'].append((time.perf_counter() - inicio) * 1000)
+                if resposta['acertou']:
+                    restantes.remove(resposta['letra_correta'] if resposta['letra_correta'] in restantes else letra)
+                    break
+            else:
+                return  # Nenhuma letra restante serviu (não acontece com o servidor correto)
+
+    async def fechar(self):
+        if self.escritor is not None:
+            self.escritor.close()
+            try:
+                await self.escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def assistir(host, porta, codigo, lento, estatisticas, sala_fechada):
+    """Um espectador: confere o estado montado a partir dos deltas até a sala fechar"""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        escritor.write(codificar({'tipo': 'assistir', 'sala': codigo}))
+        if lento:
+            await sala_fechada.wait()
+        estado = versao = None
+        while True:
+            linha = await leitor.readline()
+            if not linha:
+                raise ConnectionError("servidor fechou a conexão do espectador")
+            estatisticas['espectador_mensagens'] += 1
+            estatisticas['espectador_bytes'] += len(linha)
+            mensagem = decodificar(linha)
+            if mensagem['tipo'] == 'estado':
+                if estado is not None:
+                    estatisticas['espectador_ressincronias'] += 1
+                estado, versao = mensagem['s'], mensagem['v']
+            elif mensagem['tipo'] == 'delta':
+                if estado is None or mensagem['v'] <= versao:
+                    continue  # Delta já contido no estado recebido ao entrar
+                if mensagem['v'] != versao + 1:
+                    raise ValueError(f"espectador pulou da versão {versao} para {mensagem['v']}")
+                estado.update(mensagem['d'])
+                for chave in mensagem['r']:
+                    estado.pop(chave, None)
+                versao = mensagem['v']
+            elif mensagem['tipo'] == 'encerrada':
+                return
+            else:
+                raise ValueError(f"espectador recebeu {mensagem}")
+    finally:
+        escritor.close()
+
+
+async def _jogar_sala(numero, host, porta, parametros, estatisticas, largada, prontas):
+    rng = random.Random(parametros['semente'] * 1000003 + numero)
+    robos = [Robo(f"R{numero}J{j}", parametros, estatisticas, rng) for j in range(parametros['jogadores'])]
+    espectadores = []
+    sala_fechada = asyncio.Event()
+    try:
+        for robo in robos:
+            await robo.conectar(host, porta)
+        codigo = await robos[0].entrar('')
+        for robo in robos[1:]:
+            await robo.entrar(codigo)
+        quantidade = parametros['espectadores'] + parametros['espectadores_lentos']
+        espectadores = [asyncio.create_task(assistir(host, porta, codigo, e >= parametros['espectadores'],
+                                                     estatisticas, sala_fechada))
+                        for e in range(quantidade)]
+        prontas.append(numero)
+        await largada.wait()
+        await asyncio.gather(robos[0].jogar(True), *(robo.jogar(False) for robo in robos[1:]))
+    except (ConnectionError, OSError, ValueError) as e:
+        estatisticas['falhas'].append(f"sala {numero}: {e}")
+    finally:
+        for robo in robos:
+            await robo.fechar()
+        sala_fechada.set()
+        for resultado in await asyncio.gather(*espectadores, return_exceptions=True):
+            if isinstance(resultado, Exception):
+                estatisticas['falhas'].append(f"espectador da sala {numero}: {resultado}")
+
+
+async def _jogar_salas(primeira, quantidade, host, porta, parametros):
+    estatisticas = {'enviadas': 0, 'recebidas': 0, 'erros_servidor': 0, 'partidas': 0,
+                    'latencias_ms': [], 'falhas': [],
+                    'espectador_mensagens': 0, 'espectador_bytes': 0, 'espectador_ressincronias': 0}
+    largada = asyncio.Event()
+    prontas = []
+    inicio = time.perf_counter()
+    tarefas = [asyncio.create_task(_jogar_sala(primeira + i, host, porta, parametros, estatisticas, largada, prontas))
+               for i in range(quantidade)]
+    while len(prontas) + len(estatisticas['falhas']) < quantidade:
+        await asyncio.sleep(0.05)
+    estatisticas['conexao_s'] = time.perf_counter() - inicio
+    estatisticas['salas_prontas'] = len(prontas)
+    inicio = time.perf_counter()
+    largada.set()
+    await asyncio.wait(tarefas, timeout=parametros['timeout'])
+    estatisticas['jogo_s'] = time.perf_counter() - inicio
+    pendentes = [t for t in tarefas if not t.done()]
+    for tarefa in pendentes:
+        tarefa.cancel()
+    if pendentes:
+        estatisticas['falhas'].append(f"{len(pendentes)} salas não terminaram em {parametros['timeout']}s")
+    return estatisticas
+
+
+def executar_lote(primeira, quantidade, host, porta, parametros):
+    """Um processo cliente: `quantidade` salas num laço de eventos próprio"""
+    aumentar_limite_arquivos()
+    return asyncio.run(_jogar_salas(primeira, quantidade, host, porta, parametros))
+
+
+# ============================================================================
+# SERVIDOR E RELATÓRIO
+# ============================================================================
+
+def subir_servidor(argumentos_extras):
+    """Roda o servidor.py numa porta livre e devolve (processo, porta)"""
+    comando = [sys.executable, os.path.join(PASTA_JOGO, "servidor.py"), "--porta", "0"] + argumentos_extras
+    processo = subprocess.Popen(comando, stdout=subprocess.PIPE, text=True)
+    for linha in processo.stdout:
+        if linha.startswith("Servidor ouvindo em"):
+            return processo, int(linha.rsplit(':', 1)[1])
+    processo.wait()
+    raise RuntimeError(f"servidor.py terminou antes de abrir a porta (código {processo.returncode})")
+
+
+def uso_do_processo(pid):
+    """(segundos de CPU, memória residente em MB) de um processo, lidos do /proc; None fora do Linux"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            campos = f.read().rsplit(')', 1)[1].split()
+        with open(f"/proc/{pid}/status") as f:
+            rss_kb = next(int(linha.split()[1]) for linha in f if linha.startswith("VmRSS:"))
+    except (OSError, StopIteration):
+        return None
+    cpu = (int(campos[11]) + int(campos[12])) / os.sysconf('SC_CLK_TCK')
+    return cpu, rss_kb / 1024
+
+
+def percentil(ordenados, fracao):
+    if not ordenados:
+        return 0.0
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def juntar(resultados):
+    somados = ('enviadas', 'recebidas', 'erros_servidor', 'partidas', 'salas_prontas', 'latencias_ms', 'falhas',
+               'espectador_mensagens', 'espectador_bytes', 'espectador_ressincronias')
+    total = {chave: [] if chave in ('latencias_ms', 'falhas') else 0 for chave in somados}
+    total.update(conexao_s=0.0, jogo_s=0.0)
+    for resultado in resultados:
+        for chave in somados:
+            total[chave] += resultado[chave]
+        total['conexao_s'] = max(total['conexao_s'], resultado['conexao_s'])
+        total['jogo_s'] = max(total['jogo_s'], resultado['jogo_s'])
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endereco", help="servidor já rodando (host:porta); sem isto o servidor.py é iniciado aqui")
+    parser.add_argument("--salas", type=int, default=1000)
+    parser.add_argument("--jogadores", type=int, default=2, help="jogadores por sala")
+    parser.add_argument("--modo", choices=("turnos", "corrida"), default="turnos")
+    parser.add_argument("--partidas", type=int, default=1, help="partidas seguidas por sala")
+    parser.add_argument("--tecla-ms", type=float, default=0.0, help="pausa entre as letras de cada robô")
+    parser.add_argument("--espectadores", type=int, default=0, help="espectadores por sala")
+    parser.add_argument("--espectadores-lentos", type=int, default=0,
+                        help="espectadores por sala que só leem depois que a sala fecha")
+    parser.add_argument("--tamanho-min", type=int, default=5)
+    parser.add_argument("--tamanho-max", type=int, default=10)
+    parser.add_argument("--processos", type=int, default=1, help="processos clientes (o servidor usa sempre um)")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=300.0, help="segundos para as partidas terminarem")
+    parser.add_argument("--saida", help="grava o relatório em JSON")
+    args = parser.parse_args()
+    if args.jogadores < 2:
+        parser.error("--jogadores precisa ser pelo menos 2")
+
+    aumentar_limite_arquivos()
+    processo = None
+    if args.endereco:
+        host, porta = separar_endereco(args.endereco)
+    else:
+        # Palavras aleatórias dos robôs não estão no dicionário
+        processo, porta = subir_servidor(["--sem-dicionario"])
+        host = "127.0.0.1"
+
+    parametros = {'modo': args.modo, 'jogadores': args.jogadores, 'partidas': args.partidas, 'tecla_ms': args.tecla_ms,
+                  'tamanho_min': args.tamanho_min, 'tamanho_max': args.tamanho_max,
+                  'espectadores': args.espectadores, 'espectadores_lentos': args.espectadores_lentos,
+                  'semente': args.semente, 'timeout': args.timeout}
+    processos = max(1, min(args.processos, args.salas))
+    lotes = [(i * args.salas // processos, (i + 1) * args.salas // processos - i * args.salas // processos)
+             for i in range(processos)]
+    try:
+        uso_antes = uso_do_processo(processo.pid) if processo else None
+        if processos == 1:
+            resultados = [executar_lote(lotes[0][0], lotes[0][1], host, porta, parametros)]
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                futuros = [executor.submit(executar_lote, primeira, quantidade, host, porta, parametros)
+                           for primeira, quantidade in lotes]
+                resultados = [futuro.result() for futuro in futuros]
+        uso_depois = uso_do_processo(processo.pid) if processo else None
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+
+    total = juntar(resultados)
+    latencias = sorted(total.pop('latencias_ms'))
+    mensagens = total['enviadas'] + total['recebidas']
+    relatorio = {
+        'parametros': parametros,
+        'salas': args.salas,
+        'salas_simultaneas': total['salas_prontas'],
+        'conexoes': total['salas_prontas'] * args.jogadores,
+        'partidas_concluidas': total['partidas'],
+        'letras': len(latencias),
+        'mensagens': mensagens,
+        'mensagens_por_s': round(mensagens / total['jogo_s'], 1) if total['jogo_s'] else 0.0,
+        'conexao_s': round(total['conexao_s'], 2),
+        'jogo_s': round(total['jogo_s'], 2),
+        'latencia_ms': {'media': round(statistics.fmean(latencias), 3) if latencias else 0.0,
+                        'p50': round(percentil(latencias, 0.50), 3),
+                        'p95': round(percentil(latencias, 0.95), 3),
+                        'p99': round(percentil(latencias, 0.99), 3),
+                        'max': round(latencias[-1], 3) if latencias else 0.0},
+        'erros_servidor': total['erros_servidor'],
+        'espectadores': {'conexoes': total['salas_prontas'] * (args.espectadores + args.espectadores_lentos),
+                         'mensagens': total['espectador_mensagens'],
+                         'bytes': total['espectador_bytes'],
+                         'ressincronias': total['espectador_ressincronias']},
+        'falhas': total['falhas'][:20],
+    }
+    if uso_antes and uso_depois:
+        cpu = uso_depois[0] - uso_antes[0]
+        relatorio['servidor'] = {'cpu_s': round(cpu, 2),
+                                 'cpu_por_letra_us': round(cpu / len(latencias) * 1e6, 1) if latencias else 0.0,
+                                 'memoria_mb': round(uso_depois[1], 1)}
+
+    print(json.dumps(relatorio, ensure_ascii=False, indent=2))
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    if total['falhas']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,828 @@
+"""Dicionário compilado: lista de palavras com pontuação de dificuldade por palavra.
+
+A compilação lê as fontes (pt_BR.dic, palavras.txt...), calcula em lote com
+NumPy as características de cada palavra e grava tudo numa pasta de cache.
+Nas próximas execuções, se as fontes não mudaram, o jogo só carrega os
+arrays prontos. Cada palavra tem um ID (posição na lista ordenada) e os
+arrays ficam alinhados com esses IDs.
+
+Arrays gravados:
+- pontuacoes: dificuldade de cada palavra (maior = mais difícil);
+- ordem_pontuacao: IDs sorteáveis do mais fácil ao mais difícil;
+- grupo_anagrama: grupo de cada palavra (mesmas letras, acentos ignorados);
+- ordem_assinatura / inicio_grupo: IDs agrupados por grupo e o início de
+  cada grupo, para listar os anagramas de uma palavra sem varrer nada; os
+  grupos seguem a ordem alfabética da assinatura (letras ordenadas), então
+  a primeira palavra de cada grupo serve de chave para uma busca binária
+  pelos anagramas de palavras que não estão na base;
+- ordem_sem_acento: IDs em ordem alfabética das palavras sem acento, junto
+  com a lista das palavras sem acento na mesma ordem (busca por prefixo);
+- ordem_tamanho / inicio_tamanho: IDs agrupados por número de letras e o
+  início de cada tamanho, para sortear por tamanho sem filtrar a lista toda.
+
+As duas listas de palavras ficam em ListaCompacta (blocos com prefixo comum
+compartilhado), alguns bytes por palavra em vez de um str do Python cada.
+No modo de pouca memória (`mapear=True`) nada disso é lido para a RAM: os
+arquivos do cache são mapeados com mmap e o sistema só traz do disco as
+páginas que as buscas tocam.
+
+O índice compilado é a camada base (pt_BR.dic), nunca alterada. Listas
+menores (palavras.txt, palavras adicionadas em jogo) ficam em camadas
+(Camada) por cima dela, com os mesmos índices em miniatura; cada modo de
+jogo ativa as suas camadas com `ativar`, sem reler nem recompilar a base.
+Quando a própria fonte da base muda (atualização do pt_BR.dic), a
+diferença entra como remendo: palavras novas numa camada sempre ativa e
+as que saíram como lápides, gravados em remendo.json junto do cache.
+"""
+import bisect
+import json
+import logging
+import math
+import mmap
+import os
+import random
+import time
+
+import numpy as np
+
+from motor import remover_acentos
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+PASTA_CACHE = os.path.join(PASTA_JOGO, "dicionario_compilado")
+VERSAO_FORMATO = 9
+
+# Tamanhos aceitos para sorteio (mesmos limites gerais do jogo)
+TAMANHO_MIN = 4
+TAMANHO_MAX = 20
+
+NIVEIS = ("Fácil", "Médio", "Difícil")
+
+# Peso de cada característica (já normalizada) na pontuação final
+PESOS = {
+    'comprimento': 1.0,
+    'raridade': 0.8,    # letras pouco usadas no português (K, W, Y, X, Z...)
+    'repetidas': 0.3,   # letras repetidas confundem a ordem
+    'acentos': 0.4,
+    'anagramas': 0.6,   # outras palavras com as mesmas letras embaralhadas
+}
+
+
+# ============================================================================
+# LEITURA DAS FONTES
+# ============================================================================
+
+def ler_palavras(caminho):
+    """Lê um .dic do Hunspell ou uma lista simples com as mesmas regras do jogo"""
+    palavras = set()
+    for encoding in ("utf-8", "latin-1"):
+        try:
+            with open(caminho, "r", encoding=encoding) as f:
+                for numero, linha in enumerate(f):
+                    palavra = linha.strip().lower()
+                    if numero == 0 and palavra.isdigit():
+                        continue  # Contagem de entradas no topo do .dic
+                    palavra = palavra.split('/')[0]
+                    if palavra.isalpha():
+                        palavras.add(palavra)
+            return palavras
+        except UnicodeDecodeError:
+            palavras.clear()
+    return palavras
+
+
+def _assinatura_fontes(fontes):
+    return [{'caminho': os.path.abspath(f), 'tamanho': os.stat(f).st_size, 'mtime': os.stat(f).st_mtime}
+            for f in fontes]
+
+
+def _substituir_arquivo(caminho, gravar):
+    """Grava num temporário e troca de uma vez (quem tem o arquivo antigo em mmap continua lendo o antigo)"""
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as f:
+        gravar(f)
+    os.replace(temporario, caminho)
+
+
+def pasta_do_indice(fontes, pasta_cache=None):
+    """Uma subpasta por combinação de fontes da base (no jogo, só o pt_BR.dic: o palavras.txt é uma Camada por cima dela)"""
+    if pasta_cache is None:
+        pasta_cache = PASTA_CACHE  # Lido na chamada: o medir_desempenho.py aponta o cache para uma pasta temporária
+    nome = "+".join(os.path.splitext(os.path.basename(f))[0] for f in fontes) or "vazio"
+    return os.path.join(pasta_cache, nome)
+
+
+# ============================================================================
+# PONTUAÇÃO VETORIZADA
+# ============================================================================
+
+def matriz_codigos(palavras):
+    """Palavras -> matriz (n, maior tamanho) de code points, completada com zeros"""
+    largura = max(1, max(map(len, palavras), default=1))
+    return np.array(palavras, dtype=f'<U{largura}').view(np.uint32).reshape(len(palavras), largura)
+
+
+def dobrar_acentos(codigos):
+    """Mesma matriz com cada letra trocada pela versão sem acento"""
+    unicos = np.unique(codigos)
+    sem_acento = np.array([ord((remover_acentos(chr(c)) or chr(c))[0]) for c in unicos.tolist()], dtype=np.uint32)
+    return sem_acento[np.searchsorted(unicos, codigos)]
+
+
+def dobrar_palavra(palavra):
+    """Mesma troca de `dobrar_acentos`, para uma palavra só"""
+    return ''.join((remover_acentos(c) or c)[0] for c in palavra)
+
+
+def _normalizar(valores, validos):
+    """Valores padronizados pela média e desvio dos válidos, junto com (média, desvio)"""
+    base = valores[validos]
+    if base.size == 0:
+        return np.zeros_like(valores, dtype=np.float32), 0.0, 1.0
+    media = float(base.mean())
+    desvio = float(base.std()) or 1.0
+    return ((valores - media) / desvio).astype(np.float32), media, desvio
+
+
+def calcular_caracteristicas(codigos, dobrados):
+    """Características de dificuldade de cada palavra, calculadas em lote"""
+    letras = dobrados != 0
+
+    comprimento = letras.sum(axis=1)
+    acentos = ((codigos != dobrados) & letras).sum(axis=1)
+
+    # Raridade: -log da frequência de cada letra no próprio dicionário, média na palavra
+    alfabeto, contagens = np.unique(dobrados[letras], return_counts=True)
+    raridade_letra = -np.log(contagens / contagens.sum())
+    posicoes = np.searchsorted(alfabeto, dobrados).clip(max=len(alfabeto) - 1)
+    raridade = np.where(letras, raridade_letra[posicoes], 0.0).sum(axis=1) / np.maximum(comprimento, 1)
+
+    # Letras ordenadas = letras embaralhadas; iguais vizinhas são repetições
+    ordenadas = np.sort(dobrados, axis=1)
+    repetidas = ((ordenadas[:, 1:] == ordenadas[:, :-1]) & (ordenadas[:, 1:] != 0)).sum(axis=1)
+
+    # Anagramas: palavras com a mesma assinatura (letras ordenadas) ficam no mesmo grupo. Com os zeros
+    # no fim e os bytes em big-endian, comparar as linhas byte a byte é comparar as assinaturas como str:
+    # os grupos saem em ordem alfabética da assinatura (ver IndiceDificuldade.grupo_da_assinatura)
+    largura = ordenadas.shape[1]
+    colunas = (np.arange(largura) + (largura - comprimento)[:, None]) % largura
+    assinaturas = np.take_along_axis(ordenadas, colunas, axis=1).astype('>u4')
+    linhas = np.ascontiguousarray(assinaturas).view(np.dtype((np.void, 4 * largura))).ravel()
+    _, grupo, tamanho_grupo = np.unique(linhas, return_inverse=True, return_counts=True)
+    grupo = grupo.ravel()
+    anagramas = tamanho_grupo[grupo] - 1
+
+    return {
+        'comprimento': comprimento.astype(np.int16),
+        'raridade': raridade.astype(np.float32),
+        'repetidas': repetidas.astype(np.int16),
+        'acentos': acentos.astype(np.int16),
+        'anagramas': anagramas.astype(np.int32),
+        'grupo_anagrama': grupo.astype(np.int32),
+        'tamanho_grupo': tamanho_grupo.astype(np.int32),
+        'raridade_letra': {chr(c): float(r) for c, r in zip(alfabeto.tolist(), raridade_letra.tolist())},
+    }
+
+
+def pontuar(caracteristicas, validos):
+    """Soma ponderada das características normalizadas (maior = mais difícil).
+
+    Devolve também as estatísticas usadas (média e desvio de cada
+    característica, raridade de cada letra), para `pontuar_palavra`.
+    """
+    pontuacoes = np.zeros(len(validos), dtype=np.float32)
+    normalizacao = {}
+    for nome, peso in PESOS.items():
+        valores = caracteristicas[nome].astype(np.float32)
+        if nome == 'anagramas':
+            valores = np.log1p(valores)
+        normalizados, media, desvio = _normalizar(valores, validos)
+        pontuacoes += peso * normalizados
+        normalizacao[nome] = [media, desvio]
+    return pontuacoes, {'normalizacao': normalizacao, 'raridade_letra': caracteristicas['raridade_letra']}
+
+
+def pontuar_palavra(palavra, estatisticas, anagramas=0):
+    """A pontuação de `pontuar` para uma palavra fora da compilação, em O(tamanho da palavra)"""
+    if not estatisticas:
+        return 0.0
+    dobrada = dobrar_palavra(palavra)
+    raridade_letra = estatisticas['raridade_letra']
+    mais_rara = max(raridade_letra.values(), default=0.0)
+    valores = {
+        'comprimento': len(palavra),
+        'raridade': sum(raridade_letra.get(c, mais_rara) for c in dobrada) / max(len(palavra), 1),
+        'repetidas': len(dobrada) - len(set(dobrada)),
+        'acentos': sum(a != b for a, b in zip(palavra, dobrada)),
+        'anagramas': math.log1p(anagramas),
+    }
+    pontuacao = 0.0
+    for nome, peso in PESOS.items():
+        media, desvio = estatisticas['normalizacao'][nome]
+        pontuacao += peso * (valores[nome] - media) / desvio
+    return pontuacao
+
+
+# ============================================================================
+# LISTA COMPACTA DE PALAVRAS
+# ============================================================================
+
+class ListaCompacta:
+    """Lista ordenada de palavras guardada como um único bloco de bytes (front coding).
+
+    As palavras são agrupadas em blocos de BLOCO: a primeira de cada bloco é
+    gravada inteira em UTF-8 e as seguintes só com quantos bytes repetem da
+    anterior e o restante. Palavras vizinhas na ordem alfabética compartilham
+    muito prefixo, então cada uma custa poucos bytes (um str do Python custa
+    mais de 50). Acesso por ID e busca binária decodificam no máximo um bloco.
+
+    A ordem dos bytes UTF-8 é a mesma ordem dos code points, então as buscas
+    dão o mesmo resultado que `bisect` numa lista de str ordenada.
+    """
+
+    BLOCO = 16
+
+    def __init__(self, dados, inicios, total):
+        self.dados = dados        # bytes: (repetidos, tamanho do resto, resto) de cada palavra
+        self.inicios = inicios    # posição de cada bloco em `dados` (+ o tamanho total no fim)
+        self.total = total
+
+    @classmethod
+    def construir(cls, palavras):
+        """Codifica uma sequência de palavras já ordenada"""
+        dados = bytearray()
+        inicios = []
+        anterior = b''
+        total = 0
+        for total, palavra in enumerate(palavras, 1):
+            atual = palavra.encode('utf-8')
+            if len(atual) > 255:
+                raise ValueError(f"Palavra longa demais para a lista compacta: {palavra[:20]}...")
+            if (total - 1) % cls.BLOCO == 0:
+                inicios.append(len(dados))
+                comum = 0
+            else:
+                comum = len(os.path.commonprefix((anterior, atual)))
+            dados.append(comum)
+            dados.append(len(atual) - comum)
+            dados += atual[comum:]
+            anterior = atual
+        inicios.append(len(dados))
+        return cls(bytes(dados), np.array(inicios, dtype=np.uint32), total)
+
+    def __len__(self):
+        return self.total
+
+    def _cabeca(self, bloco):
+        inicio = int(self.inicios[bloco])
+        return self.dados[inicio + 2:inicio + 2 + self.dados[inicio + 1]]
+
+    def _decodificar(self, bloco, ate=None):
+        """Palavras (em bytes) do bloco, da primeira até a posição `ate` inclusive"""
+        dados = self.dados
+        posicao = int(self.inicios[bloco])
+        quantas = min(self.BLOCO, self.total - bloco * self.BLOCO)
+        if ate is not None:
+            quantas = min(quantas, ate + 1)
+        palavras = []
+        anterior = b''
+        for _ in range(quantas):
+            tamanho = dados[posicao + 1]
+            anterior = anterior[:dados[posicao]] + dados[posicao + 2:posicao + 2 + tamanho]
+            posicao += 2 + tamanho
+            palavras.append(anterior)
+        return palavras
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += self.total
+        if not 0 <= indice < self.total:
+            raise IndexError("índice fora da lista compacta")
+        bloco, posicao = divmod(indice, self.BLOCO)
+        return self._decodificar(bloco, posicao)[posicao].decode('utf-8')
+
+    def __iter__(self):
+        for bloco in range(len(self.inicios) - 1):
+            for palavra in self._decodificar(bloco):
+                yield palavra.decode('utf-8')
+
+    def _bisect(self, palavra, direita):
+        alvo = palavra.encode('utf-8')
+        # Último bloco cuja primeira palavra vem antes do alvo (ou é igual, para bisect_right)
+        baixo, alto = 0, len(self.inicios) - 1
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            cabeca = self._cabeca(meio)
+            if cabeca < alvo or (direita and cabeca == alvo):
+                baixo = meio + 1
+            else:
+                alto = meio
+        bloco = baixo - 1
+        if bloco < 0:
+            return 0
+        for posicao, atual in enumerate(self._decodificar(bloco)):
+            if atual > alvo or (not direita and atual == alvo):
+                return bloco * self.BLOCO + posicao
+        return min((bloco + 1) * self.BLOCO, self.total)
+
+    def bisect_left(self, palavra, lo=0, hi=None):
+        hi = self.total if hi is None else hi
+        return max(lo, min(self._bisect(palavra, False), hi))
+
+    def bisect_right(self, palavra, lo=0, hi=None):
+        hi = self.total if hi is None else hi
+        return max(lo, min(self._bisect(palavra, True), hi))
+
+    def __contains__(self, palavra):
+        i = self._bisect(palavra, False)
+        return i < self.total and self[i] == palavra
+
+    def salvar(self, caminho_base):
+        _substituir_arquivo(f"{caminho_base}.bin", lambda f: f.write(self.dados))
+        _substituir_arquivo(f"{caminho_base}_inicios.npy", lambda f: np.save(f, self.inicios))
+
+    @classmethod
+    def carregar(cls, caminho_base, total, mapear=False):
+        """Lê a lista gravada por `salvar`; com `mapear`, só mapeia os arquivos (mmap)"""
+        with open(f"{caminho_base}.bin", "rb") as f:
+            if mapear and total:
+                dados = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                dados = f.read()
+        inicios = np.load(f"{caminho_base}_inicios.npy", mmap_mode='r' if mapear else None)
+        if len(inicios) != -(-total // cls.BLOCO) + 1 or int(inicios[-1]) != len(dados):
+            raise ValueError(f"Lista compacta '{caminho_base}' inconsistente")
+        return cls(dados, inicios, total)
+
+
+class Camada:
+    """Palavras por cima do índice base (palavras.txt, adições em jogo), só em memória.
+
+    Guarda para as suas palavras os mesmos índices da base em miniatura
+    (pontuação, sem acento, anagramas, tamanho, nível), então incluir uma
+    palavra custa O(tamanho da palavra). Quem calcula a pontuação e o nível
+    é o IndiceDificuldade, com as estatísticas da base.
+    """
+
+    def __init__(self, nome, caminho=None):
+        self.nome = nome
+        self.caminho = caminho  # Arquivo de onde a camada foi lida (e onde as adições são gravadas)
+        self.palavras = set()
+        self.pontuacao = {}
+        self.sem_acento = {}   # palavra sem acento -> palavras
+        self.assinatura = {}   # letras ordenadas sem acento -> palavras
+        self.tamanho = {}      # número de letras -> palavras
+        self.nivel = {}        # nível -> palavras
+
+    def __len__(self):
+        return len(self.palavras)
+
+    def incluir(self, palavra, dobrada, pontuacao, nivel):
+        self.palavras.add(palavra)
+        self.pontuacao[palavra] = pontuacao
+        self.sem_acento.setdefault(dobrada, []).append(palavra)
+        self.assinatura.setdefault(''.join(sorted(dobrada)), []).append(palavra)
+        self.tamanho.setdefault(len(palavra), []).append(palavra)
+        if nivel is not None:
+            self.nivel.setdefault(nivel, []).append(palavra)
+
+
+class ConjuntoPalavras:
+    """Conjunto de palavras sobre uma ListaCompacta e as camadas ativas do índice.
+
+    Substitui um set de str nas consultas do jogo (`in`, `len` e iteração)
+    sem duplicar o dicionário inteiro em objetos do Python. `campo` diz que
+    parte de cada Camada entra: 'palavras' ou 'sem_acento'.
+    """
+
+    def __init__(self, lista, indice=None, campo='palavras'):
+        self.lista = lista
+        self.indice = indice
+        self.campo = campo
+
+    def _extras(self):
+        if self.indice is None:
+            return []
+        return [getattr(camada, self.campo) for camada in self.indice.ativas]
+
+    def _removidas(self):
+        if self.indice is None:
+            return ()
+        return self.indice.removidas if self.campo == 'palavras' else self.indice.removidas_sem_acento
+
+    def __contains__(self, palavra):
+        if any(palavra in extras for extras in self._extras()):
+            return True
+        return palavra not in self._removidas() and palavra in self.lista
+
+    def __len__(self):
+        return len(self.lista) - len(self._removidas()) + sum(len(extras) for extras in self._extras())
+
+    def __iter__(self):
+        removidas = self._removidas()
+        yield from (p for p in self.lista if p not in removidas) if removidas else self.lista
+        for extras in self._extras():
+            yield from extras
+
+    def sortear(self, rng=random, tentativas=32):
+        """Palavra qualquer do conjunto, sem montar uma lista com todas"""
+        extras = sorted(p for extras in self._extras() for p in extras)
+        removidas = self._removidas()
+        for _ in range(tentativas):
+            i = rng.randrange(len(self.lista) + len(extras))
+            palavra = self.lista[i] if i < len(self.lista) else extras[i - len(self.lista)]
+            if palavra not in removidas:
+                return palavra
+        return rng.choice(list(self))
+
+
+# ============================================================================
+# ÍNDICE POR NÍVEL
+# ============================================================================
+
+class IndiceDificuldade:
+    """Palavras ordenadas (ID = posição), pontuações alinhadas e níveis por faixa de pontuação.
+
+    `ordem_pontuacao` guarda os IDs sorteáveis do mais fácil ao mais difícil;
+    cada nível é um intervalo contíguo desse array, então sortear uma
+    palavra de um nível é escolher uma posição aleatória no intervalo.
+    """
+
+    ARRAYS = ('pontuacoes', 'ordem_pontuacao', 'grupo_anagrama', 'ordem_assinatura', 'inicio_grupo',
+              'ordem_sem_acento', 'ordem_tamanho', 'inicio_tamanho')
+
+    def __init__(self, palavras, sem_acento_ordenado, pontuacoes, ordem_pontuacao, grupo_anagrama,
+                 ordem_assinatura, inicio_grupo, ordem_sem_acento, ordem_tamanho, inicio_tamanho,
+                 estatisticas=None):
+        self.palavras = palavras
+        self.sem_acento_ordenado = sem_acento_ordenado  # palavras sem acento, na ordem de ordem_sem_acento
+        self.ordem_sem_acento = ordem_sem_acento
+        self.pontuacoes = pontuacoes
+        self.ordem_pontuacao = ordem_pontuacao
+        self.grupo_anagrama = grupo_anagrama
+        self.ordem_assinatura = ordem_assinatura
+        self.inicio_grupo = inicio_grupo
+        self.ordem_tamanho = ordem_tamanho
+        self.inicio_tamanho = inicio_tamanho  # inicio_tamanho[n]: primeira posição com n letras ou mais
+        total = len(ordem_pontuacao)
+        limites = [total * i // len(NIVEIS) for i in range(len(NIVEIS) + 1)]
+        self.niveis = {nivel: (limites[i], limites[i + 1]) for i, nivel in enumerate(NIVEIS)}
+        self.cortes = [float(pontuacoes[ordem_pontuacao[limite]]) for limite in limites[1:-1] if limite < total]
+        self.estatisticas = estatisticas
+        self.pasta = None  # Pasta do cache de origem, onde o remendo é gravado
+        self.fontes = []
+        # Diferença entre a compilação e a versão atual da fonte (ver `remendar`)
+        self.remendo = Camada('remendo')
+        self.removidas = {}              # palavra da base que saiu da fonte -> forma sem acento
+        self.removidas_sem_acento = set()
+        self.camadas = {}  # nome -> Camada carregada
+        self.nomes_ativos = ()
+        self.ativas = ()   # Camadas consultadas junto com a base (o remendo, se houver, vem sempre)
+
+    def __len__(self):
+        return len(self.palavras) - len(self.removidas) + sum(len(camada) for camada in self.ativas)
+
+    def __contains__(self, palavra):
+        return any(palavra in camada.palavras for camada in self.ativas) or self._na_base(palavra)
+
+    def _na_base(self, palavra):
+        return palavra not in self.removidas and palavra in self.palavras
+
+    def _montar_ativas(self):
+        remendo = (self.remendo,) if self.remendo.palavras else ()
+        self.ativas = remendo + tuple(self.camadas[nome] for nome in self.nomes_ativos if nome in self.camadas)
+
+    def carregar_camada(self, nome, caminho):
+        """(Re)lê uma camada de um arquivo de palavras; só as que não estão na base entram nela"""
+        camada = Camada(nome, caminho)
+        if os.path.exists(caminho):
+            for palavra in sorted(ler_palavras(caminho)):
+                self.adicionar(palavra, camada)
+        self.camadas[nome] = camada
+        self._montar_ativas()
+        return camada
+
+    def ativar(self, *nomes):
+        """Passa a consultar só estas camadas (além da base); camadas não carregadas são ignoradas"""
+        self.nomes_ativos = nomes
+        self._montar_ativas()
+
+    def remendar(self, adicionadas, removidas):
+        """Acompanha uma nova versão da fonte sem recompilar (substitui o remendo anterior).
+
+        As palavras novas entram numa camada sempre ativa; as que saíram da
+        base viram lápides, ignoradas por todas as consultas.
+        """
+        self.removidas = {p: dobrar_palavra(p) for p in removidas if p in self.palavras}
+        self.remendo = Camada('remendo')
+        for palavra in sorted(adicionadas):
+            self.adicionar(palavra, self.remendo)
+        # Uma forma sem acento só some se nenhuma palavra restante a usa
+        self.removidas_sem_acento = {
+            dobrada for dobrada in set(self.removidas.values())
+            if dobrada not in self.remendo.sem_acento
+            and all(p in self.removidas for p in self._base_sem_acento(dobrada))
+        }
+        self._montar_ativas()
+
+    def aplicar_diferenca(self, novas, removidas):
+        """Soma ao remendo atual a diferença entre duas versões da fonte (palavras novas, palavras que saíram)"""
+        novas, removidas = set(novas), set(removidas)
+        self.remendar((self.remendo.palavras | novas) - removidas, (set(self.removidas) | removidas) - novas)
+
+    def gravar_remendo(self):
+        """Grava o remendo junto do cache e passa a aceitar as fontes como estão agora no disco"""
+        if self.pasta is None:
+            return False
+        remendo = {'adicionadas': sorted(self.remendo.palavras), 'removidas': sorted(self.removidas)}
+        _substituir_arquivo(os.path.join(self.pasta, "remendo.json"),
+                            lambda f: f.write(json.dumps(remendo, ensure_ascii=False).encode("utf-8")))
+        caminho_meta = os.path.join(self.pasta, "meta.json")
+        with open(caminho_meta, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta['fontes'] = _assinatura_fontes(self.fontes)
+        meta['remendo'] = True
+        _substituir_arquivo(caminho_meta,
+                            lambda f: f.write(json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")))
+        return True
+
+    def adicionar(self, palavra, camada):
+        """Inclui uma palavra na camada (nome ou Camada), em O(tamanho da palavra); False se já existia"""
+        if not isinstance(camada, Camada):
+            camada = self.camadas.setdefault(camada, Camada(camada))
+        palavra = palavra.lower()
+        if palavra in camada.palavras or self._na_base(palavra):
+            return False
+        dobrada = dobrar_palavra(palavra)
+        assinatura = ''.join(sorted(dobrada))
+        anagramas = len(camada.assinatura.get(assinatura, ()))
+        grupo = self.grupo_da_assinatura(assinatura)
+        if grupo is not None:
+            anagramas += int(self.inicio_grupo[grupo + 1] - self.inicio_grupo[grupo])
+        pontuacao = pontuar_palavra(palavra, self.estatisticas, anagramas=anagramas)
+        nivel = None
+        if TAMANHO_MIN <= len(palavra) <= TAMANHO_MAX:
+            nivel = NIVEIS[bisect.bisect_right(self.cortes, pontuacao)]
+        camada.incluir(palavra, dobrada, pontuacao, nivel)
+        return True
+
+    def id_da_palavra(self, palavra):
+        i = self.palavras.bisect_left(palavra)
+        if i < len(self.palavras) and self.palavras[i] == palavra:
+            return i
+        return None
+
+    def nivel_da_palavra(self, palavra):
+        if not TAMANHO_MIN <= len(palavra) <= TAMANHO_MAX:
+            return None
+        pontuacao = next((c.pontuacao[palavra] for c in self.ativas if palavra in c.pontuacao), None)
+        if pontuacao is None:
+            id_palavra = self.id_da_palavra(palavra)
+            if id_palavra is None or palavra in self.removidas:
+                return None
+            pontuacao = float(self.pontuacoes[id_palavra])
+        return NIVEIS[bisect.bisect_right(self.cortes, pontuacao)]
+
+    def _ids_do_grupo(self, id_palavra):
+        grupo = self.grupo_anagrama[id_palavra]
+        return self.ordem_assinatura[self.inicio_grupo[grupo]:self.inicio_grupo[grupo + 1]]
+
+    def grupo_da_assinatura(self, assinatura):
+        """Grupo de anagramas da base com esta assinatura (letras ordenadas sem acento), ou None.
+
+        Busca binária sobre a primeira palavra de cada grupo: os grupos estão
+        em ordem alfabética da assinatura, sem array extra no cache.
+        """
+        baixo, alto = 0, len(self.inicio_grupo) - 1
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            cabeca = self.palavras[int(self.ordem_assinatura[self.inicio_grupo[meio]])]
+            if ''.join(sorted(dobrar_palavra(cabeca))) < assinatura:
+                baixo = meio + 1
+            else:
+                alto = meio
+        if baixo == len(self.inicio_grupo) - 1:
+            return None
+        cabeca = self.palavras[int(self.ordem_assinatura[self.inicio_grupo[baixo]])]
+        return baixo if ''.join(sorted(dobrar_palavra(cabeca))) == assinatura else None
+
+    def embaralhamento_ambiguo(self, id_palavra):
+        """Em O(1): as letras embaralhadas desta palavra formam outra palavra do dicionário?"""
+        grupo = self.grupo_anagrama[id_palavra]
+        return self.inicio_grupo[grupo + 1] - self.inicio_grupo[grupo] > 1
+
+    def anagramas(self, palavra):
+        """Outras palavras do dicionário com as mesmas letras (acentos ignorados), da base e das camadas ativas"""
+        assinatura = ''.join(sorted(dobrar_palavra(palavra)))
+        extras = [p for camada in self.ativas for p in camada.assinatura.get(assinatura, ()) if p != palavra]
+        id_palavra = self.id_da_palavra(palavra)
+        if id_palavra is not None:
+            if not self.embaralhamento_ambiguo(id_palavra):
+                return extras
+            ids = self._ids_do_grupo(id_palavra)
+        else:
+            # Palavra só de camada (palavras.txt, remendo): os anagramas dela na base vêm pela assinatura
+            grupo = self.grupo_da_assinatura(assinatura)
+            if grupo is None:
+                return extras
+            ids = self.ordem_assinatura[self.inicio_grupo[grupo]:self.inicio_grupo[grupo + 1]]
+        base = [self.palavras[i] for i in ids.tolist() if i != id_palavra]
+        return [p for p in base if p not in self.removidas] + extras
+
+    def faixa_do_prefixo(self, prefixo):
+        """Intervalo de ordem_sem_acento com as palavras que começam com o prefixo (acentos ignorados)"""
+        prefixo = remover_acentos(prefixo.lower())
+        inicio = self.sem_acento_ordenado.bisect_left(prefixo)
+        fim = self.sem_acento_ordenado.bisect_left(prefixo + "\U0010ffff", inicio)
+        return inicio, fim
+
+    def _base_sem_acento(self, alvo):
+        inicio = self.sem_acento_ordenado.bisect_left(alvo)
+        fim = self.sem_acento_ordenado.bisect_right(alvo, inicio)
+        return [self.palavras[i] for i in self.ordem_sem_acento[inicio:fim].tolist()]
+
+    def equivalentes_sem_acento(self, palavra):
+        """Palavras que só diferem de `palavra` nos acentos (inclusive ela mesma)"""
+        alvo = remover_acentos(palavra.lower())
+        return [p for p in self._base_sem_acento(alvo) if p not in self.removidas] + \
+            [p for camada in self.ativas for p in camada.sem_acento.get(alvo, ())]
+
+    def completar(self, prefixo, limite=5):
+        """(quantas palavras começam com o prefixo, as `limite` mais fáceis delas)"""
+        inicio, fim = self.faixa_do_prefixo(prefixo)
+        ids = self.ordem_sem_acento[inicio:fim]
+        margem = limite * 4  # Folga para descartar palavras curtas ou longas demais
+        if len(ids) > margem:
+            # Só as mais fáceis (palavras mais conhecidas tendem a ter pontuação menor)
+            ids = ids[np.argpartition(self.pontuacoes[ids], margem)[:margem]]
+        candidatas = [(pontuacao, self.palavras[i]) for pontuacao, i in zip(self.pontuacoes[ids].tolist(), ids.tolist())]
+        prefixo = remover_acentos(prefixo.lower())
+        if self.removidas:
+            candidatas = [c for c in candidatas if c[1] not in self.removidas]
+            fim -= sum(dobrada.startswith(prefixo) for dobrada in self.removidas.values())
+        extras = [(camada.pontuacao[p], p) for camada in self.ativas
+                  for sem_acento, palavras in camada.sem_acento.items() if sem_acento.startswith(prefixo)
+                  for p in palavras]
+        candidatas += extras
+        candidatas.sort(key=lambda c: c[0])
+        sugestoes = [p for _, p in candidatas if TAMANHO_MIN <= len(p) <= TAMANHO_MAX]
+        return fim - inicio + len(extras), sugestoes[:limite]
+
+    def _sortear_faixa(self, ordem, inicio, fim, extras, excluir, rng, tentativas):
+        """Sorteio uniforme entre ordem[inicio:fim] (IDs) e a lista `extras` (palavras das camadas)"""
+        na_faixa = max(0, fim - inicio)
+        total = na_faixa + len(extras)
+        if total == 0:
+            return None
+        for _ in range(tentativas):
+            sorteado = rng.randrange(total)
+            if sorteado < na_faixa:
+                palavra = self.palavras[int(ordem[inicio + sorteado])]
+            else:
+                palavra = extras[sorteado - na_faixa]
+            if palavra not in excluir and palavra not in self.removidas:
+                return palavra
+        # Faixa quase esgotada: procura as que sobraram
+        restantes = [p for p in (self.palavras[i] for i in ordem[inicio:fim].tolist())
+                     if p not in excluir and p not in self.removidas]
+        restantes += [p for p in extras if p not in excluir]
+        return rng.choice(restantes) if restantes else None
+
+    def sortear(self, nivel, excluir=(), rng=random, tentativas=32):
+        """Palavra aleatória do nível fora de `excluir`; None se o nível inteiro já foi usado"""
+        if nivel in self.niveis:
+            inicio, fim = self.niveis[nivel]
+            extras = [p for camada in self.ativas for p in camada.nivel.get(nivel, ())]
+        else:
+            inicio, fim = 0, len(self.ordem_pontuacao)
+            extras = [p for camada in self.ativas for palavras in camada.nivel.values() for p in palavras]
+        return self._sortear_faixa(self.ordem_pontuacao, inicio, fim, extras, excluir, rng, tentativas)
+
+    def sortear_por_tamanho(self, min_len, max_len, excluir=(), rng=random, tentativas=32):
+        """Palavra aleatória com min_len a max_len letras fora de `excluir` (None se não sobrou nenhuma)"""
+        ultimo = len(self.inicio_tamanho) - 1
+        inicio = int(self.inicio_tamanho[max(0, min(min_len, ultimo))])
+        fim = int(self.inicio_tamanho[max(0, min(max_len + 1, ultimo))])
+        extras = [p for camada in self.ativas for tamanho, palavras in camada.tamanho.items()
+                  if min_len <= tamanho <= max_len for p in palavras]
+        return self._sortear_faixa(self.ordem_tamanho, inicio, fim, extras, excluir, rng, tentativas)
+
+    def salvar(self, pasta, fontes):
+        os.makedirs(pasta, exist_ok=True)
+        caminho_meta = os.path.join(pasta, "meta.json")
+        if os.path.exists(caminho_meta):
+            os.remove(caminho_meta)  # Sem meta.json o cache fica inválido até terminar de gravar
+        self.palavras.salvar(os.path.join(pasta, "palavras"))
+        self.sem_acento_ordenado.salvar(os.path.join(pasta, "palavras_sem_acento"))
+        for nome in self.ARRAYS:
+            array = getattr(self, nome)
+            _substituir_arquivo(os.path.join(pasta, f"{nome}.npy"), lambda f: np.save(f, array))
+        with open(caminho_meta, "w", encoding="utf-8") as f:
+            json.dump({'versao': VERSAO_FORMATO, 'fontes': _assinatura_fontes(fontes), 'pesos': PESOS,
+                       'total': len(self.palavras), 'niveis': self.niveis, 'cortes': self.cortes,
+                       'estatisticas': self.estatisticas, 'remendo': False},
+                      f, ensure_ascii=False, indent=2)
+        self.pasta = pasta
+        self.fontes = list(fontes)
+
+    @classmethod
+    def carregar(cls, pasta, fontes, mapear=False):
+        """Índice gravado em `pasta`, ou None se não existir ou as fontes tiverem mudado.
+
+        Com `mapear`, listas e arrays ficam no disco (mmap) em vez de na memória.
+        """
+        try:
+            with open(os.path.join(pasta, "meta.json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('versao') != VERSAO_FORMATO or meta.get('pesos') != PESOS \
+                or meta.get('fontes') != _assinatura_fontes(fontes):
+            return None
+        listas = [ListaCompacta.carregar(os.path.join(pasta, nome), meta['total'], mapear)
+                  for nome in ("palavras", "palavras_sem_acento")]
+        arrays = [np.load(os.path.join(pasta, f"{nome}.npy"), mmap_mode='r' if mapear else None)
+                  for nome in cls.ARRAYS]
+        if len(arrays[0]) != meta['total']:
+            return None
+        indice = cls(*listas, *arrays, estatisticas=meta.get('estatisticas'))
+        indice.pasta = pasta
+        indice.fontes = list(fontes)
+        if meta.get('remendo'):
+            with open(os.path.join(pasta, "remendo.json"), "r", encoding="utf-8") as f:
+                remendo = json.load(f)
+            indice.remendar(remendo['adicionadas'], remendo['removidas'])
+        return indice
+
+
+def compilar(fontes):
+    """Lê as fontes e pontua todas as palavras (alguns segundos para o pt_BR.dic inteiro)"""
+    inicio = time.perf_counter()
+    palavras = set()
+    for fonte in fontes:
+        palavras |= ler_palavras(fonte)
+    palavras = sorted(p for p in palavras if len(p.encode('utf-8')) <= 255)
+    if not palavras:
+        vazio = np.zeros(0, dtype=np.int32)
+        return IndiceDificuldade(ListaCompacta.construir([]), ListaCompacta.construir([]),
+                                 np.zeros(0, dtype=np.float32), vazio, vazio, vazio, np.zeros(1, dtype=np.int32), vazio,
+                                 vazio, np.zeros(1, dtype=np.int32))
+
+    codigos = matriz_codigos(palavras)
+    dobrados = dobrar_acentos(codigos)
+    caracteristicas = calcular_caracteristicas(codigos, dobrados)
+    comprimento = caracteristicas['comprimento']
+    validos = (comprimento >= TAMANHO_MIN) & (comprimento <= TAMANHO_MAX)
+    pontuacoes, estatisticas = pontuar(caracteristicas, validos)
+    ids_validos = np.flatnonzero(validos)
+    ordem_pontuacao = ids_validos[np.argsort(pontuacoes[ids_validos], kind='stable')].astype(np.int32)
+
+    grupo_anagrama = caracteristicas['grupo_anagrama']
+    ordem_assinatura = np.argsort(grupo_anagrama, kind='stable').astype(np.int32)
+    inicio_grupo = np.concatenate(([0], np.cumsum(caracteristicas['tamanho_grupo']))).astype(np.int32)
+
+    # Agrupamento por tamanho: inicio_tamanho[n] é a primeira posição com n letras ou mais
+    ordem_tamanho = np.argsort(comprimento, kind='stable').astype(np.int32)
+    inicio_tamanho = np.searchsorted(comprimento[ordem_tamanho], np.arange(int(comprimento.max()) + 2)).astype(np.int32)
+
+    # Ordem alfabética sem acento: os zeros do fim de cada linha ordenam antes de qualquer letra
+    ordem_sem_acento = np.lexsort(dobrados.T[::-1]).astype(np.int32)
+    sem_acento_ordenado = dobrados[ordem_sem_acento].view(f'<U{dobrados.shape[1]}').ravel().tolist()
+    del codigos, dobrados
+
+    # As listas de str só existem durante a compilação; o índice guarda a versão compacta
+    palavras = ListaCompacta.construir(palavras)
+    sem_acento_ordenado = ListaCompacta.construir(sem_acento_ordenado)
+
+    logging.info(f"Dicionário compilado: {len(palavras)} palavras pontuadas em {time.perf_counter() - inicio:.2f}s.")
+    return IndiceDificuldade(palavras, sem_acento_ordenado, pontuacoes, ordem_pontuacao, grupo_anagrama,
+                             ordem_assinatura, inicio_grupo, ordem_sem_acento, ordem_tamanho, inicio_tamanho,
+                             estatisticas)
+
+
+def carregar_ou_compilar(fontes, pasta_cache=None, mapear=False):
+    """Usa o índice em cache se as fontes não mudaram; senão compila e grava de novo.
+
+    Com `mapear` (modo de pouca memória) o índice é usado direto dos arquivos
+    do cache via mmap; só a compilação, quando necessária, passa pela RAM.
+    """
+    fontes = [f for f in fontes if os.path.exists(f) and os.stat(f).st_size > 0]
+    pasta = pasta_do_indice(fontes, pasta_cache)
+    try:
+        indice = IndiceDificuldade.carregar(pasta, fontes, mapear)
+    except Exception as e:
+        logging.warning(f"Cache do dicionário em '{pasta}' ilegível, compilando de novo: {e}")
+        indice = None
+    if indice is not None:
+        logging.info(f"Dicionário compilado carregado do cache{' (mmap)' if mapear else ''}: {pasta}")
+        return indice
+
+    indice = compilar(fontes)
+    try:
+        indice.salvar(pasta, fontes)
+    except OSError as e:
+        logging.warning(f"Não foi possível gravar o cache do dicionário em '{pasta}': {e}")
+        return indice
+    if mapear:
+        # Troca a versão recém-compilada (toda na RAM) pela mapeada do disco
+        indice = IndiceDificuldade.carregar(pasta, fontes, mapear) or indice
+    return indice
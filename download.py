@@ -0,0 +1,166 @@
+"""Download do dicionário em pedaços, retomável, verificado e com instalação atômica.
+
+Não depende da interface: roda numa thread qualquer, informa o progresso
+por callback e sinaliza falhas com ErroDownload. O arquivo parcial
+(`<destino>.parcial`) fica no disco entre tentativas; a próxima continua
+de onde parou com um pedido HTTP Range, desde que o arquivo no servidor
+não tenha mudado (If-Range com o ETag/Last-Modified da primeira resposta).
+Só depois de conferir tamanho, hash e conteúdo o arquivo substitui o
+destino, com os.replace, então o jogo nunca lê um dicionário pela metade.
+
+Os validadores da cópia instalada (ETag, Last-Modified) ficam em
+`<destino>.validadores.json`; com `se_mudou=True` o pedido é condicional e
+uma resposta 304 (arquivo igual) custa só os cabeçalhos.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+
+TAMANHO_PEDACO = 64 * 1024
+
+
+class ErroDownload(Exception):
+    """Falha de rede ou de verificação (o parcial é mantido quando ainda serve para retomar)"""
+
+
+def _ler_estado(caminho_estado, url):
+    try:
+        with open(caminho_estado, "r", encoding="utf-8") as f:
+            estado = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return estado if estado.get('url') == url else {}
+
+
+def _gravar_estado(caminho_estado, estado):
+    with open(caminho_estado, "w", encoding="utf-8") as f:
+        json.dump(estado, f)
+
+
+def _remover(*caminhos):
+    for caminho in caminhos:
+        if os.path.exists(caminho):
+            os.remove(caminho)
+
+
+def _total_do_content_range(valor):
+    """'bytes 100-999/1000' ou 'bytes */1000' -> 1000 (None se o total for desconhecido)"""
+    encontrado = re.search(r"/(\d+)\s*$", valor or "")
+    return int(encontrado.group(1)) if encontrado else None
+
+
+def baixar_arquivo(url, destino, sha256=None, tamanho=None, validar=None, ao_progredir=None,
+                   sessao=None, timeout=10, tamanho_pedaco=TAMANHO_PEDACO, se_mudou=False):
+    """Baixa `url` para `destino` e devolve o caminho instalado (None se `se_mudou` e nada mudou).
+
+    - sha256 / tamanho: valores esperados (opcionais); o tamanho anunciado
+      pelo servidor é sempre conferido;
+    - validar(caminho_temporario): última checagem do conteúdo antes de
+      instalar; deve levantar ErroDownload (ou devolver False) para recusar;
+    - ao_progredir(baixados, total): chamado a cada pedaço, na thread do download;
+    - se_mudou: pedido condicional (If-None-Match / If-Modified-Since) com os
+      validadores da cópia atual de `destino`.
+    """
+    if sessao is None:
+        import requests
+        sessao = requests.Session()
+    parcial = destino + ".parcial"
+    caminho_estado = parcial + ".json"
+    estado = _ler_estado(caminho_estado, url)
+    ja_baixados = os.path.getsize(parcial) if estado and os.path.exists(parcial) else 0
+
+    caminho_validadores = destino + ".validadores.json"
+    cabecalhos = {}
+    if se_mudou and not ja_baixados and os.path.exists(destino):
+        validadores = _ler_estado(caminho_validadores, url)
+        if validadores.get('etag'):
+            cabecalhos['If-None-Match'] = validadores['etag']
+        if validadores.get('last_modified'):
+            cabecalhos['If-Modified-Since'] = validadores['last_modified']
+    if ja_baixados:
+        cabecalhos['Range'] = f"bytes={ja_baixados}-"
+        validador = estado.get('etag') or estado.get('last_modified')
+        if validador:
+            cabecalhos['If-Range'] = validador
+        logging.info(f"Retomando download de {url} a partir de {ja_baixados} bytes.")
+
+    try:
+        with sessao.get(url, headers=cabecalhos, stream=True, timeout=timeout) as resposta:
+            if resposta.status_code == 304 and not ja_baixados:
+                logging.info(f"'{destino}' já está atualizado (304 Not Modified).")
+                return None
+            if resposta.status_code == 416 and ja_baixados:
+                # Nada a pedir além do que já temos: o parcial pode estar completo
+                total = _total_do_content_range(resposta.headers.get('Content-Range'))
+                modo = None
+            elif resposta.status_code == 206 and ja_baixados:
+                total = _total_do_content_range(resposta.headers.get('Content-Range'))
+                modo = "ab"
+            else:
+                resposta.raise_for_status()
+                # 200: servidor sem Range ou arquivo mudou; recomeça do zero
+                ja_baixados = 0
+                comprimento = resposta.headers.get('Content-Length')
+                total = int(comprimento) if comprimento and 'Content-Encoding' not in resposta.headers else None
+                modo = "wb"
+                estado = {'url': url, 'etag': resposta.headers.get('ETag'),
+                          'last_modified': resposta.headers.get('Last-Modified')}
+                _gravar_estado(caminho_estado, estado)
+
+            baixados = ja_baixados
+            if ao_progredir:
+                ao_progredir(baixados, total)
+            if modo is not None:
+                with open(parcial, modo) as f:
+                    for pedaco in resposta.iter_content(tamanho_pedaco):
+                        if not pedaco:
+                            continue
+                        f.write(pedaco)
+                        baixados += len(pedaco)
+                        if ao_progredir:
+                            ao_progredir(baixados, total)
+                    f.flush()
+                    os.fsync(f.fileno())
+    except ErroDownload:
+        raise
+    except Exception as e:
+        raise ErroDownload(f"Falha ao baixar {url}: {e}") from e
+
+    _verificar(parcial, caminho_estado, total, tamanho, sha256, validar)
+    os.replace(parcial, destino)
+    _gravar_estado(caminho_validadores, estado)
+    _remover(caminho_estado)
+    logging.info(f"Download de {url} instalado em '{destino}' ({os.path.getsize(destino)} bytes).")
+    return destino
+
+
+def _verificar(parcial, caminho_estado, total, tamanho, sha256, validar):
+    """Confere o parcial antes de instalar; descarta o que não dá para aproveitar"""
+    recebido = os.path.getsize(parcial)
+    if total is not None and recebido < total:
+        raise ErroDownload(f"Download incompleto: {recebido} de {total} bytes (será retomado).")
+    for esperado, descricao in ((total, "anunciado pelo servidor"), (tamanho, "esperado")):
+        if esperado is not None and recebido != esperado:
+            _remover(parcial, caminho_estado)
+            raise ErroDownload(f"Tamanho {recebido} diferente do {descricao} ({esperado} bytes).")
+    if sha256:
+        resumo = hashlib.sha256()
+        with open(parcial, "rb") as f:
+            for pedaco in iter(lambda: f.read(TAMANHO_PEDACO), b""):
+                resumo.update(pedaco)
+        if resumo.hexdigest().lower() != sha256.lower():
+            _remover(parcial, caminho_estado)
+            raise ErroDownload(f"SHA-256 do download não confere (recebido {resumo.hexdigest()}).")
+    if validar is not None:
+        # Conteúdo recusado não serve para retomar: sem apagar, a próxima tentativa pediria
+        # além do fim (416) e conferiria de novo os mesmos bytes
+        try:
+            valido = validar(parcial)
+        except Exception:
+            _remover(parcial, caminho_estado)
+            raise
+        if valido is False:
+            _remover(parcial, caminho_estado)
+            raise ErroDownload("Conteúdo baixado não parece um dicionário válido.")
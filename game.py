@@ -1,26 +1,32 @@
+import time
+INICIO_PROCESSO = time.perf_counter()  # Referência para medir o tempo até a primeira tela
+import sys
+import perfil
+if any(a == "--profile-startup" or a.startswith("--profile-startup=") for a in sys.argv[1:]):
+    perfil.iniciar(INICIO_PROCESSO)  # Antes dos demais imports, para que eles também entrem no rastro
+
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 import random
 import os
-import time
-import requests
 import platform
 import string
 import json
-import sys
-import pygame.mixer
 import logging
-import unicodedata
-from bs4 import BeautifulSoup, Tag
-import webbrowser
+import threading
+from motor import Partida, STATUS_ADIVINHOU, STATUS_DESISTIU, embaralhar_letras, remover_acentos
+# requests, bs4, webbrowser e pygame (via audio) são importados sob demanda,
+# fora do caminho crítico até a primeira tela
 
 # --- Configuração do Logging ---
 log_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_log.txt")
-logging.basicConfig(filename=log_file_path, level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S')
-logging.info("--- INÍCIO DA EXECUÇÃO DO JOGO ---")
+
+def configurar_logging():
+    logging.basicConfig(filename=log_file_path, level=logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    logging.info("--- INÍCIO DA EXECUÇÃO DO JOGO ---")
 
 # --- Classe de Configurações do Usuário ---
 class ConfiguracoesUsuario:
@@ -32,7 +38,9 @@ class ConfiguracoesUsuario:
                 "volume_musica": 0.5,
                 "volume_efeitos": 0.7,
                 "som_ativado": True,
-                "musica_ativada": True
+                "musica_ativada": True,
+                "buffer_mixer": 256,  # amostras; menor = menos atraso entre tecla e som
+                "canais_teclado": 3
             },
             "interface": {
                 "tema": "escuro",  # escuro, claro
@@ -45,7 +53,10 @@ class ConfiguracoesUsuario:
                 "penalidade_erro": 3.0,
                 "tempo_limite": 0,  # 0 = sem limite
                 "mostrar_dicas": True,
-                "usar_palavras_comuns": True
+                "usar_palavras_comuns": True,
+                "modo_pouca_memoria": False,  # dicionário lido do disco (mmap) em vez da RAM
+                "gravar_rodadas": True,  # cada letra de cada rodada em gravacoes.bin (ver gravacao.py)
+                "sha256_dicionario": ""  # hash esperado do pt_BR.dic baixado (vazio = confere só o tamanho)
             },
             "ranking": {
                 "manter_historico": True,
@@ -54,6 +65,9 @@ class ConfiguracoesUsuario:
             },
             "perfil": {
                 "nome_padrao": "JOGADOR"
+            },
+            "rede": {
+                "servidor": "127.0.0.1:5050"  # host:porta do servidor.py
             }
         }
         self.configuracoes = self.carregar_configuracoes()
@@ -157,18 +171,264 @@ ARQUIVO_DICIONARIO = "palavras.txt"
 URL_DICIONARIO_ONLINE = "https://raw.githubusercontent.com/uefs/dic-ptbr-latex/master/pt_BR.dic"
 URL_DICIONARIO_COMUM = "https://raw.githubusercontent.com/dwyl/english-words/master/words.txt"
 
+# Base do dicionário (compilada uma vez) e camadas por cima dela ativadas em cada modo
+ARQUIVO_DICIONARIO_BASE = "pt_BR.dic"
+CAMADA_LOCAL = "local"  # palavras.txt + palavras adicionadas pelo botão "ADICIONAR AO DICIONÁRIO"
+CAMADAS_POR_MODO = {
+    'solo': (),
+    'multiplayer': (CAMADA_LOCAL,),
+}
+MIN_PALAVRAS_DICIONARIO = 1000  # Menos que isso no download = página de erro, não um dicionário
+MAX_PALAVRAS_REMENDO = 50000  # Diferenças maiores numa atualização recompilam a base em vez de remendar
+
 # NOVA OPÇÃO: verificar definição online ao sortear do pt_BR.dic
 VERIFICAR_DEFINICAO_ONLINE = True  # Pode ser alterado em configurações futuramente
 
+# Pausa na digitação da palavra secreta antes de consultar o autocompletar
+ATRASO_AUTOCOMPLETAR_MS = 120
+
+# Linhas da classificação exibidas na tela do torneio (a tabela completa pode ter centenas)
+MAX_CLASSIFICACAO_TORNEIO = 100
+
+# --- Perfil da inicialização (--profile-startup; ver perfil.py) ---
+ARQUIVO_PERFIL_INICIALIZACAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfil_inicializacao.json")
+INTERVALO_PERFIL_MS = 200
+PRAZO_PERFIL_S = 60  # Grava mesmo sem os sons (sem placa de som o banco nunca carrega)
+
+# --- Amostrador da thread principal (atalho escondido; ver perfil.Amostrador) ---
+ATALHO_AMOSTRADOR = '<Control-Shift-F12>'
+PADRAO_ARQUIVO_AMOSTRAS = "perfil_%Y%m%d-%H%M%S.folded"  # Na pasta do jogo, formato collapsed do flamegraph
+
+# Intervalo entre as leituras das mensagens do servidor no jogo em rede
+INTERVALO_REDE_MS = 30
+
+# ============================================================================
+# LISTAS FIXAS DE PALAVRAS (criadas uma vez por processo)
+# ============================================================================
+
+# Palavras comuns educativas do dia a dia (filtradas para conteúdo apropriado)
+PALAVRAS_COMUNS = frozenset({
+    # Objetos da casa
+    "casa", "carro", "livro", "mesa", "porta", "janela", "cama", "sopa", "pão", "água",
+    "café", "leite", "fruta", "carne", "peixe", "arroz", "feijão", "sal", "açúcar",
+    "copo", "prato", "garfo", "faca", "colher", "panela", "fogão", "geladeira",
+    "toalha", "sabão", "escova", "pasta", "papel", "caneta", "lápis", "borracha",
+    "mala", "mochila", "carteira", "chave", "lâmpada", "tela", "corda", "fita",
+
+    # Natureza e clima
+    "tempo", "sol", "lua", "estrela", "nuvem", "chuva", "vento", "frio", "quente",
+    "árvore", "flor", "grama", "terra", "pedra", "areia", "mar", "rio", "montanha",
+    "nuvem", "neve", "gelo", "fogo", "fumaça", "vapor", "poeira", "lama",
+
+    # Família e pessoas
+    "amigo", "família", "pai", "mãe", "filho", "filha", "irmão", "irmã", "tio", "tia",
+    "avô", "avó", "primo", "prima", "namorado", "namorada", "marido", "esposa",
+    "vizinho", "professor", "médico", "enfermeiro", "policial", "bombeiro",
+    "aluno", "estudante", "criança", "adulto", "idoso", "jovem", "senhor", "senhora",
+
+    # Lugares e locais
+    "escola", "trabalho", "cidade", "rua", "praça", "parque", "loja", "banco", "hospital",
+    "padaria", "farmácia", "posto", "mercado", "shopping", "cinema", "teatro", "museu",
+    "igreja", "templo", "estação", "aeroporto", "porto", "ponte", "túnel", "biblioteca",
+    "restaurante", "hotel", "pousada", "sala", "cozinha", "banheiro", "quarto", "escritório",
+
+    # Tecnologia e comunicação
+    "telefone", "computador", "televisão", "rádio", "jornal", "revista", "música", "filme",
+    "internet", "email", "mensagem", "foto", "câmera", "bateria", "carregador",
+    "tela", "teclado", "mouse", "impressora", "scanner", "tablet", "celular",
+
+    # Cores e características
+    "cor", "vermelho", "azul", "verde", "amarelo", "preto", "branco", "rosa", "roxo",
+    "laranja", "marrom", "cinza", "dourado", "prateado", "transparente", "colorido",
+    "claro", "escuro", "brilhante", "fosco", "liso", "áspero", "macio", "duro",
+
+    # Linguagem e comunicação
+    "número", "letra", "palavra", "frase", "texto", "história", "conto", "poema",
+    "nome", "sobrenome", "endereço", "telefone", "email", "senha", "código",
+    "língua", "idioma", "conversa", "pergunta", "resposta", "explicação",
+
+    # Atividades e esportes
+    "bola", "jogo", "brincar", "correr", "andar", "sentar", "dormir", "acordar",
+    "nadar", "pular", "dançar", "cantar", "pintar", "desenhar", "fotografar",
+    "futebol", "basquete", "vôlei", "tênis", "natação", "ciclismo", "caminhada",
+    "corrida", "saltar", "girar", "balançar", "escorregar", "subir", "descer",
+
+    # Ações do dia a dia
+    "comer", "beber", "lavar", "limpar", "cozinhar", "estudar", "ler", "escrever",
+    "pensar", "falar", "ouvir", "ver", "tocar", "cheirar", "provar", "sentir",
+    "trabalhar", "estudar", "aprender", "ensinar", "ajudar", "cuidar", "proteger",
+    "guardar", "procurar", "encontrar", "perder", "ganhar", "dar", "receber",
+
+    # Emoções e sentimentos
+    "feliz", "triste", "bravo", "calmo", "rápido", "lento", "grande", "pequeno",
+    "alegre", "sério", "nervoso", "tranquilo", "ansioso", "relaxado", "cansado",
+    "energético", "preguiçoso", "inteligente", "esperto", "bonito", "feio",
+    "amoroso", "carinhoso", "gentil", "educado", "respeitoso", "honesto",
+
+    # Espaço e posição
+    "alto", "baixo", "longe", "perto", "dentro", "fora", "cima", "baixo",
+    "esquerda", "direita", "frente", "trás", "centro", "lado", "meio",
+    "largo", "estreito", "curto", "comprido", "redondo", "quadrado", "triangular",
+
+    # Tempo e datas
+    "manhã", "tarde", "noite", "hoje", "ontem", "amanhã", "semana", "mês", "ano",
+    "verão", "inverno", "primavera", "outono", "segunda", "terça", "quarta", "quinta", "sexta", "sábado", "domingo",
+    "janeiro", "fevereiro", "março", "abril", "maio", "junho", "julho", "agosto", "setembro", "outubro", "novembro", "dezembro",
+
+    # Alimentos e bebidas
+    "banana", "maçã", "laranja", "uva", "morango", "abacaxi", "manga", "pera",
+    "batata", "cenoura", "tomate", "cebola", "alho", "pimenta", "azeite",
+    "suco", "refrigerante", "chocolate", "bolo", "biscoito", "sorvete", "pizza",
+    "queijo", "manteiga", "mel", "limão", "abacate", "kiwi", "framboesa",
+
+    # Animais
+    "cachorro", "gato", "cavalo", "vaca", "porco", "galinha", "pato", "pássaro",
+    "peixe", "abelha", "formiga", "borboleta", "mosca", "mosquito", "aranha",
+    "coelho", "ovelha", "cabra", "porco", "pato", "ganso", "pombo", "coruja",
+
+    # Roupas e acessórios
+    "camisa", "calça", "vestido", "saia", "sapato", "tênis", "sandália", "meia",
+    "boné", "chapéu", "óculos", "relógio", "anel", "colar", "pulseira", "cinto",
+    "casaco", "blusa", "short", "bermuda", "jaqueta", "suéter", "cachecol",
+
+    # Transporte
+    "ônibus", "trem", "avião", "barco", "bicicleta", "moto", "caminhão", "táxi",
+    "metrô", "tram", "helicóptero", "navio", "lancha", "canoa", "patinete",
+    "carroça", "trator", "ambulância", "carro", "van", "furgão", "carreta"
+})
+
+# Lista de palavras difíceis para o modo difícil
+PALAVRAS_DIFICEIS = frozenset({
+    # Palavras complexas e menos comuns
+    "abduzir", "acrimônia", "adstrito", "alarido", "alcunha", "âmago", "ardiloso", "arroubo", "atoleimado",
+    "beneplácito", "cacofonia", "candente", "cáustico", "cizânia", "concomitante", "consubstanciar", "contumaz",
+    "deleter", "desídia", "dilapidar", "dissonância", "efêmero", "elucubrar", "empírico", "enclausurar",
+    "escrúpulo", "estulto", "eufemismo", "exíguo", "fúlgido", "galvanizar", "hegemonizar", "hermético",
+    "idílico", "impertérrito", "incólume", "indolente", "inefável", "inócuo", "insólito", "intrínseco",
+    "lacônico", "lúgubre", "magnânimo", "mendaz", "mísero", "nefando", "obstinado", "oprobrio",
+    "perfunctório", "pernicioso", "pertinaz", "pífio", "precário", "probo", "pródigo", "prudente",
+    "quimérico", "rebuscado", "recíproco", "redentor", "refinado", "relutante", "remoto", "resiliente",
+    "sagaz", "sórdido", "sucinto", "sutil", "tenaz", "tímido", "tranquilo", "ubíquo",
+    "vacilante", "veraz", "verossímil", "vigoroso", "virtuoso", "volátil", "voraz", "zeloso"
+})
+
+# Lista de palavras inadequadas para filtrar
+PALAVRAS_INADEQUADAS = frozenset({
+    # Palavrões e termos ofensivos
+    "porra", "caralho", "puta", "merda", "foda", "cacete", "buceta", "pau", "pinto",
+    "carai", "porcaria", "bosta", "merdoso", "fodido", "puto", "caralhudo",
+
+    # Termos sexuais inadequados
+    "sexo", "pênis", "vagina", "pornô", "porno", "erótico", "sexual", "intimo",
+    "nudez", "pelado", "nu", "nua", "transar", "foder", "meter", "comer",
+
+    # Termos violentos ou inadequados
+    "morte", "matar", "assassinar", "sangue", "violência", "briga", "luta",
+    "droga", "cigarro", "álcool", "bebida", "embriagado", "drogado",
+
+    # Outros termos inadequados
+    "idiota", "imbecil", "estúpido", "burro", "retardado", "deficiente"
+})
+
 # ============================================================================
 # REGRAS DE DIFICULDADE CENTRALIZADAS
 # =========================================================================
+# No solo o sorteio usa a pontuação de dificuldade do dicionário compilado
+# (dicionario.py); min/max valem para palavras digitadas e quando não há índice.
 REGRAS_DIFICULDADE = {
-    "Fácil":    {"min": 4, "max": 5,  "descricao": "Palavras de 4 ou 5 letras"},
-    "Médio":    {"min": 6, "max": 7,  "descricao": "Palavras de 6 ou 7 letras"},
-    "Difícil":  {"min": 8, "max": 20, "descricao": "Palavras de 8 ou mais letras"},
+    "Fácil":    {"min": 4, "max": 5,  "descricao": "Palavras curtas, com letras comuns"},
+    "Médio":    {"min": 6, "max": 7,  "descricao": "Palavras médias ou com letras menos comuns"},
+    "Difícil":  {"min": 8, "max": 20, "descricao": "Palavras longas, acentuadas, com letras raras ou muitos anagramas"},
 }
 
+# ============================================================================
+# MODELO DA TELA DE ADIVINHAÇÃO (ATUALIZAÇÃO EM LOTE)
+# =========================================================================
+
+_SEM_VALOR = object()  # Marca campos ainda não pintados
+
+class ModeloInterfaceAdivinhacao:
+    """Guarda o estado exibido na tela de adivinhação e só repinta o que mudou.
+
+    Os handlers de teclado e o timer apenas registram valores com definir();
+    os widgets são reconfigurados uma única vez por quadro, via after_idle.
+    """
+
+    INTERVALO_QUADRO_MS = 16  # ~60 quadros por segundo
+
+    def __init__(self, root):
+        self.root = root
+        self.campos = {}      # campo -> (widget, função que gera as opções do config)
+        self.exibido = {}     # último valor efetivamente pintado
+        self.pendente = {}    # valores registrados desde a última pintura
+        self.descarga_id = None
+        self.ultima_descarga = 0.0
+
+    def reiniciar(self):
+        """Esquece widgets e valores (chamado quando a tela é recriada)"""
+        if self.descarga_id:
+            self.root.after_cancel(self.descarga_id)
+            self.descarga_id = None
+        self.campos.clear()
+        self.exibido.clear()
+        self.pendente.clear()
+
+    def vincular(self, campo, widget, formatar):
+        self.campos[campo] = (widget, formatar)
+        self.exibido.pop(campo, None)
+
+    def definir(self, campo, valor):
+        if campo not in self.campos:
+            return
+        if campo not in self.pendente and self.exibido.get(campo, _SEM_VALOR) == valor:
+            return
+        self.pendente[campo] = valor
+        self._agendar_descarga()
+
+    def _agendar_descarga(self):
+        if self.descarga_id:
+            return
+        decorrido_ms = (time.perf_counter() - self.ultima_descarga) * 1000
+        if decorrido_ms >= self.INTERVALO_QUADRO_MS:
+            self.descarga_id = self.root.after_idle(self.descarregar)
+        else:
+            # Rajadas de auto-repetição: no máximo uma pintura por quadro
+            self.descarga_id = self.root.after(int(self.INTERVALO_QUADRO_MS - decorrido_ms) + 1, self.descarregar)
+
+    def descarregar(self):
+        """Aplica nos widgets apenas os campos cujo valor mudou"""
+        self.descarga_id = None
+        self.ultima_descarga = time.perf_counter()
+        pendente, self.pendente = self.pendente, {}
+        for campo, valor in pendente.items():
+            if self.exibido.get(campo, _SEM_VALOR) == valor:
+                continue
+            widget, formatar = self.campos[campo]
+            try:
+                widget.config(**formatar(valor))
+            except tk.TclError:
+                # Widget destruído entre o registro e a pintura (troca de tela)
+                continue
+            self.exibido[campo] = valor
+
+class AudioDesligado:
+    """Substitui o GerenciadorAudio enquanto o mixer não foi iniciado (ou se ele falhar)"""
+
+    def tocar(self, nome, loops=0):
+        return False
+
+    def parar(self, classe):
+        pass
+
+    def tocando(self, classe):
+        return False
+
+    def estatisticas(self):
+        return {}
+
+    def encerrar(self):
+        pass
+
 # ============================================================================
 # CLASSE PRINCIPAL DO JOGO
 # =========================================================================
@@ -180,11 +440,14 @@ class GameApp:
         self.root.config(bg=COR_FUNDO_PRINCIPAL)
         
         # Inicializa o sistema de configurações
-        self.config = ConfiguracoesUsuario()
+        with perfil.trecho("ConfiguracoesUsuario"):
+            self.config = ConfiguracoesUsuario()
 
         # Sempre fullscreen
         self.root.attributes('-fullscreen', True)
         self.root.bind('<Escape>', self.mostrar_opcoes_esc)
+        self.root.bind(ATALHO_AMOSTRADOR, self.alternar_amostrador)  # Escondido: perfil da interface travando
+        self.amostrador = None
 
         self.centralizar_janela(self.root)
 
@@ -192,33 +455,29 @@ class GameApp:
         # INICIALIZAÇÃO DAS VARIÁVEIS DE ESTADO
         # ============================================================================
         
-        # --- Estado do Jogo Atual ---
-        self.palavra_secreta = ""
+        # --- Estado do Jogo Atual (regras no motor; a interface só exibe) ---
+        self.partida = Partida()
+        self.rodada = None
         self.letras_embaralhadas = ""
         self.palavra_adivinhada_entries = []
         self.entry_vars_adivinhacao = []
-        self.erros_rodada_atual = 0
-        self.letras_ja_tentadas_exibicao = set()
-        self.letras_erradas_exibicao = set()
-        self.letras_erradas_desde_ultimo_acerto = set()  # NOVO: letras erradas desde o último acerto
-        self.indice_atual = 0
-        self.partida_desistida = False
+
+        # --- Gravação e reprodução das rodadas (gravacao.py) ---
+        self.gravador = None  # Criado na primeira rodada, se "gravar_rodadas" estiver ativo
+        self.semente_embaralhamento = 0
+        self.reproducao = None  # Gravação sendo reproduzida na tela
 
         # --- Controle de Tempo ---
-        self.tempo_inicio_rodada = 0
         self.timer_id = None
-        self.tempo_total_jogador_atual = 0.0
-        self.tempo_penalidade_acumulada = 0.0
+        self.autocompletar_id = None  # Consulta ao dicionário adiada enquanto o definidor digita
 
         # --- Sistema de Jogadores ---
-        self.jogadores = []
-        self.jogador_atual_idx = 0
-        self.jogador_definidor_idx = 0
         self.num_jogadores_total = 0
         self.entry_nomes_jogadores = []
 
         # --- Interface ---
         self.botoes_letras_embaralhadas = []
+        self.modelo_interface = ModeloInterfaceAdivinhacao(root)
 
         # --- Variáveis Tkinter ---
         self.dificuldade_selecionada = tk.StringVar(root)
@@ -242,169 +501,66 @@ class GameApp:
         self.URL_DICIONARIO_COMUM = URL_DICIONARIO_COMUM
         self.ARQUIVO_LOCAL_DICIONARIO = ARQUIVO_DICIONARIO
         
-        # Palavras comuns educativas do dia a dia (filtradas para conteúdo apropriado)
-        self.PALAVRAS_COMUNS = {
-            # Objetos da casa
-            "casa", "carro", "livro", "mesa", "porta", "janela", "cama", "sopa", "pão", "água",
-            "café", "leite", "fruta", "carne", "peixe", "arroz", "feijão", "sal", "açúcar",
-            "copo", "prato", "garfo", "faca", "colher", "panela", "fogão", "geladeira",
-            "toalha", "sabão", "escova", "pasta", "papel", "caneta", "lápis", "borracha",
-            "mala", "mochila", "carteira", "chave", "lâmpada", "tela", "corda", "fita",
-            
-            # Natureza e clima
-            "tempo", "sol", "lua", "estrela", "nuvem", "chuva", "vento", "frio", "quente",
-            "árvore", "flor", "grama", "terra", "pedra", "areia", "mar", "rio", "montanha",
-            "nuvem", "neve", "gelo", "fogo", "fumaça", "vapor", "poeira", "lama",
-            
-            # Família e pessoas
-            "amigo", "família", "pai", "mãe", "filho", "filha", "irmão", "irmã", "tio", "tia",
-            "avô", "avó", "primo", "prima", "namorado", "namorada", "marido", "esposa",
-            "vizinho", "professor", "médico", "enfermeiro", "policial", "bombeiro",
-            "aluno", "estudante", "criança", "adulto", "idoso", "jovem", "senhor", "senhora",
-            
-            # Lugares e locais
-            "escola", "trabalho", "cidade", "rua", "praça", "parque", "loja", "banco", "hospital",
-            "padaria", "farmácia", "posto", "mercado", "shopping", "cinema", "teatro", "museu",
-            "igreja", "templo", "estação", "aeroporto", "porto", "ponte", "túnel", "biblioteca",
-            "restaurante", "hotel", "pousada", "sala", "cozinha", "banheiro", "quarto", "escritório",
-            
-            # Tecnologia e comunicação
-            "telefone", "computador", "televisão", "rádio", "jornal", "revista", "música", "filme",
-            "internet", "email", "mensagem", "foto", "câmera", "bateria", "carregador",
-            "tela", "teclado", "mouse", "impressora", "scanner", "tablet", "celular",
-            
-            # Cores e características
-            "cor", "vermelho", "azul", "verde", "amarelo", "preto", "branco", "rosa", "roxo",
-            "laranja", "marrom", "cinza", "dourado", "prateado", "transparente", "colorido",
-            "claro", "escuro", "brilhante", "fosco", "liso", "áspero", "macio", "duro",
-            
-            # Linguagem e comunicação
-            "número", "letra", "palavra", "frase", "texto", "história", "conto", "poema",
-            "nome", "sobrenome", "endereço", "telefone", "email", "senha", "código",
-            "língua", "idioma", "conversa", "pergunta", "resposta", "explicação",
-            
-            # Atividades e esportes
-            "bola", "jogo", "brincar", "correr", "andar", "sentar", "dormir", "acordar",
-            "nadar", "pular", "dançar", "cantar", "pintar", "desenhar", "fotografar",
-            "futebol", "basquete", "vôlei", "tênis", "natação", "ciclismo", "caminhada",
-            "corrida", "saltar", "girar", "balançar", "escorregar", "subir", "descer",
-            
-            # Ações do dia a dia
-            "comer", "beber", "lavar", "limpar", "cozinhar", "estudar", "ler", "escrever",
-            "pensar", "falar", "ouvir", "ver", "tocar", "cheirar", "provar", "sentir",
-            "trabalhar", "estudar", "aprender", "ensinar", "ajudar", "cuidar", "proteger",
-            "guardar", "procurar", "encontrar", "perder", "ganhar", "dar", "receber",
-            
-            # Emoções e sentimentos
-            "feliz", "triste", "bravo", "calmo", "rápido", "lento", "grande", "pequeno",
-            "alegre", "sério", "nervoso", "tranquilo", "ansioso", "relaxado", "cansado",
-            "energético", "preguiçoso", "inteligente", "esperto", "bonito", "feio",
-            "amoroso", "carinhoso", "gentil", "educado", "respeitoso", "honesto",
-            
-            # Espaço e posição
-            "alto", "baixo", "longe", "perto", "dentro", "fora", "cima", "baixo",
-            "esquerda", "direita", "frente", "trás", "centro", "lado", "meio",
-            "largo", "estreito", "curto", "comprido", "redondo", "quadrado", "triangular",
-            
-            # Tempo e datas
-            "manhã", "tarde", "noite", "hoje", "ontem", "amanhã", "semana", "mês", "ano",
-            "verão", "inverno", "primavera", "outono", "segunda", "terça", "quarta", "quinta", "sexta", "sábado", "domingo",
-            "janeiro", "fevereiro", "março", "abril", "maio", "junho", "julho", "agosto", "setembro", "outubro", "novembro", "dezembro",
-            
-            # Alimentos e bebidas
-            "banana", "maçã", "laranja", "uva", "morango", "abacaxi", "manga", "pera",
-            "batata", "cenoura", "tomate", "cebola", "alho", "pimenta", "azeite",
-            "suco", "refrigerante", "chocolate", "bolo", "biscoito", "sorvete", "pizza",
-            "queijo", "manteiga", "mel", "limão", "abacate", "kiwi", "framboesa",
-            
-            # Animais
-            "cachorro", "gato", "cavalo", "vaca", "porco", "galinha", "pato", "pássaro",
-            "peixe", "abelha", "formiga", "borboleta", "mosca", "mosquito", "aranha",
-            "coelho", "ovelha", "cabra", "porco", "pato", "ganso", "pombo", "coruja",
-            
-            # Roupas e acessórios
-            "camisa", "calça", "vestido", "saia", "sapato", "tênis", "sandália", "meia",
-            "boné", "chapéu", "óculos", "relógio", "anel", "colar", "pulseira", "cinto",
-            "casaco", "blusa", "short", "bermuda", "jaqueta", "suéter", "cachecol",
-            
-            # Transporte
-            "ônibus", "trem", "avião", "barco", "bicicleta", "moto", "caminhão", "táxi",
-            "metrô", "tram", "helicóptero", "navio", "lancha", "canoa", "patinete",
-            "carroça", "trator", "ambulância", "carro", "van", "furgão", "carreta"
-        }
-
-        # Lista de palavras difíceis para o modo difícil
-        self.PALAVRAS_DIFICEIS = {
-            # Palavras complexas e menos comuns
-            "abduzir", "acrimônia", "adstrito", "alarido", "alcunha", "âmago", "ardiloso", "arroubo", "atoleimado",
-            "beneplácito", "cacofonia", "candente", "cáustico", "cizânia", "concomitante", "consubstanciar", "contumaz",
-            "deleter", "desídia", "dilapidar", "dissonância", "efêmero", "elucubrar", "empírico", "enclausurar",
-            "escrúpulo", "estulto", "eufemismo", "exíguo", "fúlgido", "galvanizar", "hegemonizar", "hermético",
-            "idílico", "impertérrito", "incólume", "indolente", "inefável", "inócuo", "insólito", "intrínseco",
-            "lacônico", "lúgubre", "magnânimo", "mendaz", "mísero", "nefando", "obstinado", "oprobrio",
-            "perfunctório", "pernicioso", "pertinaz", "pífio", "precário", "probo", "pródigo", "prudente",
-            "quimérico", "rebuscado", "recíproco", "redentor", "refinado", "relutante", "remoto", "resiliente",
-            "sagaz", "sórdido", "sucinto", "sutil", "tenaz", "tímido", "tranquilo", "ubíquo",
-            "vacilante", "veraz", "verossímil", "vigoroso", "virtuoso", "volátil", "voraz", "zeloso"
-        }
-
-        # Lista de palavras inadequadas para filtrar
-        self.PALAVRAS_INADEQUADAS = {
-            # Palavrões e termos ofensivos
-            "porra", "caralho", "puta", "merda", "foda", "cacete", "buceta", "pau", "pinto",
-            "carai", "porcaria", "bosta", "merdoso", "fodido", "puto", "caralhudo",
-            
-            # Termos sexuais inadequados
-            "sexo", "pênis", "vagina", "pornô", "porno", "erótico", "sexual", "intimo",
-            "nudez", "pelado", "nu", "nua", "transar", "foder", "meter", "comer",
-            
-            # Termos violentos ou inadequados
-            "morte", "matar", "assassinar", "sangue", "violência", "briga", "luta",
-            "droga", "cigarro", "álcool", "bebida", "embriagado", "drogado",
-            
-            # Outros termos inadequados
-            "idiota", "imbecil", "estúpido", "burro", "retardado", "deficiente"
-        }
-
-        # Variáveis para Sons
-        self.som_acerto = None
-        self.som_erro = None
-        self.som_vitoria_palavra = None
-        self.musica_menu = None
-        self.som_teclado = None
-        self.som_fim_jogo = None
-        self.som_iniciar_rodada = None
-
-        # --- Inicialização do Pygame Mixer ---
-        try:
-            pygame.mixer.init()
-            logging.info("Pygame mixer inicializado com sucesso.")
-        except Exception as e:
-            logging.error(f"Erro ao inicializar Pygame mixer: {e}")
-            messagebox.showerror("Erro Crítico", f"Não foi possível inicializar o módulo de áudio (Pygame Mixer).\nO jogo pode não funcionar corretamente. Erro: {e}")
-            sys.exit(1)
+        # Áudio: pygame e mixer só são iniciados depois da primeira tela (ver _iniciar_audio)
+        self.banco_sons = None
+        self.banco_sons_pendente = None  # Banco com volume novo ainda carregando (ver trocar_volume_dos_sons)
+        self.audio = AudioDesligado()
 
         # Inicializa o objeto style aqui, tornando-o um atributo da instância
         self.style = ttk.Style()
-        self.aplicar_estilos_ttk()
+        with perfil.trecho("aplicar_estilos_ttk"):
+            self.aplicar_estilos_ttk()
         self.root.protocol("WM_DELETE_WINDOW", self.confirmar_saida)
 
-        # Carrega o dicionário e o ranking antes de carregar os sons
-        self.carregar_dicionario()
-        self.carregar_ranking()
-        self.carregar_sons() # Carrega os sons na inicialização do jogo
-        
-        # Cria os frames iniciais uma única vez na inicialização
-        self._criar_frames_iniciais() 
-        self.iniciar_selecao_modo() # Sempre inicia na tela de seleção de modo
-
-        # Persistência de palavras já sorteadas
+        # Dicionário, ranking e palavras usadas são carregados logo após a primeira tela
+        self.dicionario_pronto = threading.Event()
+        self.acoes_aguardando_dicionario = {}  # Ações (em ordem) adiadas até o dicionário carregar
+        self.dicionario_palavras_sem_acento = set()
+        self.indice_dificuldade = None  # Pontuação de dificuldade por palavra (dicionario.py)
+        self.comuns_por_nivel = {}  # nível -> PALAVRAS_COMUNS desse nível (ver _agrupar_comuns_por_nivel)
+        self.camadas_do_modo = ()
+        self.trava_camadas = threading.Lock()  # Troca de modo (Tk) x fim do carregamento (thread)
         self.arquivo_palavras_usadas = "palavras_usadas.json"
-        self.palavras_usadas = self.carregar_palavras_usadas()
-        # Persistência de palavras usadas no multiplayer
+        self.palavras_usadas = {"Fácil": [], "Médio": [], "Difícil": []}
         self.arquivo_palavras_multiplayer = "palavras_multiplayer.json"
-        self.palavras_multiplayer = self.carregar_palavras_multiplayer()
-        self.ordem_palavra_multiplayer = self.palavras_multiplayer.get("__ordem__", 0)
+        self.palavras_multiplayer = {}
+        self.ordem_palavra_multiplayer = 0
+
+        # --- Jogo em Rede (cliente fino; ver rede.py e servidor.py) ---
+        self.cliente_rede = None
+        self.nome_rede = ""
+        self.estado_espectador = None  # Estado da sala montado a partir dos deltas, só ao assistir
+
+        # --- Torneio (chaveamento e classificação em torneio.py) ---
+        self.torneio = None
+        self.confronto_torneio = None  # Duelo do torneio sendo jogado agora
+
+        # Cria os frames iniciais uma única vez na inicialização
+        with perfil.trecho("_criar_frames_iniciais"):
+            self._criar_frames_iniciais()
+        with perfil.trecho("iniciar_selecao_modo"):
+            self.iniciar_selecao_modo() # Sempre inicia na tela de seleção de modo
+        self.root.after_idle(self._inicializacao_adiada)
+
+    # ============================================================================
+    # ESTADO DA PARTIDA (LEITURA DO MOTOR)
+    # ============================================================================
+
+    jogadores = property(lambda self: self.partida.jogadores)
+    jogador_atual_idx = property(lambda self: self.partida.atual_idx)
+    jogador_definidor_idx = property(lambda self: self.partida.definidor_idx)
+    palavra_secreta = property(lambda self: self.rodada.palavra if self.rodada else "")
+    indice_atual = property(lambda self: self.rodada.indice if self.rodada else 0)
+    erros_rodada_atual = property(lambda self: self.rodada.erros if self.rodada else 0)
+    partida_desistida = property(lambda self: self.rodada is not None and self.rodada.status == STATUS_DESISTIU)
+
+    def nova_partida(self, nomes=()):
+        # Relógio monotônico: acertar a hora do sistema no meio da rodada não muda o tempo (e ele
+        # bate com o da gravação da rodada, que o verificar_ranking.py confere)
+        self.partida = Partida(nomes, self.modo_jogo_selecionado.get() or 'solo',
+                               penalidade_erro=self.config.obter_config("jogo", "penalidade_erro", 3.0),
+                               relogio=time.perf_counter)
+        self.rodada = None
 
     # ============================================================================
     # MÉTODOS DE CONFIGURAÇÃO E INICIALIZAÇÃO
@@ -515,189 +671,295 @@ class GameApp:
             ]})
         ])
 
-    def encontrar_arquivo_som(self, nome_arquivo):
-        """Procura um arquivo de som em diferentes locais possíveis"""
-        # Lista de possíveis locais para os arquivos de som
-        possiveis_caminhos = [
-            nome_arquivo,  # Arquivo na mesma pasta do jogo
-            f"sons/{nome_arquivo}",  # Pasta sons
-            f"../sons/{nome_arquivo}",  # Pasta sons um nível acima
-            f"../../sons/{nome_arquivo}",  # Pasta sons dois níveis acima
-        ]
-        
-        for caminho in possiveis_caminhos:
-            if os.path.exists(caminho):
-                return caminho
-        
-        return None
+    def executar_em_segundo_plano(self, tarefa, ao_concluir=None, intervalo_ms=50):
+        """Roda tarefa() numa thread e chama ao_concluir(resultado, erro) de volta na thread do Tk"""
+        estado = {}
 
-    def carregar_sons(self):
-        """Carrega todos os arquivos de som de forma otimizada"""
-        # Lista de arquivos de som necessários com prioridades
-        arquivos_som = {
-            'acerto_letra.wav': 'som_acerto',
-            'erro_letra.wav': 'som_erro', 
-            'vitoria_palavra.wav': 'som_vitoria_palavra',
-            'musica_menu.wav': 'musica_menu',
-            'teclado.wav': 'som_teclado',
-            'fim_jogo.wav': 'som_fim_jogo',
-            'iniciar_rodada.wav': 'som_iniciar_rodada'
-        }
-        
-        sons_carregados = 0
-        total_sons = len(arquivos_som)
-        
-        # Cache de volumes para otimização
+        def rodar():
+            try:
+                estado['resultado'] = tarefa()
+            except Exception as e:
+                estado['erro'] = e
+
+        thread = threading.Thread(target=rodar, daemon=True)
+        thread.start()
+
+        def verificar():
+            if thread.is_alive():
+                self.root.after(intervalo_ms, verificar)
+            elif ao_concluir:
+                ao_concluir(estado.get('resultado'), estado.get('erro'))
+        self.root.after(intervalo_ms, verificar)
+        return thread
+
+    def _inicializacao_adiada(self):
+        """Tudo o que não é necessário para a primeira tela aparecer"""
+        self._registrar_primeira_pintura()
+        self._iniciar_audio()
+        self.carregar_dicionario_em_segundo_plano()
+        with perfil.trecho("carregar_ranking"):
+            self.carregar_ranking()
+        self.palavras_usadas = self.carregar_palavras_usadas()
+        self.palavras_multiplayer = self.carregar_palavras_multiplayer()
+        self.ordem_palavra_multiplayer = self.palavras_multiplayer.get("__ordem__", 0)
+        if perfil.rastro is not None:
+            self.root.after(INTERVALO_PERFIL_MS, self._gravar_perfil_inicializacao, time.perf_counter() + PRAZO_PERFIL_S)
+
+    def _gravar_perfil_inicializacao(self, prazo):
+        """Grava o rastro do --profile-startup quando o dicionário e os sons terminarem (ou no prazo)"""
+        sons_prontos = self.banco_sons is not None and self.banco_sons.concluido.is_set()
+        if not (self.dicionario_pronto.is_set() and sons_prontos) and time.perf_counter() < prazo:
+            self.root.after(INTERVALO_PERFIL_MS, self._gravar_perfil_inicializacao, prazo)
+            return
+        perfil.encerrar()
+
+    def _registrar_primeira_pintura(self):
+        self.root.update_idletasks()
+        perfil.marco("primeira pintura")
+        tempo_ms = (time.perf_counter() - INICIO_PROCESSO) * 1000
+        logging.info(f"Primeira tela exibida em {tempo_ms:.1f} ms.")
+
+    def _iniciar_audio(self):
+        """Importa o pygame e inicializa o mixer numa thread, sem atrasar a primeira tela"""
         volume_efeitos = self.config.obter_config("audio", "volume_efeitos")
         volume_musica = self.config.obter_config("audio", "volume_musica")
-        
-        try:
-            # Carregamento otimizado com tratamento de erro individual
-            for nome_arquivo, atributo in arquivos_som.items():
-                try:
-                    caminho_arquivo = self.encontrar_arquivo_som(nome_arquivo)
-                    
-                    if caminho_arquivo:
-                        som = pygame.mixer.Sound(caminho_arquivo)
-                        setattr(self, atributo, som)
-                        sons_carregados += 1
-                        logging.info(f"Som carregado: {caminho_arquivo}")
-                        
-                        # Aplica volume imediatamente para evitar recálculos
-                        if atributo in ['som_acerto', 'som_erro', 'som_vitoria_palavra', 'som_fim_jogo', 'som_iniciar_rodada']:
-                            som.set_volume(volume_efeitos)
-                        elif atributo == 'musica_menu':
-                            som.set_volume(volume_musica)
-                        elif atributo == 'som_teclado':
-                            som.set_volume(volume_efeitos * 0.4)  # Volume menor para teclado
-                    else:
-                        setattr(self, atributo, None)
-                        logging.warning(f"Arquivo de som não encontrado: {nome_arquivo}")
-                        
-                except Exception as e:
-                    logging.warning(f"Erro ao carregar {nome_arquivo}: {e}")
-                    setattr(self, atributo, None)
-
-            # Feedback otimizado baseado no resultado
-            if sons_carregados == total_sons:
-                logging.info("Todos os sons carregados com sucesso.")
-            elif sons_carregados > 0:
-                logging.info(f"{sons_carregados}/{total_sons} sons carregados com sucesso.")
-                if sons_carregados >= 3:  # Se carregou pelo menos os sons essenciais
-                    logging.info("Sons essenciais carregados. Jogo funcionará normalmente.")
-                else:
-                    messagebox.showinfo("Sons Parciais", f"Carregados {sons_carregados}/{total_sons} arquivos de som.\nO jogo funcionará normalmente.")
-            else:
-                logging.warning("Nenhum arquivo de som encontrado.")
-                messagebox.showwarning("Sons Ausentes", "Nenhum arquivo de som foi encontrado.\nO jogo funcionará sem sons.")
-                
-        except pygame.error as e:
-            messagebox.showwarning("Erro de Áudio", f"Erro ao carregar sons: {e}\nO jogo continuará sem eles.")
-            logging.warning(f"Erro ao carregar sons: {e}")
-            # Inicializa todos como None em caso de erro
-            for atributo in arquivos_som.values():
-                setattr(self, atributo, None)
+        canais_teclado = self.config.obter_config("audio", "canais_teclado")
+        buffer_mixer = self.config.obter_config("audio", "buffer_mixer")
+
+        def iniciar():
+            from audio import BancoSons, GerenciadorAudio
+            banco = BancoSons(volume_efeitos, volume_musica)
+            audio = GerenciadorAudio(banco, canais_por_classe={'teclado': canais_teclado})
+            with perfil.trecho("pygame.mixer.init"):
+                audio.inicializar_mixer(buffer=buffer_mixer)
+            return audio
+
+        def ao_iniciar(audio, erro):
+            if erro:
+                logging.error(f"Erro ao inicializar Pygame mixer: {erro}")
+                messagebox.showerror("Erro Crítico", f"Não foi possível inicializar o módulo de áudio (Pygame Mixer).\nO jogo continuará sem sons. Erro: {erro}")
+                return
+            logging.info("Pygame mixer inicializado com sucesso.")
+            # Volumes alterados nas configurações enquanto o mixer iniciava valem para o banco novo
+            audio.banco.volume_efeitos = self.config.obter_config("audio", "volume_efeitos")
+            audio.banco.volume_musica = self.config.obter_config("audio", "volume_musica")
+            self.banco_sons = audio.banco
+            self.audio = audio
+            self.carregar_sons()
+            # A música do menu começa quando o banco terminar de carregar
+            self.executar_em_segundo_plano(self.banco_sons.concluido.wait, lambda *_: self.tocar_musica_menu())
+
+        self.executar_em_segundo_plano(iniciar, ao_iniciar)
+
+    def carregar_sons(self):
+        """Dispara o carregamento dos sons numa thread; cada som fica tocável assim que é decodificado"""
+        if self.banco_sons is None:
+            return
+        self.banco_sons.carregar_em_segundo_plano()
+        logging.info("Carregamento dos sons iniciado em segundo plano.")
+
+    def trocar_volume_dos_sons(self, volume_efeitos, volume_musica):
+        """Carrega um banco novo com o volume novo e só o põe no lugar do atual quando terminar.
+
+        O volume fica gravado nos buffers, então mudá-lo é recarregar os sons;
+        num banco novo, o carregador do atual (que pode estar no meio) não
+        disputa os mesmos sons, e o atual segue tocando até a troca.
+        """
+        if self.banco_sons is None:
+            return
+        from audio import BancoSons
+        banco = BancoSons(volume_efeitos, volume_musica, self.banco_sons.pasta_base)
+        self.banco_sons_pendente = banco
+
+        def trocar(*_):
+            if self.banco_sons_pendente is not banco:
+                return  # Outra mudança de volume veio depois desta
+            self.banco_sons_pendente = None
+            self.banco_sons = banco
+            self.audio.banco = banco
+            logging.info(f"Sons recarregados com volume de efeitos {volume_efeitos} e de música {volume_musica}.")
+
+        banco.carregar_em_segundo_plano()
+        self.executar_em_segundo_plano(banco.concluido.wait, trocar)
+
+    def _som(self, nome):
+        return self.banco_sons.obter(nome) if self.banco_sons else None
+
+    # Os sons são lidos do banco; ficam None até o respectivo arquivo terminar de carregar
+    som_acerto = property(lambda self: self._som('som_acerto'))
+    som_erro = property(lambda self: self._som('som_erro'))
+    som_vitoria_palavra = property(lambda self: self._som('som_vitoria_palavra'))
+    musica_menu = property(lambda self: self._som('musica_menu'))
+    som_teclado = property(lambda self: self._som('som_teclado'))
+    som_fim_jogo = property(lambda self: self._som('som_fim_jogo'))
+    som_iniciar_rodada = property(lambda self: self._som('som_iniciar_rodada'))
+
+    def tocar_musica_menu(self):
+        if not (hasattr(self, 'frame_selecao_modo') and self.frame_selecao_modo.winfo_ismapped()):
+            return
+        if self.musica_menu and self.config.obter_config("audio", "musica_ativada", True) and not self.audio.tocando('musica'):
+            self.audio.tocar('musica_menu', loops=-1)
+            logging.info("Música do menu iniciada.")
 
     # ============================================================================
     # MÉTODOS DE ÁUDIO
     # ============================================================================
 
-    def baixar_dicionario(self):
-        logging.info(f"Tentando baixar dicionário de: {self.URL_DICIONARIO_ONLINE}")
-        try:
-            response = requests.get(self.URL_DICIONARIO_ONLINE, timeout=10)
-            response.raise_for_status()
+    def baixar_dicionario(self, ao_progredir=None, ao_concluir=None, intervalo_ms=200):
+        """Baixa ou atualiza o pt_BR.dic em segundo plano (em pedaços, retomável, verificado).
 
-            with open(self.ARQUIVO_LOCAL_DICIONARIO, "wb") as f:
-                f.write(response.content)
-            messagebox.showinfo("DOWNLOAD CONCLUÍDO", "DICIONÁRIO DE PALAVRAS BAIXADO COM SUCESSO!")
-            logging.info("Dicionário baixado com sucesso.")
-            return True
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Erro ao baixar dicionário: {e}", exc_info=True)
-            messagebox.showwarning("ERRO DE CONEXÃO",
-                                   f"NÃO FOI POSSÍVEL BAIXAR o DICIONÁRIO ONLINE. "
-                                   "Verifique sua conexão com a internet.\n"
-                                   f"Detalhes do erro: {e}")
-            return False
-        except Exception as e:
-            logging.error(f"Erro inesperado no download do dicionário: {e}", exc_info=True)
-            messagebox.showerror("ERRO NO DOWNLOAD",
-                                 f"Ocorreu um erro inesperado ao baixar o dicionário: {e}")
-            return False
+        Com uma cópia local, o pedido é condicional: se o arquivo não mudou no
+        servidor (304) nada é baixado. Se mudou, só a diferença de palavras é
+        aplicada ao índice carregado (remendo), sem recompilar a base.
+        ao_progredir(baixados, total) e ao_concluir(erro, mensagem) são chamados na thread do Tk.
+        """
+        import download
+        import dicionario
+        logging.info(f"Verificando dicionário em: {self.URL_DICIONARIO_ONLINE}")
+        progresso = {'baixados': 0, 'total': None}
+        diferenca = {}
+
+        def validar(caminho):
+            novas = dicionario.ler_palavras(caminho)
+            if len(novas) < MIN_PALAVRAS_DICIONARIO:
+                raise download.ErroDownload(f"O arquivo baixado tem só {len(novas)} palavras válidas.")
+            if os.path.exists(ARQUIVO_DICIONARIO_BASE):
+                # O arquivo antigo ainda está no lugar: diferença palavra a palavra
+                antigas = dicionario.ler_palavras(ARQUIVO_DICIONARIO_BASE)
+                diferenca['novas'] = novas - antigas
+                diferenca['removidas'] = antigas - novas
+
+        def tarefa():
+            return download.baixar_arquivo(
+                self.URL_DICIONARIO_ONLINE, ARQUIVO_DICIONARIO_BASE,
+                sha256=self.config.obter_config("jogo", "sha256_dicionario", "") or None,
+                validar=validar, se_mudou=True,
+                ao_progredir=lambda baixados, total: progresso.update(baixados=baixados, total=total))
+
+        def concluir(caminho, erro):
+            mensagem = None
+            if erro is not None:
+                logging.error(f"Erro ao baixar dicionário: {erro}", exc_info=erro)
+            elif caminho is None:
+                mensagem = "O DICIONÁRIO PRINCIPAL JÁ ESTÁ ATUALIZADO."
+            else:
+                if not self.dicionario_pronto.is_set():
+                    # O remendo precisa do índice carregado: conclui quando ele estiver pronto
+                    self.quando_dicionario_pronto(lambda: concluir(caminho, erro))
+                    return
+                mensagem = self._aplicar_atualizacao_dicionario(diferenca)
+            if ao_concluir:
+                ao_concluir(erro, mensagem)
+
+        thread = self.executar_em_segundo_plano(tarefa, concluir)
+
+        def informar_progresso():
+            if ao_progredir:
+                ao_progredir(progresso['baixados'], progresso['total'])
+            if thread.is_alive():
+                self.root.after(intervalo_ms, informar_progresso)
+        informar_progresso()
+        return thread
+
+    def _aplicar_atualizacao_dicionario(self, diferenca):
+        """Remenda o índice com a diferença do pt_BR.dic novo; sem índice ou diferença grande demais, recompila"""
+        indice = self.indice_dificuldade
+        tamanho = len(diferenca.get('novas', ())) + len(diferenca.get('removidas', ()))
+        if indice is None or 'novas' not in diferenca or tamanho > MAX_PALAVRAS_REMENDO:
+            logging.info("Dicionário principal instalado; recompilando em segundo plano.")
+            self.carregar_dicionario_em_segundo_plano()
+            return "DICIONÁRIO PRINCIPAL INSTALADO. RECOMPILANDO EM SEGUNDO PLANO..."
+        indice.aplicar_diferenca(diferenca['novas'], diferenca['removidas'])
+        with self.trava_camadas:
+            self.comuns_por_nivel = self._agrupar_comuns_por_nivel(indice)
+        try:
+            indice.gravar_remendo()
+        except OSError as e:
+            logging.warning(f"Não foi possível gravar o remendo do dicionário: {e}")
+        logging.info(f"Dicionário atualizado sem recompilar: +{len(diferenca['novas'])} "
+                     f"-{len(diferenca['removidas'])} palavras.")
+        return (f"DICIONÁRIO ATUALIZADO: {len(diferenca['novas'])} PALAVRAS NOVAS, "
+                f"{len(diferenca['removidas'])} REMOVIDAS.")
 
     def remover_acentos(self, txt):
-        return ''.join(c for c in unicodedata.normalize('NFD', txt) if unicodedata.category(c) != 'Mn')
+        return remover_acentos(txt)
+
+    def carregar_dicionario_em_segundo_plano(self):
+        """Lê o dicionário numa thread; quem precisar dele passa pela quando_dicionario_pronto()"""
+        self.dicionario_pronto.clear()
+
+        def carregar():
+            try:
+                with perfil.trecho("carregar_dicionario"):
+                    self.carregar_dicionario()
+            except Exception as e:
+                logging.error(f"Erro ao carregar dicionário em segundo plano: {e}", exc_info=True)
+            finally:
+                self.dicionario_pronto.set()
+
+        threading.Thread(target=carregar, name="carregador-dicionario", daemon=True).start()
+
+    def quando_dicionario_pronto(self, acao, intervalo_ms=50):
+        """Chama acao() na thread do Tk assim que o dicionário estiver carregado, sem travar a interface.
+
+        Pedir de novo uma ação que já está esperando (Enter repetido) não a
+        agenda duas vezes.
+        """
+        if self.dicionario_pronto.is_set():
+            acao()
+            return
+        if not self.acoes_aguardando_dicionario:
+            logging.info("Aguardando o carregamento do dicionário em segundo plano.")
+            self.root.after(intervalo_ms, self._verificar_dicionario_pronto, intervalo_ms)
+        self.acoes_aguardando_dicionario[acao] = None
+
+    def _verificar_dicionario_pronto(self, intervalo_ms):
+        if not self.dicionario_pronto.is_set():
+            self.root.after(intervalo_ms, self._verificar_dicionario_pronto, intervalo_ms)
+            return
+        acoes = list(self.acoes_aguardando_dicionario)
+        self.acoes_aguardando_dicionario.clear()
+        for acao in acoes:
+            acao()
 
     def carregar_dicionario(self):
-        self.dicionario_palavras.clear()
-        self.dicionario_palavras_sem_acento = set()
+        """Compila (ou reaproveita do cache) a base e lê as camadas; o modo só escolhe quais ficam ativas"""
         logging.info("Iniciando carregamento do dicionário.")
-        # Carregamento separado para solo e multiplayer
-        ptbr_dic = "pt_BR.dic"
-        palavras_txt = self.ARQUIVO_LOCAL_DICIONARIO
-        palavras_set = set()
-        # Carrega pt_BR.dic se existir
-        if os.path.exists(ptbr_dic) and os.stat(ptbr_dic).st_size > 0:
-            try:
-                with open(ptbr_dic, "r", encoding="utf-8") as f:
-                    primeira_linha = True
-                    for linha in f:
-                        if primeira_linha:
-                            primeira_linha = False
-                            if linha.strip().isdigit():
-                                continue
-                        palavra = linha.strip().lower()
-                        if not palavra:
-                            continue
-                        if '/' in palavra:
-                            palavra = palavra.split('/')[0]
-                        if palavra.isalpha():
-                            palavras_set.add(palavra)
-            except UnicodeDecodeError:
-                with open(ptbr_dic, "r", encoding="latin-1") as f:
-                    primeira_linha = True
-                    for linha in f:
-                        if primeira_linha:
-                            primeira_linha = False
-                            if linha.strip().isdigit():
-                                continue
-                        palavra = linha.strip().lower()
-                        if not palavra:
-                            continue
-                        if '/' in palavra:
-                            palavra = palavra.split('/')[0]
-                        if palavra.isalpha():
-                            palavras_set.add(palavra)
-        # Se for multiplayer, também carrega palavras.txt
-        if self.modo_jogo_selecionado.get() == 'multiplayer' and os.path.exists(palavras_txt) and os.stat(palavras_txt).st_size > 0:
-            try:
-                with open(palavras_txt, "r", encoding="utf-8") as f:
-                    for linha in f:
-                        palavra = linha.strip().lower()
-                        if not palavra:
-                            continue
-                        if '/' in palavra:
-                            palavra = palavra.split('/')[0]
-                        if palavra.isalpha():
-                            palavras_set.add(palavra)
-            except UnicodeDecodeError:
-                with open(palavras_txt, "r", encoding="latin-1") as f:
-                    for linha in f:
-                        palavra = linha.strip().lower()
-                        if not palavra:
-                            continue
-                        if '/' in palavra:
-                            palavra = palavra.split('/')[0]
-                        if palavra.isalpha():
-                            palavras_set.add(palavra)
-        # Atualiza os sets do objeto
-        for palavra in palavras_set:
-            self.dicionario_palavras.add(palavra)
-            self.dicionario_palavras_sem_acento.add(self.remover_acentos(palavra))
-        logging.info(f"Dicionário carregado com {len(self.dicionario_palavras)} palavras.")
+        import dicionario
+        mapear = self.config.obter_config("jogo", "modo_pouca_memoria", False)
+        indice = dicionario.carregar_ou_compilar([ARQUIVO_DICIONARIO_BASE], mapear=mapear)
+        indice.carregar_camada(CAMADA_LOCAL, self.ARQUIVO_LOCAL_DICIONARIO)
+        with self.trava_camadas:
+            indice.ativar(*self.camadas_do_modo)
+            # Conjuntos sobre as listas compactas e as camadas ativas: nenhuma cópia em str do dicionário inteiro
+            self.dicionario_palavras = dicionario.ConjuntoPalavras(indice.palavras, indice)
+            self.dicionario_palavras_sem_acento = dicionario.ConjuntoPalavras(indice.sem_acento_ordenado, indice,
+                                                                              'sem_acento')
+            self.comuns_por_nivel = self._agrupar_comuns_por_nivel(indice)
+            self.indice_dificuldade = indice
+        logging.info(f"Dicionário carregado com {len(indice.palavras)} palavras na base "
+                     f"e {len(indice.camadas[CAMADA_LOCAL])} em '{self.ARQUIVO_LOCAL_DICIONARIO}'.")
         return True
 
+    @staticmethod
+    def _agrupar_comuns_por_nivel(indice):
+        """Nível de cada palavra comum, calculado uma vez por carga, remendo ou troca de camadas do índice"""
+        comuns = {}
+        for palavra in sorted(PALAVRAS_COMUNS):
+            nivel = indice.nivel_da_palavra(palavra)
+            if nivel is not None:
+                comuns.setdefault(nivel, []).append(palavra)
+        return comuns
+
+    def ativar_camadas_do_modo(self, modo):
+        """Troca as camadas do dicionário para o modo em O(1), sem reler a base"""
+        with self.trava_camadas:
+            self.camadas_do_modo = CAMADAS_POR_MODO.get(modo, ())
+            if self.indice_dificuldade is not None:
+                self.indice_dificuldade.ativar(*self.camadas_do_modo)
+                self.comuns_por_nivel = self._agrupar_comuns_por_nivel(self.indice_dificuldade)
+        logging.info(f"Camadas do dicionário para o modo '{modo}': {self.camadas_do_modo or 'só a base'}.")
+
     # ============================================================================
     # MÉTODOS DE DICIONÁRIO E PALAVRAS
     # ============================================================================
@@ -707,11 +969,11 @@ class GameApp:
         palavra_lower = palavra.lower()
         
         # Verifica se a palavra está na lista de palavras inadequadas
-        if palavra_lower in self.PALAVRAS_INADEQUADAS:
+        if palavra_lower in PALAVRAS_INADEQUADAS:
             return True
         
         # Verifica se contém substrings inadequadas
-        for termo_inadequado in self.PALAVRAS_INADEQUADAS:
+        for termo_inadequado in PALAVRAS_INADEQUADAS:
             if termo_inadequado in palavra_lower:
                 return True
         
@@ -754,6 +1016,13 @@ class GameApp:
             previous_row = current_row
         return previous_row[-1]
 
+    def equivalentes_sem_acento(self, palavra):
+        """Palavras do dicionário que só diferem de `palavra` nos acentos"""
+        if self.indice_dificuldade is not None:
+            return [p for p in self.indice_dificuldade.equivalentes_sem_acento(palavra) if p in self.dicionario_palavras]
+        sem_acento = self.remover_acentos(palavra)
+        return [p for p in self.dicionario_palavras if self.remover_acentos(p) == sem_acento]
+
     def sugerir_palavras(self, palavra_digitada, limite_distancia=2):
         logging.info(f"Gerando sugestões para '{palavra_digitada}' com limite de distância {limite_distancia}.")
         
@@ -776,7 +1045,7 @@ class GameApp:
         # Limita a busca para não ficar muito lento
         if len(palavras_candidatas) > 1000:
             # Prioriza palavras comuns se disponíveis
-            palavras_comuns_candidatas = [p for p in palavras_candidatas if p in self.PALAVRAS_COMUNS]
+            palavras_comuns_candidatas = [p for p in palavras_candidatas if p in PALAVRAS_COMUNS]
             if palavras_comuns_candidatas:
                 palavras_candidatas = palavras_comuns_candidatas[:500]
             else:
@@ -887,8 +1156,13 @@ class GameApp:
             if palavra_nova in self.dicionario_palavras:
                 messagebox.showinfo("JÁ EXISTE", "Esta palavra já está no dicionário.")
                 return
-            self.dicionario_palavras.add(palavra_nova)
-            self.dicionario_palavras_sem_acento.add(self.remover_acentos(palavra_nova))
+            indice = self.indice_dificuldade
+            if indice is not None:
+                # Entra na camada local (a mesma do palavras.txt), sem recarregar o dicionário
+                indice.adicionar(palavra_nova, CAMADA_LOCAL)
+            else:
+                self.dicionario_palavras.add(palavra_nova)
+                self.dicionario_palavras_sem_acento.add(self.remover_acentos(palavra_nova))
             # Salva no arquivo palavras.txt
             try:
                 with open(self.ARQUIVO_LOCAL_DICIONARIO, "a", encoding="utf-8") as f:
@@ -925,14 +1199,12 @@ class GameApp:
         self.root.wait_window(janela_sugestao)
 
     def embaralhar_palavra(self, palavra):
-        letras_base = list(palavra)
         logging.info(f"Embaralhando palavra '{palavra}' para dificuldade: {self.dificuldade_selecionada.get()}")
 
-        # Agora todas as dificuldades usam apenas as letras da palavra original
-        letras_para_embaralhar = letras_base 
-
-        random.shuffle(letras_para_embaralhar)
-        embaralhada = ''.join(letras_para_embaralhar)
+        # Agora todas as dificuldades usam apenas as letras da palavra original.
+        # A semente vai para a gravação da rodada, que assim reproduz a mesma ordem
+        self.semente_embaralhamento = random.getrandbits(63)
+        embaralhada = embaralhar_letras(palavra, self.semente_embaralhamento)
         logging.info(f"Palavra embaralhada: {embaralhada}")
         return embaralhada
 
@@ -946,10 +1218,12 @@ class GameApp:
             min_len = 4
             max_len = 20
         logging.info(f"Gerando palavra do sistema para dificuldade: {dificuldade} no modo {self.modo_jogo_selecionado.get()}.")
+        # Chamada com o dicionário já carregado (ver _sortear_palavra_solo e quando_dicionario_pronto)
 
         def tem_definicao_online(palavra):
             if not VERIFICAR_DEFINICAO_ONLINE:
                 return True
+            import requests
             try:
                 url = f'https://dicio-api.vercel.app/v2/{palavra.lower()}'
                 resp = requests.get(url, timeout=3)
@@ -973,52 +1247,67 @@ class GameApp:
 
         priorizar_comuns = self.config.obter_config("jogo", "usar_palavras_comuns", False)
         palavras_usadas = set(self.palavras_usadas.get(dificuldade, []))
-        # Sempre filtra pelo tamanho da dificuldade
-        if priorizar_comuns:
-            palavras_base = [p for p in self.PALAVRAS_COMUNS if min_len <= len(p) <= max_len and p not in palavras_usadas]
-            if not palavras_base:
-                palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len and p not in palavras_usadas]
-        else:
-            palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len and p not in palavras_usadas]
-        if not palavras_base:
+        palavra = self._sortear_candidata(dificuldade, min_len, max_len, priorizar_comuns, palavras_usadas)
+        if palavra is None:
+            # Todas as palavras do nível já saíram: recomeça a lista de usadas
             self.palavras_usadas[dificuldade] = []
             self.salvar_palavras_usadas()
-            if priorizar_comuns:
-                palavras_base = [p for p in self.PALAVRAS_COMUNS if min_len <= len(p) <= max_len]
-                if not palavras_base:
-                    palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len]
-            else:
-                palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len]
+            palavras_usadas = set()
+            palavra = self._sortear_candidata(dificuldade, min_len, max_len, priorizar_comuns, palavras_usadas)
         # Filtro de definição online (apenas modo solo)
-        if self.modo_jogo_selecionado.get() == 'solo' and VERIFICAR_DEFINICAO_ONLINE:
-            palavras_validas = []
-            tentativas = 0
-            random.shuffle(palavras_base)
-            for palavra in palavras_base:
-                if tentativas >= 10:
+        if palavra and self.modo_jogo_selecionado.get() == 'solo' and VERIFICAR_DEFINICAO_ONLINE:
+            candidata = palavra
+            rejeitadas = set(palavras_usadas)
+            for _ in range(10):
+                if tem_definicao_online(candidata):
+                    palavra = candidata
+                    logging.info(f"Palavra sorteada com definição online: {palavra.upper()} (Dificuldade: {dificuldade})")
                     break
-                if tem_definicao_online(palavra):
-                    palavras_validas.append(palavra)
+                rejeitadas.add(candidata)
+                candidata = self._sortear_candidata(dificuldade, min_len, max_len, priorizar_comuns, rejeitadas)
+                if candidata is None:
                     break
-                tentativas += 1
-            if palavras_validas:
-                palavra_escolhida = palavras_validas[0].upper()
-                self.palavras_usadas.setdefault(dificuldade, []).append(palavra_escolhida.lower())
-                self.salvar_palavras_usadas()
-                logging.info(f"Palavra sorteada com definição online: {palavra_escolhida} (Dificuldade: {dificuldade})")
-                return palavra_escolhida
-        # Fallback: ainda assim, só sorteia palavra do tamanho correto
-        if not palavras_base:
-            palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len]
-        if not palavras_base:
+        if palavra is None:
             # Se ainda assim não houver, sorteia qualquer palavra do dicionário
-            palavras_base = list(self.dicionario_palavras)
-        palavra_escolhida = random.choice(palavras_base).upper()
+            palavra = self.dicionario_palavras.sortear()
+        palavra_escolhida = palavra.upper()
         self.palavras_usadas.setdefault(dificuldade, []).append(palavra_escolhida.lower())
         self.salvar_palavras_usadas()
         logging.info(f"Palavra do sistema escolhida: {palavra_escolhida} (Dificuldade: {dificuldade})")
         return palavra_escolhida
 
+    def anagramas_validos(self, palavra):
+        """Outras palavras do dicionário com as mesmas letras, aceitas como resposta da rodada"""
+        if not palavra or self.indice_dificuldade is None:
+            return []
+        anagramas = self.indice_dificuldade.anagramas(palavra.lower())
+        if anagramas:
+            logging.info(f"Embaralhamento ambíguo para '{palavra}': também serão aceitas {anagramas}.")
+        return anagramas
+
+    def _sortear_candidata(self, dificuldade, min_len, max_len, priorizar_comuns, excluir):
+        """Uma palavra do nível fora de `excluir`, ou None se o nível se esgotou.
+
+        No solo o nível vem da pontuação de dificuldade do dicionário compilado
+        (sorteio O(1) por faixa); fora dele, sorteia pela tabela de tamanhos.
+        """
+        indice = self.indice_dificuldade if self.modo_jogo_selecionado.get() == 'solo' else None
+        if indice is not None and dificuldade not in indice.niveis:
+            indice = None
+        if priorizar_comuns:
+            if indice is not None:
+                comuns = [p for p in self.comuns_por_nivel.get(dificuldade, ()) if p not in excluir]
+            else:
+                comuns = [p for p in PALAVRAS_COMUNS if min_len <= len(p) <= max_len and p not in excluir]
+            if comuns:
+                return random.choice(comuns)
+        if indice is not None:
+            return indice.sortear(dificuldade, excluir=excluir)
+        if self.indice_dificuldade is not None:
+            return self.indice_dificuldade.sortear_por_tamanho(min_len, max_len, excluir=excluir)
+        palavras_base = [p for p in self.dicionario_palavras if min_len <= len(p) <= max_len and p not in excluir]
+        return random.choice(palavras_base) if palavras_base else None
+
     def mostrar_carregando_palavra(self):
         self.janela_carregando = tk.Toplevel(self.root)
         self.janela_carregando.title("Carregando palavra...")
@@ -1052,17 +1341,18 @@ class GameApp:
 
     def iniciar_fase_definicao_palavra(self):
         logging.info(f"Iniciando fase de definição de palavra. Modo: {self.modo_jogo_selecionado.get()}")
-        self.partida_desistida = False
+        self.rodada = None
         if self.modo_jogo_selecionado.get() == 'solo':
             logging.info("Modo SOLO selecionado. Gerando palavra do sistema.")
             self.mostrar_carregando_palavra()
-            self.root.after(100, self._sortear_palavra_solo)
+            # A janela "carregando" segue animada enquanto o dicionário termina de carregar
+            self.root.after(100, self.quando_dicionario_pronto, self._sortear_palavra_solo)
             return
 
-        jogador_que_vai_adivinhar = (self.jogador_definidor_idx + 1) % len(self.jogadores)
+        jogador_que_vai_adivinhar = self.partida.adivinhador_idx
 
-        definidor_da_vez = self.jogadores[self.jogador_definidor_idx]['nome']
-        adivinhador_desta_palavra = self.jogadores[jogador_que_vai_adivinhar]['nome']
+        definidor_da_vez = self.jogadores[self.jogador_definidor_idx].nome
+        adivinhador_desta_palavra = self.jogadores[jogador_que_vai_adivinhar].nome
         logging.info(f"Modo MULTIPLAYER. Definidor: {definidor_da_vez}, Adivinhador: {adivinhador_desta_palavra}.")
 
         self.palavra_secreta_var.set("")
@@ -1071,7 +1361,9 @@ class GameApp:
         self._criar_frames_iniciais()
         self.label_jogador1.config(text=f"{definidor_da_vez.upper()}, DEFINA A PALAVRA SECRETA PARA {adivinhador_desta_palavra.upper()}:")
         self.label_jogador1.pack(pady=20)
-        self.entry_palavra_secreta.pack(pady=20, ipadx=10, ipady=10)
+        self.entry_palavra_secreta.pack(pady=(20, 5), ipadx=10, ipady=10)
+        self.label_status_palavra.pack(pady=(0, 5))
+        self.listbox_completar.pack(pady=(0, 10))
         ttk.Button(self.frame_jogador1, text="CONFIRMAR PALAVRA", command=self.processar_palavra_secreta, style="TButton").pack(pady=10)
         self.frame_jogador1.pack(expand=True, fill='both', pady=20)
 
@@ -1091,10 +1383,61 @@ class GameApp:
             var.set(new_value)
         
         if self.som_teclado and self.config.obter_config("audio", "som_ativado", True) and event and event.char and event.keysym not in ('BackSpace', 'Return', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R', 'Caps_Lock', 'Tab'):
-            self.som_teclado.play()
+            self.audio.tocar('som_teclado')
             logging.debug(f"Som de teclado acionado por {event.keysym} em on_entry_uppercase.")
         
-        pass
+        if var is self.palavra_secreta_var:
+            self.agendar_autocompletar()
+
+    def agendar_autocompletar(self):
+        """Só consulta o dicionário depois de uma pausa curta na digitação"""
+        if self.autocompletar_id:
+            self.root.after_cancel(self.autocompletar_id)
+        self.autocompletar_id = self.root.after(ATRASO_AUTOCOMPLETAR_MS, self.atualizar_autocompletar)
+
+    def atualizar_autocompletar(self):
+        """Mostra se o texto já é uma palavra válida e as palavras que começam com ele"""
+        self.autocompletar_id = None
+        texto = self.palavra_secreta_var.get().strip().lower()
+        try:
+            self.listbox_completar.delete(0, tk.END)
+            if not texto or not self.dicionario_pronto.is_set():
+                self.label_status_palavra.config(text="")
+                return
+            if self.indice_dificuldade is not None:
+                total, sugestoes = self.indice_dificuldade.completar(texto)
+            else:
+                total, sugestoes = 0, []
+
+            if texto in self.dicionario_palavras:
+                status, cor = "✔ PALAVRA VÁLIDA", COR_TEXTO_CLARO
+            elif self.remover_acentos(texto) in self.dicionario_palavras_sem_acento:
+                status, cor = "FALTA ACENTO? ESCOLHA NA LISTA", COR_TEXTO_CLARO_DESTACADO
+            elif total:
+                status, cor = f"{total} PALAVRAS COMEÇAM ASSIM", COR_VERDE_ACERTO_CLARO
+            else:
+                status, cor = "✘ NENHUMA PALAVRA DO DICIONÁRIO COMEÇA ASSIM", COR_VERMELHO_ERRO
+            self.label_status_palavra.config(text=status, fg=cor)
+            for sugestao in sugestoes:
+                self.listbox_completar.insert(tk.END, sugestao.upper())
+        except tk.TclError:
+            pass  # A tela de definição foi fechada antes da consulta
+
+    def usar_autocompletar(self, event=None):
+        selecao = self.listbox_completar.curselection()
+        if selecao:
+            self.palavra_secreta_var.set(self.listbox_completar.get(selecao[0]))
+            self.entry_palavra_secreta.icursor(tk.END)
+            self.entry_palavra_secreta.focus_set()
+            self.atualizar_autocompletar()
+
+    def aceitar_primeiro_autocompletar(self, event=None):
+        """TAB completa com a primeira sugestão"""
+        if self.listbox_completar.size():
+            self.listbox_completar.selection_clear(0, tk.END)
+            self.listbox_completar.selection_set(0)
+            self.usar_autocompletar()
+        return "break"
 
     def on_entry_uppercase_and_verify(self, var, event=None):
         """Converte para maiúsculas E verifica nomes preenchidos"""
@@ -1106,7 +1449,7 @@ class GameApp:
         
         # Toca som de teclado se disponível
         if self.som_teclado and self.config.obter_config("audio", "som_ativado", True) and event and event.char and event.keysym not in ('BackSpace', 'Return', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R', 'Caps_Lock', 'Tab'):
-            self.som_teclado.play()
+            self.audio.tocar('som_teclado')
             logging.debug(f"Som de teclado acionado por {event.keysym} em on_entry_uppercase_and_verify.")
         
         # Verifica nomes preenchidos
@@ -1152,8 +1495,12 @@ class GameApp:
             logging.warning(f"Palavra '{palavra_digitada}' muito longa.")
             return
         # Verificação exata
+        if not self.dicionario_pronto.is_set():
+            # Refaz a validação quando o dicionário terminar de carregar, sem travar a tela
+            self.quando_dicionario_pronto(self.processar_palavra_secreta)
+            return
         palavra_digitada_lower = palavra_digitada.lower()
-        equivalentes = [p for p in self.dicionario_palavras if self.remover_acentos(p) == self.remover_acentos(palavra_digitada_lower)]
+        equivalentes = self.equivalentes_sem_acento(palavra_digitada_lower)
         sugestoes = []
         if palavra_digitada_lower not in self.dicionario_palavras:
             if equivalentes:
@@ -1165,29 +1512,20 @@ class GameApp:
             return
         # ... restante do código original ...
         # Se chegou até aqui, a palavra é válida e está no dicionário
-        if self.modo_jogo_selecionado.get() == 'solo':
-            self.jogadores[0]['palavra_a_adivinhar'] = palavra_digitada.upper()
-            self.jogadores[0]['dificuldade_rodada'] = self.dificuldade_selecionada.get()
-            self.jogador_atual_idx = 0
-            self.iniciar_rodada_adivinhacao()
-        else:
-            # Multiplayer: salva a palavra para o adivinhador e avança
-            idx_adivinhador = (self.jogador_definidor_idx + 1) % len(self.jogadores)
-            self.jogadores[idx_adivinhador]['palavra_a_adivinhar'] = palavra_digitada.upper()
-            self.jogadores[idx_adivinhador]['dificuldade_rodada'] = self.dificuldade_selecionada.get()
-            self.jogador_atual_idx = idx_adivinhador
-            self.iniciar_rodada_adivinhacao()
+        # No multiplayer a palavra vai para o próximo jogador; no solo, para o único
+        self.partida.definir_palavra(palavra_digitada, self.dificuldade_selecionada.get())
+        self.iniciar_rodada_adivinhacao()
         return
 
     def desistir_partida(self):
-        logging.info(f"Jogador {self.jogadores[self.jogador_atual_idx]['nome']} solicitou desistência.")
+        logging.info(f"Jogador {self.jogadores[self.jogador_atual_idx].nome} solicitou desistência.")
 
         resposta = messagebox.askyesno("DESISTIR?", "TEM CERTEZA QUE DESEJA DESISTIR DA PARTIDA? O TEMPO NÃO SERÁ CONTABILIZADO E SEU RESULTADO NÃO ENTRARÁ NO RANKING (MODO SOLO).")
         if not resposta:
             logging.info("Desistência cancelada pelo usuário.")
             return
 
-        self.partida_desistida = True
+        self.rodada.give_up()
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             logging.info("Timer cancelado devido à desistência.")
@@ -1197,13 +1535,10 @@ class GameApp:
 
         self.btn_desistir.pack_forget()
 
-        self.jogadores[self.jogador_atual_idx]['tempo_rodada'] = float('inf')
-        self.jogadores[self.jogador_atual_idx]['erros_rodada'] = "DESISTIU"
-        
-        self.label_instrucao_jogador2.config(text=f"{self.jogadores[self.jogador_atual_idx]['nome'].upper()} DESISTIU! A PALAVRA ERA: {self.palavra_secreta.upper()}", fg=COR_VERMELHO_ERRO)
-        self.label_tempo.config(text="TEMPO: DESISTIDO")
-        self.label_erros.config(text="ERROS: DESISTIDO")
-        logging.info(f"Rodada para {self.jogadores[self.jogador_atual_idx]['nome']} encerrada: DESISTIU. Palavra: {self.palavra_secreta}.")
+        self.modelo_interface.definir('instrucao', (f"{self.jogadores[self.jogador_atual_idx].nome.upper()} DESISTIU! A PALAVRA ERA: {self.palavra_secreta.upper()}", COR_VERMELHO_ERRO))
+        self.modelo_interface.definir('tempo', "DESISTIDO")
+        self.modelo_interface.definir('erros', "DESISTIDO")
+        logging.info(f"Rodada para {self.jogadores[self.jogador_atual_idx].nome} encerrada: DESISTIU. Palavra: {self.palavra_secreta}.")
         
         for i, char in enumerate(self.palavra_secreta):
             if i < len(self.palavra_adivinhada_entries):
@@ -1219,29 +1554,23 @@ class GameApp:
     # ============================================================================
 
     def iniciar_rodada_adivinhacao(self):
-        logging.info(f"Iniciando rodada de adivinhação para o jogador: {self.jogadores[self.jogador_atual_idx]['nome']}")
+        logging.info(f"Iniciando rodada de adivinhação para o jogador: {self.jogadores[self.jogador_atual_idx].nome}")
 
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
 
-        self.partida_desistida = False
-
-        self.palavra_secreta = self.jogadores[self.jogador_atual_idx]['palavra_a_adivinhar']
+        reproducao = self.reproducao
+        if reproducao is not None:
+            self.rodada = self.partida.nova_rodada(reproducao.alternativas)
+        else:
+            self.rodada = self.partida.nova_rodada(self.anagramas_validos(self.partida.jogador_atual.palavra_a_adivinhar))
         if not self.palavra_secreta:
-            logging.error(f"Jogador {self.jogadores[self.jogador_atual_idx]['nome']} não tem palavra para adivinhar. Retornando ao menu.")
-            messagebox.showerror("ERRO DE SEQUÊNCIA", f"O JOGADOR {self.jogadores[self.jogador_atual_idx]['nome'].upper()} AINDA NÃO TEM UMA PALAVRA PARA ADIVINHAR. O JOGO TENTARÁ REDEFINIR.")
+            logging.error(f"Jogador {self.jogadores[self.jogador_atual_idx].nome} não tem palavra para adivinhar. Retornando ao menu.")
+            messagebox.showerror("ERRO DE SEQUÊNCIA", f"O JOGADOR {self.jogadores[self.jogador_atual_idx].nome.upper()} AINDA NÃO TEM UMA PALAVRA PARA ADIVINHAR. O JOGO TENTARÁ REDEFINIR.")
             self.iniciar_selecao_modo()
             return
 
-        self.letras_embaralhadas = self.embaralhar_palavra(self.palavra_secreta)
-
-        self.erros_rodada_atual = 0
-        self.letras_ja_tentadas_exibicao.clear()
-        self.letras_erradas_exibicao.clear()
-        self.letras_erradas_desde_ultimo_acerto = set()  # NOVO: letras erradas desde o último acerto
-        self.indice_atual = 0
-        self.tempo_total_jogador_atual = 0.0
-        self.tempo_penalidade_acumulada = 0.0
+        self.letras_embaralhadas = reproducao.letras if reproducao is not None else self.embaralhar_palavra(self.palavra_secreta)
 
         self.limpar_tela()
         self._criar_frames_iniciais()
@@ -1304,15 +1633,16 @@ class GameApp:
             dificuldade = self.dificuldade_selecionada.get()
             priorizar_comuns = self.config.obter_config("jogo", "usar_palavras_comuns", False)
             texto_comuns = "(Prioriza Palavras Comuns)" if priorizar_comuns else "(Dicionário Completo)"
-            self.label_instrucao_jogador2.config(text=f"DIFICULDADE: {dificuldade.upper()} {texto_comuns}\nVEZ DE: {self.jogadores[self.jogador_atual_idx]['nome'].upper()}. CLIQUE EM 'INICIAR RODADA' PARA COMEÇAR!", fg=COR_TEXTO_CLARO)
+            self.label_instrucao_jogador2.config(text=f"DIFICULDADE: {dificuldade.upper()} {texto_comuns}\nVEZ DE: {self.jogadores[self.jogador_atual_idx].nome.upper()}. CLIQUE EM 'INICIAR RODADA' PARA COMEÇAR!", fg=COR_TEXTO_CLARO)
         else:
-            self.label_instrucao_jogador2.config(text=f"VEZ DE: {self.jogadores[self.jogador_atual_idx]['nome'].upper()}. CLIQUE EM 'INICIAR RODADA' PARA COMEÇAR!", fg=COR_TEXTO_CLARO)
+            self.label_instrucao_jogador2.config(text=f"VEZ DE: {self.jogadores[self.jogador_atual_idx].nome.upper()}. CLIQUE EM 'INICIAR RODADA' PARA COMEÇAR!", fg=COR_TEXTO_CLARO)
 
         self.label_letras_embaralhadas.config(text="LETRAS DISPONÍVEIS:", fg=COR_TEXTO_CLARO_DESTACADO)
         self.label_erros.config(text="")
         self.label_letras_tentadas.config(text="")
         self.label_letras_erradas.config(text="")
         self.label_tempo.config(text="TEMPO: 0.00S")
+        self._vincular_modelo_interface()
 
         logging.info("Interface da rodada de adivinhação preparada.")
 
@@ -1327,7 +1657,7 @@ class GameApp:
 
         if self.som_teclado:
             if event.char.isalpha() or event.keysym == 'BackSpace':
-                self.som_teclado.play()
+                self.audio.tocar('som_teclado')
                 logging.debug(f"Som de teclado acionado por {event.keysym} no Entry de adivinhação.")
 
         if not self.palavra_adivinhada_entries or idx >= len(self.palavra_adivinhada_entries):
@@ -1373,7 +1703,7 @@ class GameApp:
             return
 
         if self.som_teclado and self.config.obter_config("audio", "som_ativado", True):
-            self.som_teclado.play()
+            self.audio.tocar('som_teclado')
             logging.debug(f"Som de teclado acionado por botão virtual: {letra}")
 
         if self.indice_atual < len(self.palavra_adivinhada_entries):
@@ -1394,15 +1724,15 @@ class GameApp:
             logging.warning("Tentativa de inserir letra em palavra já completa.")
 
     def iniciar_partida_jogador(self):
-        logging.info(f"iniciar_partida_jogador() chamada para o jogador: {self.jogadores[self.jogador_atual_idx]['nome']}")
-        logging.info(f"Iniciando partida para o jogador: {self.jogadores[self.jogador_atual_idx]['nome']}")
+        logging.info(f"iniciar_partida_jogador() chamada para o jogador: {self.jogadores[self.jogador_atual_idx].nome}")
+        logging.info(f"Iniciando partida para o jogador: {self.jogadores[self.jogador_atual_idx].nome}")
 
-        if self.musica_menu and pygame.mixer.get_busy():
-            self.musica_menu.stop()
+        if self.audio.tocando('musica'):
+            self.audio.parar('musica')
             logging.info("Música do menu parada ao iniciar a rodada de adivinhação.")
 
         if self.som_iniciar_rodada:
-            self.som_iniciar_rodada.play()
+            self.audio.tocar('som_iniciar_rodada')
             logging.info("Som 'iniciar_rodada' acionado.")
 
         self.botao_iniciar_jogador2.pack_forget()
@@ -1410,7 +1740,6 @@ class GameApp:
         for btn in self.botoes_letras_embaralhadas:
             btn.config(state='normal')
 
-        self.indice_atual = 0
         if self.palavra_adivinhada_entries:
             self.palavra_adivinhada_entries[self.indice_atual].config(state='normal', bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO)
             self.palavra_adivinhada_entries[self.indice_atual].focus_set()
@@ -1423,7 +1752,14 @@ class GameApp:
 
         self.revelar_letras_embaralhadas_apenas()
 
-        self.tempo_inicio_rodada = time.time()
+        self.rodada.iniciar()
+        if self.reproducao is None and self.config.obter_config("jogo", "gravar_rodadas", True):
+            if self.gravador is None:
+                from gravacao import Gravador
+                self.gravador = Gravador()
+            jogador = self.partida.jogador_atual
+            self.gravador.iniciar(self.rodada, self.partida.modo, jogador.nome, jogador.dificuldade_rodada,
+                                  self.letras_embaralhadas, self.semente_embaralhamento)
         self.iniciar_timer_progressivo()
         self.atualizar_interface_jogador2()
 
@@ -1449,22 +1785,37 @@ class GameApp:
             entry.config(state='disabled', bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO)
         logging.info("Caixas da palavra adivinhada reveladas (em branco).")
 
-    def atualizar_interface_jogador2(self):
-        self.label_erros.config(text=f"ERROS: {self.erros_rodada_atual}")
-        letras_exibicao_tentadas = sorted(list(self.letras_ja_tentadas_exibicao))
-        self.label_letras_tentadas.config(text="LETRAS TENTADAS (GERAL): " + ", ".join(letras_exibicao_tentadas).upper())
+    def _vincular_modelo_interface(self):
+        """Associa os labels da tela de adivinhação recém-criados ao modelo de interface"""
+        modelo = self.modelo_interface
+        modelo.reiniciar()
+        modelo.vincular('erros', self.label_erros,
+                        lambda erros: {'text': f"ERROS: {erros}"})
+        modelo.vincular('letras_tentadas', self.label_letras_tentadas,
+                        lambda letras: {'text': "LETRAS TENTADAS (GERAL): " + ", ".join(sorted(letras)).upper()})
+        modelo.vincular('letras_erradas', self.label_letras_erradas,
+                        lambda letras: {'text': "LETRAS ERRADAS: " + ", ".join(sorted(letras)).upper(), 'fg': COR_VERMELHO_ERRO})
+        modelo.vincular('instrucao', self.label_instrucao_jogador2,
+                        lambda instrucao: {'text': instrucao[0], 'fg': instrucao[1]})
+        modelo.vincular('tempo', self.label_tempo,
+                        lambda tempo: {'text': f"TEMPO: {tempo:.2f}S" if isinstance(tempo, float) else f"TEMPO: {tempo}"})
 
+    def atualizar_interface_jogador2(self):
+        """Registra o estado atual da rodada; a pintura acontece em lote no próximo quadro"""
+        modelo = self.modelo_interface
+        rodada = self.rodada
+        modelo.definir('erros', rodada.erros)
+        modelo.definir('letras_tentadas', frozenset(rodada.letras_tentadas))
         # NOVO: letras erradas desde o último acerto
-        letras_exibicao_erradas = sorted(list(getattr(self, 'letras_erradas_desde_ultimo_acerto', set())))
-        self.label_letras_erradas.config(text="LETRAS ERRADAS: " + ", ".join(letras_exibicao_erradas).upper(), fg=COR_VERMELHO_ERRO)
+        modelo.definir('letras_erradas', frozenset(rodada.letras_erradas_desde_ultimo_acerto))
 
+        nome = self.jogadores[self.jogador_atual_idx].nome.upper()
         if self.indice_atual < len(self.palavra_secreta):
-            self.label_instrucao_jogador2.config(text=f"VEZ DE: {self.jogadores[self.jogador_atual_idx]['nome'].upper()} - ADIVINHE A LETRA DA POSIÇÃO {self.indice_atual + 1}:")
+            modelo.definir('instrucao', (f"VEZ DE: {nome} - ADIVINHE A LETRA DA POSIÇÃO {self.indice_atual + 1}:", COR_TEXTO_CLARO))
         else:
-            self.label_instrucao_jogador2.config(text=f"VEZ DE: {self.jogadores[self.jogador_atual_idx]['nome'].upper()} - PALAVRA COMPLETA!")
+            modelo.definir('instrucao', (f"VEZ DE: {nome} - PALAVRA COMPLETA!", COR_TEXTO_CLARO))
 
-        self.label_tempo.config(text=f"TEMPO: {self.tempo_total_jogador_atual:.2f}S")
-        logging.debug(f"Interface atualizada. Erros: {self.erros_rodada_atual}, Tempo: {self.tempo_total_jogador_atual:.2f}s.")
+        modelo.definir('tempo', rodada.tempo_decorrido())
 
     def iniciar_timer_progressivo(self):
         if self.timer_id:
@@ -1481,8 +1832,6 @@ class GameApp:
             logging.debug("Contagem de tempo interrompida: partida desistida.")
             return
 
-        self.tempo_total_jogador_atual = (time.time() - self.tempo_inicio_rodada) + self.tempo_penalidade_acumulada
-
         self.atualizar_interface_jogador2()
         self.timer_id = self.root.after(100, self.contar_tempo_progressivo)
 
@@ -1496,37 +1845,31 @@ class GameApp:
             return
 
         current_entry = self.palavra_adivinhada_entries[idx]
-        letra_digitada = letra_input.upper()
-        letra_correta = self.palavra_secreta[self.indice_atual]
-
-        self.letras_ja_tentadas_exibicao.add(letra_digitada)
+        tentativa = self.rodada.guess(letra_input)
+        if tentativa is None:
+            return
+        if self.gravador is not None and self.reproducao is None:
+            self.gravador.letra(tentativa)
+        letra_digitada = tentativa.letra
+        letra_correta = tentativa.letra_correta
 
-        # NOVO: aceita equivalentes sem acento
-        if (letra_digitada == letra_correta) or (self.remover_acentos(letra_digitada) == self.remover_acentos(letra_correta)):
+        # O motor aceita equivalentes sem acento
+        if tentativa.acertou:
             # Se digitou sem acento mas a correta tem acento, corrige no campo
             current_entry.delete(0, tk.END)
             current_entry.insert(0, letra_correta)
             current_entry.config(state='disabled', bg=COR_VERDE_ACERTO_CLARO, fg="white")
-            logging.info(f"Acertou a letra '{letra_digitada}' (comparada como '{letra_correta}') na posição {self.indice_atual}.")
+            logging.info(f"Acertou a letra '{letra_digitada}' (comparada como '{letra_correta}') na posição {tentativa.posicao}.")
             
-            is_last_letter_of_word = (self.indice_atual + 1) == len(self.palavra_secreta)
+            is_last_letter_of_word = tentativa.completa
             
             if self.som_acerto and self.config.obter_config("audio", "som_ativado", True) and (not is_last_letter_of_word or self.modo_jogo_selecionado.get() == 'multiplayer'):
-                self.som_acerto.play()
+                self.audio.tocar('som_acerto')
                 logging.info(f"Som de acerto acionado para a letra '{letra_digitada}'.")
             elif is_last_letter_of_word and self.modo_jogo_selecionado.get() == 'solo':
                 logging.info(f"Última letra '{letra_digitada}' acertada no modo solo. Som de acerto suprimido para priorizar som final.")
 
-            if letra_digitada in self.letras_erradas_exibicao:
-                self.letras_erradas_exibicao.remove(letra_digitada)
-                logging.info(f"Letra '{letra_digitada}' removida das letras erradas (acertou em outra posição).")
-
-            self.indice_atual += 1
-
-            # NOVO: limpa as letras erradas desde o último acerto
-            self.letras_erradas_desde_ultimo_acerto = set()
-
-            if self.indice_atual < len(self.palavra_secreta):
+            if not tentativa.completa:
                 self.palavra_adivinhada_entries[self.indice_atual-1].config(state='disabled')
                 self.palavra_adivinhada_entries[self.indice_atual].config(state='normal', bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO)
                 self.palavra_adivinhada_entries[self.indice_atual].focus_set()
@@ -1537,17 +1880,9 @@ class GameApp:
                     self.palavra_adivinhada_entries[len(self.palavra_secreta)-1].config(state='disabled')
                 self.verificar_fim_de_rodada()
         else:
-            self.erros_rodada_atual += 1
-            self.letras_erradas_exibicao.add(letra_digitada)
-            # NOVO: adiciona à lista de erradas desde o último acerto
-            if not hasattr(self, 'letras_erradas_desde_ultimo_acerto'):
-                self.letras_erradas_desde_ultimo_acerto = set()
-            self.letras_erradas_desde_ultimo_acerto.add(letra_digitada)
-            penalidade_erro = self.config.obter_config("jogo", "penalidade_erro", 3.0)
-            self.tempo_penalidade_acumulada += penalidade_erro
-            logging.info(f"Errou a letra '{letra_digitada}' na posição {self.indice_atual}. Erros: {self.erros_rodada_atual}, Penalidade: {self.tempo_penalidade_acumulada}s.")
+            logging.info(f"Errou a letra '{letra_digitada}' na posição {tentativa.posicao}. Erros: {self.rodada.erros}, Penalidade: {self.rodada.penalidade_acumulada}s.")
             if self.som_erro and self.config.obter_config("audio", "som_ativado", True):
-                self.som_erro.play()
+                self.audio.tocar('som_erro')
                 logging.info(f"Som de erro acionado para a letra '{letra_digitada}'.")
 
             original_bg = current_entry.cget("bg")
@@ -1567,81 +1902,149 @@ class GameApp:
             self.root.after_cancel(self.timer_id)
             logging.info("Timer da rodada cancelado.")
 
-        palavra_adivinhada_str = "".join([var.get() for var in self.entry_vars_adivinhacao]).upper()
-
         for btn in self.botoes_letras_embaralhadas:
             btn.config(state='disabled')
         for entry in self.palavra_adivinhada_entries:
             entry.config(state='disabled')
 
-        if self.partida_desistida:
-            resultado_rodada = "DESISTIU"
-            tempo_final = float('inf')
-            erros_final = "DESISTIU"
-            logging.info(f"Rodada para {self.jogadores[self.jogador_atual_idx]['nome']} encerrada: DESISTIU.")
-        elif palavra_adivinhada_str == self.palavra_secreta:
-            resultado_rodada = "ADIVINHOU"
-            tempo_final = self.tempo_total_jogador_atual
-            erros_final = self.erros_rodada_atual
+        resultado_rodada = self.rodada.finish()
+        gravacao = None
+        if self.gravador is not None and self.reproducao is None:
+            gravacao = self.gravador.encerrar(resultado_rodada)
+        tempo_final = self.rodada.tempo_final()
+        erros_final = self.rodada.erros_final()
+        jogador = self.partida.jogador_atual
+
+        if resultado_rodada == STATUS_DESISTIU:
+            logging.info(f"Rodada para {jogador.nome} encerrada: DESISTIU.")
+        elif resultado_rodada == STATUS_ADIVINHOU:
+            if self.rodada.palavra != self.rodada.palavra_sorteada:
+                logging.info(f"Anagrama aceito: '{self.rodada.palavra}' no lugar de '{self.rodada.palavra_sorteada}'.")
             messagebox.showinfo("PARABÉNS!", f"VOCÊ ADIVINHOU A PALAVRA '{self.palavra_secreta.upper()}' EM {tempo_final:.2f} SEGUNDOS!")
             
-            is_last_multiplayer_word = False
-            if self.modo_jogo_selecionado.get() == 'multiplayer':
-                is_last_multiplayer_word = ((self.jogador_definidor_idx + 1) % len(self.jogadores)) == 0
+            is_last_multiplayer_word = self.partida.ultima_rodada
 
             if self.som_vitoria_palavra and (self.modo_jogo_selecionado.get() == 'solo' or not is_last_multiplayer_word):
-                self.som_vitoria_palavra.play()
+                self.audio.tocar('som_vitoria_palavra')
                 logging.info(f"Som de vitória de palavra acionado para '{self.palavra_secreta}'.")
             elif is_last_multiplayer_word and self.som_fim_jogo:
                 logging.info(f"Última palavra multiplayer acertada. Som de vitória de palavra suprimido para priorizar som de fim de jogo.")
 
-            logging.info(f"Rodada para {self.jogadores[self.jogador_atual_idx]['nome']} encerrada: ADIVINHOU. Tempo: {tempo_final:.2f}s, Erros: {erros_final}.")
+            logging.info(f"Rodada para {jogador.nome} encerrada: ADIVINHOU. Tempo: {tempo_final:.2f}s, Erros: {erros_final}.")
         else:
-            resultado_rodada = "INCOMPLETA"
-            tempo_final = self.tempo_total_jogador_atual
-            erros_final = self.erros_rodada_atual
-            logging.warning(f"Rodada para {self.jogadores[self.jogador_atual_idx]['nome']} encerrada: INCOMPLETA. Palavra era '{self.palavra_secreta}'. Tempo: {tempo_final:.2f}s, Erros: {erros_final}.")
+            logging.warning(f"Rodada para {jogador.nome} encerrada: INCOMPLETA. Palavra era '{self.palavra_secreta}'. Tempo: {tempo_final:.2f}s, Erros: {erros_final}.")
             for i, char in enumerate(self.palavra_secreta):
                 if i < len(self.palavra_adivinhada_entries):
                     self.palavra_adivinhada_entries[i].config(state='normal', bg=COR_VERMELHO_ERRO, fg="white")
                     self.entry_vars_adivinhacao[i].set(char)
                     self.palavra_adivinhada_entries[i].config(state='disabled')
 
-        self.jogadores[self.jogador_atual_idx]['erros_rodada'] = erros_final
-        self.jogadores[self.jogador_atual_idx]['tempo_rodada'] = tempo_final
-        self.jogadores[self.jogador_atual_idx]['palavra_adivinhada_rodada'] = self.palavra_secreta
-        self.jogadores[self.jogador_atual_idx]['status_rodada'] = resultado_rodada
+        if self.reproducao is not None:
+            # Reprodução não entra no ranking nem no placar
+            self.root.after(100, self._encerrar_reproducao)
+            return
 
-        if self.modo_jogo_selecionado.get() == 'solo':
-            self.jogadores[self.jogador_atual_idx]['tempo_total'] = tempo_final
-            self.jogadores[self.jogador_atual_idx]['erros_acumulados'] = erros_final
+        self.partida.registrar_resultado(self.rodada)
 
-            if resultado_rodada == "ADIVINHOU" and tempo_final != float('inf'):
+        if self.modo_jogo_selecionado.get() == 'solo':
+            if resultado_rodada == STATUS_ADIVINHOU and tempo_final != float('inf'):
                 self.adicionar_ao_ranking(
-                    self.jogadores[self.jogador_atual_idx]['nome'],
-                    self.jogadores[self.jogador_atual_idx]['tempo_total'],
-                    self.jogadores[self.jogador_atual_idx]['erros_acumulados'],
-                    self.jogadores[self.jogador_atual_idx]['dificuldade_rodada'],
-                    self.jogadores[self.jogador_atual_idx]['palavra_adivinhada_rodada']
+                    jogador.nome,
+                    jogador.tempo_total,
+                    jogador.erros_acumulados,
+                    jogador.dificuldade_rodada,
+                    jogador.palavra_adivinhada_rodada,
+                    gravacao
                 )
                 self.salvar_ranking()
-                logging.info(f"Resultado solo salvo para ranking: {self.jogadores[self.jogador_atual_idx]['nome']}, {tempo_final:.2f}s, {erros_final} erros, Dificuldade: {self.jogadores[self.jogador_atual_idx]['dificuldade_rodada']}, Palavra: {self.jogadores[self.jogador_atual_idx]['palavra_adivinhada_rodada']}.")
+                logging.info(f"Resultado solo salvo para ranking: {jogador.nome}, {tempo_final:.2f}s, {erros_final} erros, Dificuldade: {jogador.dificuldade_rodada}, Palavra: {jogador.palavra_adivinhada_rodada}.")
             else:
-                logging.info(f"Resultado solo não salvo no ranking: {self.jogadores[self.jogador_atual_idx]['nome']} (Status: {resultado_rodada}).")
+                logging.info(f"Resultado solo não salvo no ranking: {jogador.nome} (Status: {resultado_rodada}).")
 
             self.root.after(100, self.mostrar_placar_final_solo)
 
         else:
-            self.jogador_definidor_idx = (self.jogador_definidor_idx + 1) % len(self.jogadores)
-            logging.info(f"Definidor avançou para o índice: {self.jogador_definidor_idx}. Agora {self.jogadores[self.jogador_definidor_idx]['nome']} é o definidor.")
+            partida_encerrada = self.partida.avancar_definidor()
+            logging.info(f"Definidor avançou para o índice: {self.jogador_definidor_idx}. Agora {self.jogadores[self.jogador_definidor_idx].nome} é o definidor.")
             
-            if self.jogador_definidor_idx == 0:
+            if partida_encerrada and self.confronto_torneio is not None:
+                logging.info("Duelo do torneio finalizado.")
+                self.root.after(100, self.registrar_confronto_torneio)
+            elif partida_encerrada:
                 logging.info("Partida multiplayer finalizada. Todos os jogadores definiram e adivinharam uma palavra.")
                 self.root.after(100, self.mostrar_placar_final_multiplayer)
             else:
-                logging.info(f"Rodada concluída. Próxima rodada: {self.jogadores[self.jogador_definidor_idx]['nome']} definirá a palavra.")
+                logging.info(f"Rodada concluída. Próxima rodada: {self.jogadores[self.jogador_definidor_idx].nome} definirá a palavra.")
                 self.root.after(100, self.iniciar_fase_definicao_palavra)
 
+    # ============================================================================
+    # REPRODUÇÃO DE RODADAS GRAVADAS
+    # ============================================================================
+
+    def reproduzir_gravacao(self, gravacao, velocidade=None):
+        """Refaz uma rodada de gravacoes.bin nesta tela, letra por letra (velocidade None = o mais rápido possível).
+
+        O relógio da rodada é virtual (os instantes da gravação), então tempo
+        e erros exibidos são os gravados em qualquer velocidade; só o ritmo
+        das letras na tela muda.
+        """
+        logging.info(f"Reproduzindo gravação @{gravacao.deslocamento}: {gravacao.jogador}, '{gravacao.palavra}', "
+                     f"{len(gravacao.eventos)} letras, velocidade {velocidade or 'máxima'}.")
+        self.iniciar_selecao_modo()
+        self.modo_jogo_selecionado.set(gravacao.modo)
+        self.dificuldade_selecionada.set(gravacao.dificuldade or self.dificuldade_selecionada.get())
+        self.nova_partida([gravacao.jogador])
+        agora = [0.0]
+        self.partida.relogio = lambda: agora[0]
+        self.partida.definir_palavra(gravacao.palavra, gravacao.dificuldade)
+        self.reproducao = gravacao
+        self.iniciar_rodada_adivinhacao()
+        self.iniciar_partida_jogador()
+        inicio = time.perf_counter()
+
+        def proxima(i):
+            if self.reproducao is not gravacao or self.rodada is None or self.rodada.encerrada:
+                return
+            if i == len(gravacao.eventos):
+                # Sem letra final: desistência ou rodada interrompida
+                agora[0] = gravacao.duracao_ns / 1e9
+                if gravacao.status == STATUS_DESISTIU:
+                    self.rodada.give_up()
+                self.verificar_fim_de_rodada()
+                return
+            evento = gravacao.eventos[i]
+            # A última letra encerra a rodada: o fim gravado é o instante em que ela foi conferida
+            ultima = i + 1 == len(gravacao.eventos)
+            agora[0] = (gravacao.duracao_ns if ultima else evento.instante_ns) / 1e9
+            idx = self.indice_atual
+            if idx < len(self.entry_vars_adivinhacao):
+                self.entry_vars_adivinhacao[idx].set(evento.letra)
+                self.verificar_letra(evento.letra, idx)
+            if i + 1 < len(gravacao.eventos) and velocidade:
+                atraso = inicio + gravacao.eventos[i + 1].instante_ns / 1e9 / velocidade - time.perf_counter()
+            elif velocidade:
+                atraso = inicio + gravacao.duracao_ns / 1e9 / velocidade - time.perf_counter()
+            else:
+                atraso = 0
+            self.root.after(max(0, int(atraso * 1000)), proxima, i + 1)
+
+        primeiro = gravacao.eventos[0].instante_ns if gravacao.eventos else gravacao.duracao_ns
+        self.root.after(int(primeiro / 1e6 / velocidade) if velocidade else 0, proxima, 0)
+
+    def _encerrar_reproducao(self):
+        gravacao, self.reproducao = self.reproducao, None
+        if gravacao is None:
+            return
+        tempo, erros = self.rodada.tempo_final(), self.rodada.erros
+        confere = self.rodada.status == gravacao.status and erros == gravacao.erros
+        logging.info(f"Reprodução concluída: {self.rodada.status}, {tempo:.3f}s, {erros} erros (gravado: "
+                     f"{gravacao.status}, {gravacao.tempo():.3f}s, {gravacao.erros} erros).")
+        tempo_texto = "-" if tempo == float('inf') else f"{tempo:.2f}S"
+        messagebox.showinfo("REPRODUÇÃO CONCLUÍDA",
+                            f"{gravacao.jogador}: {self.rodada.status}, {tempo_texto}, {erros} ERRO(S).\n"
+                            + ("CONFERE COM A GRAVAÇÃO." if confere else "NÃO CONFERE COM A GRAVAÇÃO!"))
+        self.iniciar_selecao_modo()
+
     # ============================================================================
     # MÉTODOS DE RANKING
     # ============================================================================
@@ -1679,18 +2082,21 @@ class GameApp:
             logging.error(f"NÃO FOI POSSÍVEL SALVAR O RANKING: {e}", exc_info=True)
             messagebox.showerror("ERRO DE SALVAMENTO", f"NÃO FOI POSSÍVEL SALVAR O RANKING: {e}")
 
-    def adicionar_ao_ranking(self, nome, tempo, erros, dificuldade, palavra):
+    def adicionar_ao_ranking(self, nome, tempo, erros, dificuldade, palavra, gravacao=None):
         priorizar_comuns = self.config.obter_config("jogo", "usar_palavras_comuns", False)
         modo = 'comum_on' if priorizar_comuns else 'comum_off'
         logging.info(f"Adicionando ao ranking ({modo}): {nome}, Tempo: {tempo}, Erros: {erros}, Dificuldade: {dificuldade}, Palavra: {palavra}")
         if dificuldade not in self.ranking_solo[modo]:
             self.ranking_solo[modo][dificuldade] = []
-        self.ranking_solo[modo][dificuldade].append({
+        entrada = {
             "nome": nome,
             "tempo": tempo,
             "erros": erros,
             "palavra": palavra
-        })
+        }
+        if gravacao is not None:
+            entrada["gravacao"] = gravacao  # Posição da rodada em gravacoes.bin (ver verificar_ranking.py)
+        self.ranking_solo[modo][dificuldade].append(entrada)
         self.ranking_solo[modo][dificuldade].sort(key=lambda x: (x['tempo'], x['erros']))
         self.ranking_solo[modo][dificuldade] = self.ranking_solo[modo][dificuldade][:10]
         logging.info(f"Ranking atualizado para {dificuldade} ({modo}): {self.ranking_solo[modo][dificuldade]}.")
@@ -1711,16 +2117,16 @@ class GameApp:
             logging.info("Timer parado.")
 
     def iniciar_selecao_modo(self):
-        self.jogadores.clear()
-        self.jogador_definidor_idx = 0
+        self.desconectar_rede()
+        self.reproducao = None  # Letras ainda agendadas de uma reprodução param sozinhas
+        if self.gravador is not None:
+            self.gravador.descartar()  # Rodada abandonada no meio não é gravada
+        self.confronto_torneio = None  # Duelo abandonado fica pendente no torneio
+        self.nova_partida()
         self.limpar_tela()
 
         self._criar_frames_iniciais()
 
-        if self.musica_menu and self.config.obter_config("audio", "musica_ativada", True) and not pygame.mixer.get_busy():
-            self.musica_menu.play(-1)
-            logging.info("Música do menu iniciada.")
-
         # Título do jogo com emoji
         tk.Label(self.frame_selecao_modo, text="🎲 JOGO DE ADIVINHAÇÃO DE PALAVRAS", 
                 font=("Segoe UI", 32, "bold"), fg=COR_TEXTO_CLARO_DESTACADO, bg=COR_FUNDO_PRINCIPAL).pack(pady=30)
@@ -1731,6 +2137,10 @@ class GameApp:
                   command=lambda: self.iniciar_jogo_solo(), style="TButton").pack(pady=15)
         ttk.Button(self.frame_selecao_modo, text="👥 INICIAR JOGO MULTIPLAYER", 
                   command=lambda: self.iniciar_jogo_multiplayer(), style="TButton").pack(pady=15)
+        ttk.Button(self.frame_selecao_modo, text="🌐 JOGAR EM REDE", 
+                  command=self.mostrar_jogo_em_rede, style="TButton").pack(pady=15)
+        ttk.Button(self.frame_selecao_modo, text="🏆 TORNEIO",
+                  command=self.mostrar_torneio, style="TButton").pack(pady=15)
         # Botões secundários
         ttk.Button(self.frame_selecao_modo, text="⚙️ CONFIGURAÇÕES", 
                   command=self.mostrar_configuracoes, style="TButton").pack(pady=10)
@@ -1739,12 +2149,14 @@ class GameApp:
         ttk.Button(self.frame_selecao_modo, text="🚪 SAIR DO JOGO", 
                   command=self.confirmar_saida, style="TButton").pack(pady=10)
         self.frame_selecao_modo.pack(expand=True, fill='both', pady=20)
+        self.root.after_idle(self.tocar_musica_menu)
         logging.info("Tela inicial organizada exibida.")
 
     def iniciar_jogo_solo(self):
         """Inicia o jogo no modo solo"""
         logging.info("Iniciando jogo solo.")
         self.modo_jogo_selecionado.set("solo")
+        self.ativar_camadas_do_modo("solo")
         # Sempre garantir que a dificuldade selecionada seja a salva nas configurações
         self.dificuldade_selecionada.set(self.config.obter_config("jogo", "dificuldade_padrao"))
         self.mostrar_opcoes_multiplayer_e_nomes_e_dificuldade()
@@ -1753,6 +2165,7 @@ class GameApp:
         """Inicia o jogo no modo multiplayer"""
         logging.info("Iniciando jogo multiplayer.")
         self.modo_jogo_selecionado.set("multiplayer")
+        self.ativar_camadas_do_modo("multiplayer")
         self.mostrar_opcoes_multiplayer_e_nomes_e_dificuldade()
 
     def _esconder_opcoes_nomes_multiplayer_e_botoes(self):
@@ -1772,7 +2185,7 @@ class GameApp:
     def mostrar_opcoes_multiplayer_e_nomes_e_dificuldade(self):
         logging.info(f"Exibindo opções para o modo: {self.modo_jogo_selecionado.get()}")
 
-        self.jogadores.clear()
+        self.nova_partida()
         self.entry_nomes_jogadores.clear()
 
         for widget in self.frame_entry_nomes.winfo_children():
@@ -1903,19 +2316,8 @@ class GameApp:
             logging.warning("Tentativa de finalizar cadastro com nomes incompletos.")
             return
 
-        self.jogadores.clear()
-        for entry in self.entry_nomes_jogadores:
-            self.jogadores.append({
-                'nome': entry.get().strip(),
-                'erros_rodada': 0,
-                'tempo_rodada': 0.0,
-                'palavra_a_adivinhar': '',
-                'dificuldade_rodada': '',
-                'tempo_total_partida': 0.0,
-                'erros_total_partida': 0,
-                'palavra_definida_por_mim': '' # Inicializa o campo para a palavra definida
-            })
-        logging.info(f"Jogadores cadastrados: {[j['nome'] for j in self.jogadores]}. Prosseguindo para fase de definição de palavra.")
+        self.nova_partida([entry.get().strip() for entry in self.entry_nomes_jogadores])
+        logging.info(f"Jogadores cadastrados: {[j.nome for j in self.jogadores]}. Prosseguindo para fase de definição de palavra.")
         self.iniciar_fase_definicao_palavra()
 
     # ============================================================================
@@ -1941,18 +2343,18 @@ class GameApp:
         tk.Label(content_frame, text="RESULTADO DA PARTIDA SOLO", font=("Arial", 20, "bold"), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=15)
         
         jogador = self.jogadores[0]
-        tempo_str = f"{jogador['tempo_rodada']:.2f} segundos" if isinstance(jogador['tempo_rodada'], float) else str(jogador['tempo_rodada'])
-        erros_str = str(jogador['erros_rodada']) if isinstance(jogador['erros_rodada'], int) else str(jogador['erros_rodada'])
+        tempo_str = f"{jogador.tempo_rodada:.2f} segundos" if isinstance(jogador.tempo_rodada, float) else str(jogador.tempo_rodada)
+        erros_str = str(jogador.erros_rodada) if isinstance(jogador.erros_rodada, int) else str(jogador.erros_rodada)
 
-        tk.Label(content_frame, text=f"JOGADOR: {jogador['nome'].upper()}", font=("Arial", 14), fg=COR_TEXTO_CLARO).pack(pady=3)
-        tk.Label(content_frame, text=f"PALAVRA: {jogador['palavra_a_adivinhar'].upper()}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
-        tk.Label(content_frame, text=f"DIFICULDADE: {jogador['dificuldade_rodada'].upper()}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
+        tk.Label(content_frame, text=f"JOGADOR: {jogador.nome.upper()}", font=("Arial", 14), fg=COR_TEXTO_CLARO).pack(pady=3)
+        tk.Label(content_frame, text=f"PALAVRA: {jogador.palavra_a_adivinhar.upper()}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
+        tk.Label(content_frame, text=f"DIFICULDADE: {jogador.dificuldade_rodada.upper()}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
         tk.Label(content_frame, text=f"TEMPO FINAL: {tempo_str}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
         tk.Label(content_frame, text=f"ERROS: {erros_str}", font=("Arial", 14), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=3)
 
         # Botão para ver definição da palavra
         def mostrar_definicao():
-            palavra = jogador['palavra_a_adivinhar']
+            palavra = jogador.palavra_a_adivinhar
             import webbrowser
             url = f"https://pt.wiktionary.org/wiki/{palavra.lower()}"
             webbrowser.open(url)
@@ -1961,7 +2363,7 @@ class GameApp:
         # Exibe apenas o ranking da dificuldade jogada
         priorizar_comuns = self.config.obter_config("jogo", "usar_palavras_comuns", False)
         modo = 'comum_on' if priorizar_comuns else 'comum_off'
-        dificuldade_atual = jogador['dificuldade_rodada']
+        dificuldade_atual = jogador.dificuldade_rodada
         texto_comuns = "(Prioriza Palavras Comuns)" if priorizar_comuns else "(Dicionário Completo)"
         tk.Label(content_frame, text=f"RANKING TOP 10 {texto_comuns} - {dificuldade_atual.upper()}", font=("Arial", 16, "bold"), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=15)
         top_10 = self.ranking_solo[modo].get(dificuldade_atual, [])[:10]
@@ -1982,14 +2384,10 @@ class GameApp:
 
         def tentar_novamente_solo():
             """Gera uma nova palavra para o mesmo jogador e dificuldade"""
-            logging.info(f"Tentando novamente para {self.jogadores[0]['nome']} na dificuldade {self.dificuldade_selecionada.get()}")
+            logging.info(f"Tentando novamente para {self.jogadores[0].nome} na dificuldade {self.dificuldade_selecionada.get()}")
             
             # Limpa os dados da rodada anterior
-            self.jogadores[0]['erros_rodada'] = 0
-            self.jogadores[0]['tempo_rodada'] = 0.0
-            self.jogadores[0]['palavra_a_adivinhar'] = ''
-            self.jogadores[0]['dificuldade_rodada'] = ''
-            self.jogadores[0]['status_rodada'] = ''
+            self.jogadores[0].limpar_rodada()
             
             # Gera nova palavra e inicia nova rodada
             self.iniciar_fase_definicao_palavra()
@@ -1998,8 +2396,8 @@ class GameApp:
         ttk.Button(botoes_frame, text="NOVO JOGO", command=self.iniciar_selecao_modo, style="TButton").pack(side=tk.LEFT, padx=10)
         ttk.Button(botoes_frame, text="SAIR DO JOGO", command=self.confirmar_saida, style="TButton").pack(side=tk.LEFT, padx=10)
         
-        if jogador['status_rodada'] == "INCOMPLETA" and self.som_fim_jogo:
-            self.som_fim_jogo.play()
+        if jogador.status_rodada == "INCOMPLETA" and self.som_fim_jogo:
+            self.audio.tocar('som_fim_jogo')
             logging.info("Som de fim de jogo acionado (derrota solo).")
 
         logging.info("Placar final solo exibido com Top 10 da dificuldade jogada.")
@@ -2011,7 +2409,7 @@ class GameApp:
         self.frame_placar_multiplayer.pack(expand=True, fill='both', pady=20)
 
         if self.som_fim_jogo:
-            self.som_fim_jogo.play()
+            self.audio.tocar('som_fim_jogo')
             logging.info("Som de fim de jogo acionado para o placar final multiplayer.")
 
         tk.Label(self.frame_placar_multiplayer, text="RESULTADO FINAL DA PARTIDA MULTIPLAYER", font=("Arial", 28, "bold"), bg=COR_FUNDO_PRINCIPAL, fg=COR_TEXTO_CLARO).pack(pady=28)
@@ -2040,44 +2438,27 @@ class GameApp:
         self.style.map("Treeview", background=[('selected', COR_AZUL_SUAVE_BOTOES)])
         self.style.configure("Treeview.Heading", font=("Arial", 15, "bold"), background=COR_AZUL_SUAVE_BOTOES, foreground="white")
 
-        for jogador in self.jogadores:
-            jogador['tempo_total_partida'] = 0.0
-            jogador['erros_total_partida'] = 0
-            if jogador['status_rodada'] == "ADIVINHOU" and jogador['tempo_rodada'] != float('inf'):
-                jogador['tempo_total_partida'] += jogador['tempo_rodada']
-                jogador['erros_total_partida'] += jogador['erros_rodada']
-            elif jogador['status_rodada'] == "INCOMPLETA":
-                jogador['tempo_total_partida'] = float('inf')
-                jogador['erros_total_partida'] = 9999
+        jogadores_ordenados, jogadores_incompletos_desistentes = self.partida.classificacao()
 
         # REGISTRA PALAVRAS USADAS NO MULTIPLAYER
         for jogador in self.jogadores:
-            palavra_definida = jogador.get('palavra_definida_por_mim', '')
+            palavra_definida = jogador.palavra_definida_por_mim
             if palavra_definida:
                 self.registrar_palavra_multiplayer(palavra_definida)
 
-        jogadores_ordenados = sorted(
-            [j for j in self.jogadores if j['status_rodada'] == "ADIVINHOU" and j['tempo_rodada'] != float('inf')], 
-            key=lambda x: (x['tempo_total_partida'], x['erros_total_partida'])
-        )
-
-        jogadores_incompletos_desistentes = sorted(
-            [j for j in self.jogadores if j['status_rodada'] != "ADIVINHOU" or j['tempo_rodada'] == float('inf')],
-            key=lambda x: x['nome']
-        )
         jogadores_para_exibir = jogadores_ordenados + jogadores_incompletos_desistentes
 
         for i, jogador in enumerate(jogadores_para_exibir):
-            tempo_str = f"{jogador['tempo_rodada']:.2f}s" if isinstance(jogador['tempo_rodada'], float) else str(jogador['tempo_rodada'])
-            erros_str = str(jogador['erros_rodada']) if isinstance(jogador['erros_rodada'], int) else str(jogador['erros_rodada'])
-            palavra_adivinhada_exibicao = jogador.get('palavra_a_adivinhar', 'N/A')
+            tempo_str = f"{jogador.tempo_rodada:.2f}s" if isinstance(jogador.tempo_rodada, float) else str(jogador.tempo_rodada)
+            erros_str = str(jogador.erros_rodada) if isinstance(jogador.erros_rodada, int) else str(jogador.erros_rodada)
+            palavra_adivinhada_exibicao = jogador.palavra_a_adivinhar or 'N/A'
             tree.insert('', tk.END, values=(
-                jogador['nome'].upper(),
+                jogador.nome.upper(),
                 palavra_adivinhada_exibicao.upper() if palavra_adivinhada_exibicao != 'N/A' else 'N/A',
-                jogador['dificuldade_rodada'].upper() if jogador['dificuldade_rodada'] else "N/A",
+                jogador.dificuldade_rodada.upper() if jogador.dificuldade_rodada else "N/A",
                 tempo_str,
                 erros_str,
-                jogador['status_rodada'].upper()
+                jogador.status_rodada.upper()
             ))
         
         tree.pack(pady=28, padx=28, fill='both', expand=True)
@@ -2085,9 +2466,9 @@ class GameApp:
         campeao = None
         if jogadores_ordenados:
             campeao = jogadores_ordenados[0]
-            tempo_campeao_str = f"{campeao['tempo_total_partida']:.2f}s" if isinstance(campeao['tempo_total_partida'], float) else str(campeao['tempo_total_partida'])
-            erros_campeao_str = str(campeao['erros_total_partida']) if isinstance(campeao['erros_total_partida'], int) else str(campeao['erros_total_partida'])
-            tk.Label(self.frame_placar_multiplayer, text=f"\nCAMPEÃO: {campeao['nome'].upper()}!", font=("Arial", 26, "bold"), fg=COR_VERDE_ACERTO, bg=COR_FUNDO_PRINCIPAL).pack(pady=14)
+            tempo_campeao_str = f"{campeao.tempo_total_partida:.2f}s" if isinstance(campeao.tempo_total_partida, float) else str(campeao.tempo_total_partida)
+            erros_campeao_str = str(campeao.erros_total_partida) if isinstance(campeao.erros_total_partida, int) else str(campeao.erros_total_partida)
+            tk.Label(self.frame_placar_multiplayer, text=f"\nCAMPEÃO: {campeao.nome.upper()}!", font=("Arial", 26, "bold"), fg=COR_VERDE_ACERTO, bg=COR_FUNDO_PRINCIPAL).pack(pady=14)
             tk.Label(self.frame_placar_multiplayer, text=f"TEMPO TOTAL: {tempo_campeao_str} - ERROS: {erros_campeao_str}", font=("Arial", 20), fg=COR_VERDE_ACERTO_CLARO, bg=COR_FUNDO_PRINCIPAL).pack(pady=7)
         else:
             tk.Label(self.frame_placar_multiplayer, text="\nNÃO FOUI POSSÍVEL DETERMINAR UM CAMPEÃO.", font=("Arial", 20, "bold"), fg=COR_AMARELO_AVISO, bg=COR_FUNDO_PRINCIPAL).pack(pady=14)
@@ -2124,6 +2505,547 @@ class GameApp:
         ttk.Button(button_frame, text="SAIR DO JOGO", command=self.confirmar_saida, style="TButton").pack(side=tk.RIGHT, padx=10, expand=True)
         logging.info("Placar final multiplayer exibido.")
 
+    # ============================================================================
+    # TORNEIO
+    # ============================================================================
+    # Cada confronto é um duelo multiplayer de dois jogadores, jogado aqui com
+    # as telas de sempre; o chaveamento e a classificação ficam em torneio.py.
+
+    def mostrar_torneio(self):
+        if self.torneio is not None:
+            self.mostrar_rodada_torneio()
+        else:
+            self.mostrar_inscricao_torneio()
+
+    def mostrar_inscricao_torneio(self):
+        from torneio import FORMATO_ELIMINATORIA, FORMATO_SUICO, FORMATO_TODOS_CONTRA_TODOS
+        logging.info("Exibindo inscrição do torneio.")
+        self.limpar_tela()
+        self._criar_frames_iniciais()
+        frame = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
+        frame.pack(expand=True, fill='both', pady=20)
+
+        tk.Label(frame, text="🏆 NOVO TORNEIO", font=("Arial", 24, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL).pack(pady=15)
+        tk.Label(frame, text="JOGADORES (UM NOME POR LINHA):", font=("Arial", 14), bg=COR_FUNDO_SECUNDARIO, fg=COR_TEXTO_CLARO).pack(pady=5)
+        texto_nomes = tk.Text(frame, width=40, height=12, font=("Arial", 14), bd=2, relief="solid", bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO)
+        texto_nomes.pack(pady=5)
+
+        formatos = {"SUÍÇO": FORMATO_SUICO, "TODOS CONTRA TODOS": FORMATO_TODOS_CONTRA_TODOS, "ELIMINATÓRIA (MATA-MATA)": FORMATO_ELIMINATORIA}
+        tk.Label(frame, text="FORMATO:", font=("Arial", 14), bg=COR_FUNDO_SECUNDARIO, fg=COR_TEXTO_CLARO).pack(pady=5)
+        formato_var = tk.StringVar(self.root, value="SUÍÇO")
+        ttk.Combobox(frame, textvariable=formato_var, values=list(formatos), state='readonly', width=30, font=("Arial", 14)).pack(pady=5)
+        tk.Label(frame, text="RODADAS DO SUÍÇO (0 = AUTOMÁTICO):", font=("Arial", 14), bg=COR_FUNDO_SECUNDARIO, fg=COR_TEXTO_CLARO).pack(pady=5)
+        rodadas_var = tk.IntVar(self.root, value=0)
+        ttk.Spinbox(frame, from_=0, to=30, textvariable=rodadas_var, width=5, font=("Arial", 14), state='readonly').pack(pady=5)
+
+        def criar():
+            from torneio import Torneio
+            nomes = [linha.strip().upper() for linha in texto_nomes.get("1.0", tk.END).splitlines() if linha.strip()]
+            try:
+                self.torneio = Torneio(nomes, formatos[formato_var.get()], rodadas_var.get() or None)
+            except ValueError as e:
+                messagebox.showwarning("INSCRIÇÃO INVÁLIDA", str(e).upper())
+                return
+            logging.info(f"Torneio criado: {len(nomes)} jogadores, formato {self.torneio.formato}, {self.torneio.total_rodadas} rodadas.")
+            self.torneio.proxima_rodada()
+            self.mostrar_rodada_torneio()
+
+        ttk.Button(frame, text="CRIAR TORNEIO", command=criar, style="TButton").pack(pady=10)
+        ttk.Button(frame, text="VOLTAR", command=self.iniciar_selecao_modo, style="TButton").pack(pady=5)
+        texto_nomes.focus_set()
+
+    def mostrar_rodada_torneio(self):
+        """Confrontos da rodada atual e a classificação (só o topo; a estrutura já vem ordenada)"""
+        torneio = self.torneio
+        self.limpar_tela()
+        self._criar_frames_iniciais()
+        frame = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
+        frame.pack(expand=True, fill='both', pady=20, padx=28)
+
+        titulo = "🏆 TORNEIO ENCERRADO" if torneio.encerrado else f"🏆 TORNEIO - RODADA {torneio.rodada} DE {torneio.total_rodadas}"
+        tk.Label(frame, text=titulo, font=("Arial", 24, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL).pack(pady=10)
+        if torneio.encerrado:
+            campeao = torneio.resultado_final()[0]
+            tk.Label(frame, text=f"CAMPEÃO: {campeao.nome}!", font=("Arial", 26, "bold"), fg=COR_VERDE_ACERTO, bg=COR_FUNDO_PRINCIPAL).pack(pady=10)
+
+        tabelas = tk.Frame(frame, bg=COR_FUNDO_PRINCIPAL)
+        tabelas.pack(expand=True, fill='both')
+        confrontos = ttk.Treeview(tabelas, columns=('Jogador A', 'Jogador B', 'Resultado'), show='headings', style="Treeview", height=15)
+        for col in ('Jogador A', 'Jogador B', 'Resultado'):
+            confrontos.heading(col, text=col, anchor='center')
+            confrontos.column(col, anchor='center', width=170)
+        por_item = {}
+        for confronto in torneio.confrontos:
+            if confronto.folga:
+                resultado = "FOLGA"
+            elif not confronto.jogado:
+                resultado = "A JOGAR"
+            else:
+                resultado = f"VENCEU {confronto.vencedor.nome}" if confronto.vencedor else "EMPATE"
+            item = confrontos.insert('', tk.END, values=(confronto.a.nome, confronto.b.nome if confronto.b else "-", resultado))
+            por_item[item] = confronto
+        confrontos.pack(side=tk.LEFT, fill='both', expand=True, padx=10)
+
+        colunas = ('Pos', 'Jogador', 'Pontos', 'V/E/D', 'Tempo', 'Erros')
+        tabela = ttk.Treeview(tabelas, columns=colunas, show='headings', style="Treeview", height=15)
+        for col in colunas:
+            tabela.heading(col, text=col, anchor='center')
+            tabela.column(col, anchor='center', width=150 if col == 'Jogador' else 80)
+        exibidos = torneio.resultado_final()[:MAX_CLASSIFICACAO_TORNEIO] if torneio.encerrado else torneio.classificacao.topo(MAX_CLASSIFICACAO_TORNEIO)
+        for posicao, participante in enumerate(exibidos, 1):
+            tabela.insert('', tk.END, values=(f"{posicao}º", participante.nome, participante.pontos,
+                                              f"{participante.vitorias}/{participante.empates}/{participante.derrotas}",
+                                              f"{participante.tempo_total:.2f}s", participante.erros_total))
+        tabela.pack(side=tk.LEFT, fill='both', expand=True, padx=10)
+
+        self.style.configure("Treeview", background=COR_FUNDO_SECUNDARIO, foreground=COR_TEXTO_CLARO, fieldbackground=COR_FUNDO_SECUNDARIO, font=("Arial", 14))
+        self.style.configure("Treeview.Heading", font=("Arial", 15, "bold"), background=COR_AZUL_SUAVE_BOTOES, foreground="white")
+
+        def jogar_selecionado():
+            selecionados = confrontos.selection()
+            confronto = por_item.get(selecionados[0]) if selecionados else None
+            if confronto is None or confronto.folga or confronto.jogado:
+                messagebox.showwarning("TORNEIO", "SELECIONE UM CONFRONTO AINDA NÃO JOGADO.")
+                return
+            self.jogar_confronto_torneio(confronto)
+
+        def proxima_rodada():
+            try:
+                torneio.proxima_rodada()
+            except ValueError as e:
+                messagebox.showwarning("TORNEIO", str(e).upper())
+                return
+            self.mostrar_rodada_torneio()
+
+        def encerrar():
+            if messagebox.askyesno("ENCERRAR TORNEIO?", "O TORNEIO ATUAL SERÁ DESCARTADO. CONTINUAR?"):
+                self.torneio = None
+                self.iniciar_selecao_modo()
+
+        botoes = tk.Frame(frame, bg=COR_FUNDO_PRINCIPAL)
+        botoes.pack(side=tk.BOTTOM, pady=10)
+        if not torneio.encerrado:
+            ttk.Button(botoes, text="JOGAR CONFRONTO SELECIONADO", command=jogar_selecionado, style="TButton").pack(side=tk.LEFT, padx=10)
+            if torneio.pendentes == 0:
+                ttk.Button(botoes, text="PRÓXIMA RODADA", command=proxima_rodada, style="TButton").pack(side=tk.LEFT, padx=10)
+        ttk.Button(botoes, text="ENCERRAR TORNEIO", command=encerrar, style="TButton").pack(side=tk.LEFT, padx=10)
+        ttk.Button(botoes, text="VOLTAR AO MENU", command=self.iniciar_selecao_modo, style="TButton").pack(side=tk.LEFT, padx=10)
+
+    def jogar_confronto_torneio(self, confronto):
+        logging.info(f"Torneio, rodada {confronto.rodada}: {confronto.a.nome} x {confronto.b.nome}.")
+        self.modo_jogo_selecionado.set("multiplayer")
+        self.ativar_camadas_do_modo("multiplayer")
+        self.nova_partida([confronto.a.nome, confronto.b.nome])
+        self.confronto_torneio = confronto
+        self.iniciar_fase_definicao_palavra()
+
+    def registrar_confronto_torneio(self):
+        from torneio import ResultadoDuelo
+        confronto, self.confronto_torneio = self.confronto_torneio, None
+        resultados = [ResultadoDuelo(j.status_rodada, j.tempo_rodada, j.erros_rodada) for j in self.jogadores]
+        vencedor = self.torneio.registrar(confronto, *resultados)
+        for jogador in self.jogadores:
+            if jogador.palavra_definida_por_mim:
+                self.registrar_palavra_multiplayer(jogador.palavra_definida_por_mim)
+        logging.info(f"Torneio: {confronto.a.nome} x {confronto.b.nome} -> {vencedor.nome if vencedor else 'empate'}.")
+        if self.som_fim_jogo:
+            self.audio.tocar('som_fim_jogo')
+        messagebox.showinfo("RESULTADO DO DUELO", f"VENCEU {vencedor.nome}!" if vencedor else "EMPATE!")
+        self.mostrar_rodada_torneio()
+
+    # ============================================================================
+    # JOGO EM REDE (CLIENTE FINO)
+    # ============================================================================
+    # O servidor (servidor.py) decide palavra, acertos, tempo e placar; aqui só
+    # se envia o que o jogador fez e se exibe o que chega (protocolo em rede.py).
+
+    def mostrar_jogo_em_rede(self):
+        logging.info("Exibindo tela de conexão do jogo em rede.")
+        self.limpar_tela()
+        self._criar_frames_iniciais()
+        frame = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
+        frame.pack(expand=True, fill='both', pady=20)
+
+        tk.Label(frame, text="🌐 JOGAR EM REDE", font=("Arial", 24, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL).pack(pady=20)
+        campos = {}
+        for chave, rotulo, valor in (("servidor", "SERVIDOR (HOST:PORTA):", self.config.obter_config("rede", "servidor")),
+                                     ("sala", "CÓDIGO DA SALA (VAZIO = CRIAR UMA NOVA):", ""),
+                                     ("nome", "SEU NOME:", self.config.obter_config("perfil", "nome_padrao"))):
+            tk.Label(frame, text=rotulo, font=("Arial", 14), bg=COR_FUNDO_SECUNDARIO, fg=COR_TEXTO_CLARO).pack(pady=5)
+            var = tk.StringVar(self.root, value=valor)
+            entry = tk.Entry(frame, textvariable=var, font=("Arial", 16), bd=2, relief="solid", bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO, justify='center')
+            entry.pack(pady=5)
+            entry.bind("<Return>", lambda event: conectar())
+            campos[chave] = var
+
+        label_status = tk.Label(frame, text="", font=("Arial", 12, "bold"), fg=COR_VERMELHO_ERRO, bg=COR_FUNDO_PRINCIPAL)
+        label_status.pack(pady=5)
+        btn_conectar = ttk.Button(frame, text="CONECTAR", command=lambda: conectar(), style="TButton")
+        btn_conectar.pack(pady=10)
+        btn_assistir = ttk.Button(frame, text="👁 SÓ ASSISTIR A SALA", command=lambda: conectar(assistir=True), style="TButton")
+        btn_assistir.pack(pady=5)
+        ttk.Button(frame, text="VOLTAR", command=self.iniciar_selecao_modo, style="TButton").pack(pady=5)
+
+        def conectar(assistir=False):
+            from rede import ClienteRede, separar_endereco
+            try:
+                host, porta = separar_endereco(campos["servidor"].get())
+            except ValueError:
+                label_status.config(text="ENDEREÇO INVÁLIDO. USE HOST:PORTA.")
+                return
+            sala = campos["sala"].get().strip().upper()
+            nome = campos["nome"].get().strip().upper() or "JOGADOR"
+            if assistir and not sala:
+                label_status.config(text="DIGITE O CÓDIGO DA SALA QUE QUER ASSISTIR.", fg=COR_VERMELHO_ERRO)
+                return
+            self.config.definir_config("rede", "servidor", f"{host}:{porta}")
+            label_status.config(text="CONECTANDO...", fg=COR_TEXTO_CLARO)
+            btn_conectar.config(state='disabled')
+            btn_assistir.config(state='disabled')
+
+            def conectado(cliente, erro):
+                if erro is not None:
+                    logging.error(f"Falha ao conectar em {host}:{porta}: {erro}")
+                    if label_status.winfo_exists():
+                        label_status.config(text=f"NÃO FOI POSSÍVEL CONECTAR: {erro}", fg=COR_VERMELHO_ERRO)
+                        btn_conectar.config(state='normal')
+                        btn_assistir.config(state='normal')
+                    return
+                self.cliente_rede = cliente
+                self.nome_rede = nome
+                if assistir:
+                    cliente.enviar('assistir', sala=sala)
+                    self._montar_tela_espectador()
+                else:
+                    cliente.enviar('entrar', sala=sala, nome=nome)
+                    self._montar_tela_rede()
+                self._receber_mensagens_rede()
+
+            self.executar_em_segundo_plano(lambda: ClienteRede(host, porta), conectado)
+
+    def _montar_tela_rede(self):
+        """Saguão e rodada numa tela só; as partes aparecem conforme as mensagens do servidor"""
+        self.limpar_tela()
+        self._criar_frames_iniciais()
+        self.frame_rede = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
+        self.frame_rede.pack(expand=True, fill='both', pady=20)
+        f = self.frame_rede
+
+        self.label_sala_rede = tk.Label(f, text="ENTRANDO NA SALA...", font=("Arial", 20, "bold"), fg=COR_TEXTO_CLARO_DESTACADO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_sala_rede.pack(pady=10)
+        self.label_jogadores_rede = tk.Label(f, text="", font=("Arial", 14), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_jogadores_rede.pack(pady=5)
+        self.label_status_rede = tk.Label(f, text="", font=("Arial", 18, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL, wraplength=900)
+        self.label_status_rede.pack(pady=10)
+
+        self.frame_definir_rede = tk.Frame(f, bg=COR_FUNDO_PRINCIPAL)
+        self.palavra_rede_var = tk.StringVar(self.root)
+        entry = tk.Entry(self.frame_definir_rede, textvariable=self.palavra_rede_var, font=("Arial", 24), bd=2, relief="solid",
+                         bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO, justify='center', show="*")
+        entry.pack(side=tk.LEFT, padx=5)
+        entry.bind("<Return>", lambda event: self._enviar_palavra_rede())
+        ttk.Button(self.frame_definir_rede, text="ENVIAR PALAVRA", command=self._enviar_palavra_rede, style="TButton").pack(side=tk.LEFT, padx=5)
+        self.entry_palavra_rede = entry
+
+        self.label_tempo_rede = tk.Label(f, text="", font=("Arial", 16), fg=COR_TEXTO_CLARO_DESTACADO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_tempo_rede.pack(pady=5)
+        self.frame_casas_rede = tk.Frame(f, bg=COR_FUNDO_SECUNDARIO)
+        self.frame_casas_rede.pack(pady=10)
+        self.frame_letras_rede = tk.Frame(f, bg=COR_FUNDO_PRINCIPAL)
+        self.frame_letras_rede.pack(pady=10)
+        self.label_placar_rede = tk.Label(f, text="", font=("Arial", 14), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL, justify=tk.LEFT)
+        self.label_placar_rede.pack(pady=10)
+
+        self.frame_botoes_rede = tk.Frame(f, bg=COR_FUNDO_PRINCIPAL)
+        self.frame_botoes_rede.pack(side=tk.BOTTOM, pady=10)
+        self.btn_iniciar_rede = ttk.Button(self.frame_botoes_rede, text="INICIAR PARTIDA (TURNOS)", command=lambda: self.cliente_rede.enviar('iniciar', modo='turnos'), style="TButton")
+        self.btn_corrida_rede = ttk.Button(self.frame_botoes_rede, text="INICIAR CORRIDA (TODOS AO MESMO TEMPO)", command=lambda: self.cliente_rede.enviar('iniciar', modo='corrida'), style="TButton")
+        self.btn_desistir_rede = ttk.Button(self.frame_botoes_rede, text="DESISTIR DA RODADA", command=lambda: self.cliente_rede.enviar('desistir'), style="TButton")
+        ttk.Button(self.frame_botoes_rede, text="SAIR DA SALA", command=self.iniciar_selecao_modo, style="TButton").pack(side=tk.RIGHT, padx=10)
+
+        self.casas_rede = []
+        self.inicio_rodada_rede = None
+        self.minha_vez_rede = False
+        self.estado_espectador = None
+        self.root.bind("<KeyPress>", self._tecla_rede)
+
+    def _montar_tela_espectador(self):
+        """Só leitura: o servidor manda o estado da sala ao entrar e depois só o que mudou"""
+        self.limpar_tela()
+        self._criar_frames_iniciais()
+        f = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
+        f.pack(expand=True, fill='both', pady=20)
+
+        self.label_sala_rede = tk.Label(f, text="CONECTANDO À SALA...", font=("Arial", 20, "bold"), fg=COR_TEXTO_CLARO_DESTACADO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_sala_rede.pack(pady=10)
+        self.label_jogadores_rede = tk.Label(f, text="", font=("Arial", 14), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_jogadores_rede.pack(pady=5)
+        self.label_status_rede = tk.Label(f, text="", font=("Arial", 18, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL, wraplength=900)
+        self.label_status_rede.pack(pady=10)
+        self.label_tempo_rede = tk.Label(f, text="", font=("Arial", 16), fg=COR_TEXTO_CLARO_DESTACADO, bg=COR_FUNDO_PRINCIPAL)
+        self.label_tempo_rede.pack(pady=5)
+        self.label_adivinhadores_rede = tk.Label(f, text="", font=("Courier", 18, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_SECUNDARIO, justify=tk.LEFT, padx=20, pady=10)
+        self.label_adivinhadores_rede.pack(pady=10)
+        self.label_placar_rede = tk.Label(f, text="", font=("Arial", 14), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL, justify=tk.LEFT)
+        self.label_placar_rede.pack(pady=10)
+        ttk.Button(f, text="PARAR DE ASSISTIR", command=self.iniciar_selecao_modo, style="TButton").pack(side=tk.BOTTOM, pady=10)
+
+        self.inicio_rodada_rede = None
+        self.estado_espectador = {}
+        self.versao_espectador = -1
+
+    def _receber_mensagens_rede(self):
+        if self.cliente_rede is None:
+            return
+        for mensagem in self.cliente_rede.receber():
+            tratador = getattr(self, f"_rede_{mensagem['tipo']}", None)
+            if tratador is None:
+                logging.debug(f"Mensagem do servidor ignorada: {mensagem['tipo']}")
+                continue
+            tratador(mensagem)
+            if self.cliente_rede is None:
+                return
+        self.root.after(INTERVALO_REDE_MS, self._receber_mensagens_rede)
+
+    def desconectar_rede(self):
+        """Sai da sala ao voltar ao menu, por qualquer caminho"""
+        if self.cliente_rede is not None:
+            logging.info("Saindo do jogo em rede.")
+            self.cliente_rede.fechar()
+            self.cliente_rede = None
+            self.root.unbind("<KeyPress>")
+
+    def _enviar_palavra_rede(self):
+        palavra = self.palavra_rede_var.get().strip()
+        if not palavra:
+            messagebox.showwarning("ENTRADA VAZIA", "POR FAVOR, DIGITE UMA PALAVRA.")
+            return
+        self.cliente_rede.enviar('palavra', palavra=palavra)
+
+    def _tecla_rede(self, event):
+        if self.minha_vez_rede and len(event.char) == 1 and event.char.isalpha():
+            self.cliente_rede.enviar('letra', letra=event.char.upper())
+
+    def _atualizar_tempo_rede(self):
+        """Relógio só de exibição; o tempo que vale é o que o servidor devolve"""
+        if self.inicio_rodada_rede is None or not self.label_tempo_rede.winfo_exists():
+            return
+        self.label_tempo_rede.config(text=f"TEMPO: {time.monotonic() - self.inicio_rodada_rede:.1f}S")
+        self.root.after(100, self._atualizar_tempo_rede)
+
+    # Uma função por tipo de mensagem do servidor (_rede_<tipo>)
+
+    def _rede_entrou(self, mensagem):
+        self.label_sala_rede.config(text=f"SALA {mensagem['sala']}")
+
+    def _rede_sala(self, mensagem):
+        self.label_jogadores_rede.config(text="JOGADORES: " + ", ".join(mensagem['jogadores']))
+        if mensagem['anfitriao'] == self.nome_rede and not mensagem['em_jogo']:
+            self.btn_iniciar_rede.pack(side=tk.LEFT, padx=10)
+            self.btn_corrida_rede.pack(side=tk.LEFT, padx=10)
+        else:
+            self.btn_iniciar_rede.pack_forget()
+            self.btn_corrida_rede.pack_forget()
+        if not mensagem['em_jogo'] and not self.label_placar_rede.cget("text"):
+            self.label_status_rede.config(text="AGUARDANDO O ANFITRIÃO INICIAR A PARTIDA...")
+
+    def _rede_definir(self, mensagem):
+        self.label_placar_rede.config(text="")
+        self.label_status_rede.config(text=f"DEFINA A PALAVRA SECRETA PARA {mensagem['adivinhador']}:")
+        self.palavra_rede_var.set("")
+        self.frame_definir_rede.pack(after=self.label_status_rede, pady=10)
+        self.entry_palavra_rede.focus_set()
+
+    def _rede_aguardando(self, mensagem):
+        self.label_placar_rede.config(text="")
+        self.label_status_rede.config(text=f"{mensagem['definidor']} ESTÁ ESCOLHENDO A PALAVRA DE {mensagem['adivinhador']}...")
+
+    def _rede_rodada(self, mensagem):
+        self.frame_definir_rede.pack_forget()
+        self.label_placar_rede.config(text="")
+        corrida = mensagem.get('modo') == 'corrida'
+        # Na corrida todos menos o definidor adivinham ao mesmo tempo
+        self.minha_vez_rede = mensagem['adivinhador'] == self.nome_rede or (corrida and mensagem['definidor'] != self.nome_rede)
+        for widget in self.frame_casas_rede.winfo_children() + self.frame_letras_rede.winfo_children():
+            widget.destroy()
+        self.casas_rede = [tk.Label(self.frame_casas_rede, text=" ", width=3, font=("Arial", 24, "bold"), bd=2, relief="solid",
+                                    bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO) for _ in range(mensagem['tamanho'])]
+        for casa in self.casas_rede:
+            casa.pack(side=tk.LEFT, padx=2)
+        for i, letra in enumerate(mensagem['letras']):
+            btn = ttk.Button(self.frame_letras_rede, text=letra, style="Letter.TButton",
+                             command=lambda l=letra: self.cliente_rede.enviar('letra', letra=l))
+            btn.grid(row=i // 10, column=i % 10, padx=3, pady=3)
+            if not self.minha_vez_rede:
+                btn.state(['disabled'])
+        if self.minha_vez_rede:
+            self.label_status_rede.config(text="SUA VEZ! DIGITE A PALAVRA LETRA POR LETRA.")
+            self.btn_desistir_rede.pack(side=tk.LEFT, padx=10)
+            if self.som_iniciar_rodada and self.config.obter_config("audio", "som_ativado", True):
+                self.audio.tocar('som_iniciar_rodada')
+        elif corrida:
+            self.label_status_rede.config(text="SEUS RIVAIS ESTÃO ADIVINHANDO A SUA PALAVRA AO MESMO TEMPO.")
+        else:
+            self.label_status_rede.config(text=f"{mensagem['adivinhador']} ESTÁ ADIVINHANDO A PALAVRA DE {mensagem['definidor']}.")
+        self.inicio_rodada_rede = time.monotonic()
+        self._atualizar_tempo_rede()
+
+    def _marcar_casa_rede(self, mensagem):
+        posicao = mensagem['posicao']
+        if posicao >= len(self.casas_rede):
+            return
+        casa = self.casas_rede[posicao]
+        if mensagem['acertou']:
+            casa.config(text=mensagem['letra_correta'], bg=COR_VERDE_ACERTO_CLARO, fg="white")
+        else:
+            casa.config(bg=COR_VERMELHO_ERRO)
+            self.root.after(200, lambda: casa.winfo_exists() and casa.cget("text") == " " and casa.config(bg=COR_FUNDO_ESCURO_INPUT))
+
+    def _rede_tentativa(self, mensagem):
+        self._marcar_casa_rede(mensagem)
+        if mensagem['acertou'] and mensagem['posicao'] + 1 >= len(self.casas_rede):
+            # Palavra completa: na corrida os outros ainda podem estar jogando
+            self.minha_vez_rede = False
+            self.btn_desistir_rede.pack_forget()
+            for btn in self.frame_letras_rede.winfo_children():
+                btn.state(['disabled'])
+        som = 'som_acerto' if mensagem['acertou'] else 'som_erro'
+        if self._som(som) and self.config.obter_config("audio", "som_ativado", True):
+            self.audio.tocar(som)
+        self.label_status_rede.config(text=f"ERROS: {mensagem['erros']}  |  TEMPO NO SERVIDOR: {mensagem['tempo']:.2f}S")
+
+    def _rede_progresso(self, mensagem):
+        self._marcar_casa_rede(mensagem)
+        self.label_status_rede.config(text=f"{mensagem['adivinhador']} ESTÁ ADIVINHANDO... ERROS: {mensagem['erros']}")
+
+    def _rede_corrida(self, mensagem):
+        """Classificação ao vivo da corrida (enviada pelo servidor algumas vezes por segundo)"""
+        self.label_placar_rede.config(text=self._texto_classificacao_corrida("🏁 CORRIDA", mensagem['classificacao']))
+
+    def _texto_classificacao_corrida(self, titulo, classificacao):
+        linhas = [titulo]
+        for posicao, item in enumerate(classificacao, 1):
+            if item['tempo'] is not None:
+                situacao = f"TERMINOU EM {item['tempo']:.2f}S"
+            elif item['status']:
+                situacao = item['status']
+            else:
+                situacao = f"{item['posicao']} LETRA(S)"
+            linhas.append(f"{posicao}º {item['nome']}: {situacao}, {item['erros']} ERRO(S)")
+        return "\n".join(linhas)
+
+    def _rede_fim_rodada(self, mensagem):
+        self.minha_vez_rede = False
+        self.inicio_rodada_rede = None
+        self.btn_desistir_rede.pack_forget()
+        for casa, letra in zip(self.casas_rede, mensagem['palavra']):
+            casa.config(text=letra)
+        for btn in self.frame_letras_rede.winfo_children():
+            btn.state(['disabled'])
+        self.label_tempo_rede.config(text="")
+        if 'resultados' in mensagem:
+            self.label_status_rede.config(text=f"FIM DA CORRIDA! A PALAVRA ERA: {mensagem['palavra']}")
+            self.label_placar_rede.config(text=self._texto_classificacao_corrida("🏁 RESULTADO DA CORRIDA", mensagem['resultados']))
+            return
+        if mensagem['status'] == STATUS_ADIVINHOU:
+            resultado = f"{mensagem['jogador']} ADIVINHOU {mensagem['palavra']} EM {mensagem['tempo']:.2f}S COM {mensagem['erros']} ERRO(S)!"
+        else:
+            resultado = f"{mensagem['jogador']} DESISTIU! A PALAVRA ERA: {mensagem['palavra']}"
+        self.label_status_rede.config(text=resultado)
+
+    def _rede_placar(self, mensagem):
+        linhas = ["🏆 PLACAR FINAL"]
+        for posicao, item in enumerate(mensagem['classificacao'], 1):
+            if item['tempo'] is None:
+                linhas.append(f"{posicao}º {item['nome']}: {item['status'] or 'SEM RESULTADO'}")
+            elif 'adivinhadas' in item:
+                linhas.append(f"{posicao}º {item['nome']}: {item['adivinhadas']} PALAVRA(S) EM {item['tempo']:.2f}S, {item['erros']} ERRO(S)")
+            else:
+                linhas.append(f"{posicao}º {item['nome']}: {item['tempo']:.2f}S, {item['erros']} ERRO(S)")
+        self.label_placar_rede.config(text="\n".join(linhas))
+        if self.som_fim_jogo and self.config.obter_config("audio", "som_ativado", True):
+            self.audio.tocar('som_fim_jogo')
+
+    def _rede_estado(self, mensagem):
+        self.estado_espectador = dict(mensagem['s'])
+        self.versao_espectador = mensagem['v']
+        self._exibir_estado_espectador(mensagem['t'])
+
+    def _rede_delta(self, mensagem):
+        if mensagem['v'] <= self.versao_espectador:
+            return  # Já estava no estado completo recebido ao entrar
+        self.estado_espectador.update(mensagem['d'])
+        for chave in mensagem['r']:
+            self.estado_espectador.pop(chave, None)
+        self.versao_espectador = mensagem['v']
+        self._exibir_estado_espectador(mensagem['t'])
+
+    def _exibir_estado_espectador(self, decorrido):
+        estado = self.estado_espectador
+        corrida = estado['modo'] == 'corrida'
+        self.label_sala_rede.config(text=f"👁 SALA {estado['sala']}" + ("  |  🏁 CORRIDA" if corrida else ""))
+        self.label_jogadores_rede.config(text="JOGADORES: " + ", ".join(estado['jogadores']))
+        if estado['fase'] == 'rodada':
+            self.label_status_rede.config(text=f"PALAVRA DE {estado['definidor']}  |  LETRAS: {' '.join(estado['letras'])}")
+        elif estado['fase'] == 'definindo':
+            revelada = f"A ÚLTIMA PALAVRA ERA {estado['palavra']}. " if estado['palavra'] else ""
+            self.label_status_rede.config(text=f"{revelada}{estado['definidor']} ESTÁ ESCOLHENDO A PALAVRA...")
+        else:
+            self.label_status_rede.config(text="AGUARDANDO O ANFITRIÃO INICIAR A PARTIDA...")
+
+        # O relógio corre aqui a partir do tempo decorrido que o servidor informou
+        if decorrido is None:
+            self.inicio_rodada_rede = None
+            self.label_tempo_rede.config(text="")
+        else:
+            rodando = self.inicio_rodada_rede is not None
+            self.inicio_rodada_rede = time.monotonic() - decorrido
+            if not rodando:
+                self._atualizar_tempo_rede()
+
+        tamanho = len(estado['letras'])
+        linhas = []
+        for chave in sorted(k for k in estado if k.startswith('c.')):
+            reveladas, erros, status, tempo = estado[chave]
+            casas = " ".join(reveladas.ljust(tamanho, "_"))
+            if tempo is not None:
+                situacao = f"TERMINOU EM {tempo:.2f}S"
+            else:
+                situacao = status or "ADIVINHANDO"
+            linhas.append(f"{chave[2:]:<12} {casas}   {erros} ERRO(S)  {situacao}")
+        self.label_adivinhadores_rede.config(text="\n".join(linhas))
+
+        linhas = []
+        for posicao, item in enumerate(estado['placar'] or [], 1):
+            if item['tempo'] is None:
+                linhas.append(f"{posicao}º {item['nome']}: {item['status'] or 'SEM RESULTADO'}")
+            elif 'adivinhadas' in item:
+                linhas.append(f"{posicao}º {item['nome']}: {item['adivinhadas']} PALAVRA(S) EM {item['tempo']:.2f}S, {item['erros']} ERRO(S)")
+            else:
+                linhas.append(f"{posicao}º {item['nome']}: {item['tempo']:.2f}S, {item['erros']} ERRO(S)")
+        self.label_placar_rede.config(text="\n".join(["🏆 PLACAR FINAL"] + linhas) if linhas else "")
+
+    def _rede_encerrada(self, mensagem):
+        if self.estado_espectador is not None:
+            self.inicio_rodada_rede = None
+            self.label_tempo_rede.config(text="")
+            self.label_status_rede.config(text=f"TRANSMISSÃO ENCERRADA: {mensagem['motivo'].upper()}")
+            return
+        self.minha_vez_rede = False
+        self.inicio_rodada_rede = None
+        self.frame_definir_rede.pack_forget()
+        self.btn_desistir_rede.pack_forget()
+        self.label_status_rede.config(text=f"PARTIDA ENCERRADA: {mensagem['motivo'].upper()}")
+
+    def _rede_erro(self, mensagem):
+        logging.warning(f"Servidor recusou a ação: {mensagem['mensagem']}")
+        messagebox.showwarning("SERVIDOR", mensagem['mensagem'].upper())
+
+    def _rede_desconectado(self, mensagem):
+        self.desconectar_rede()
+        messagebox.showerror("CONEXÃO PERDIDA", "A CONEXÃO COM O SERVIDOR FOI ENCERRADA.")
+        self.iniciar_selecao_modo()
+
     def mostrar_configuracoes(self):
         logging.info("Exibindo tela de configurações.")
         self.limpar_tela()
@@ -2217,17 +3139,37 @@ class GameApp:
         tk.Label(config_frame, text="Gerenciar Dicionários:", font=("Arial", 12, "bold"), 
                 fg=COR_TEXTO_CLARO, bg=COR_FUNDO_SECUNDARIO).pack(pady=5)
 
-        def baixar_dicionario_principal():
-            if self.baixar_dicionario():
-                messagebox.showinfo("SUCESSO", "Dicionário principal baixado com sucesso!")
-            else:
-                messagebox.showwarning("ERRO", "Não foi possível baixar o dicionário principal.")
-
         botoes_dicionario_frame = tk.Frame(config_frame, bg=COR_FUNDO_SECUNDARIO)
         botoes_dicionario_frame.pack(pady=5)
+        label_download = tk.Label(botoes_dicionario_frame, text="", font=("Arial", 11),
+                                  fg=COR_TEXTO_CLARO, bg=COR_FUNDO_SECUNDARIO)
+
+        def mostrar_progresso_download(baixados, total):
+            if not label_download.winfo_exists():
+                return
+            if total:
+                label_download.config(text=f"BAIXANDO... {baixados * 100 // total}% ({baixados // 1024} KB de {total // 1024} KB)")
+            else:
+                label_download.config(text=f"BAIXANDO... {baixados // 1024} KB")
 
-        ttk.Button(botoes_dicionario_frame, text="BAIXAR DICIONÁRIO PRINCIPAL", 
-                  command=baixar_dicionario_principal, style="TButton").pack(padx=5)
+        def download_concluido(erro, mensagem):
+            if botao_baixar.winfo_exists():
+                botao_baixar.config(state='normal')
+            if not label_download.winfo_exists():
+                return
+            if erro is None:
+                label_download.config(text=mensagem)
+            else:
+                label_download.config(text=f"NÃO FOI POSSÍVEL BAIXAR (tente de novo para continuar): {erro}")
+
+        def baixar_dicionario_principal():
+            botao_baixar.config(state='disabled')
+            self.baixar_dicionario(mostrar_progresso_download, download_concluido)
+
+        botao_baixar = ttk.Button(botoes_dicionario_frame, text="BAIXAR / ATUALIZAR DICIONÁRIO PRINCIPAL",
+                                  command=baixar_dicionario_principal, style="TButton")
+        botao_baixar.pack(padx=5)
+        label_download.pack(pady=5)
 
         # Botões de ação
         botoes_frame = tk.Frame(config_frame, bg=COR_FUNDO_SECUNDARIO)
@@ -2243,6 +3185,11 @@ class GameApp:
             self.config.definir_config("jogo", "penalidade_erro", penalidade_var.get())
             self.config.definir_config("jogo", "mostrar_dicas", mostrar_dicas_var.get())
             self.config.definir_config("jogo", "usar_palavras_comuns", usar_palavras_comuns_var.get())
+            # O volume fica gravado nos buffers: recarrega os sons se ele mudou. Sem banco (mixer
+            # ainda iniciando ou indisponível), o volume gravado acima é aplicado quando ele for criado
+            if self.banco_sons is not None and (volume_efeitos_var.get() != valores_originais["volume_efeitos"] or
+                                                volume_musica_var.get() != valores_originais["volume_musica"]):
+                self.trocar_volume_dos_sons(volume_efeitos_var.get(), volume_musica_var.get())
             # Troca a paleta e reaplica estilos (não há mais tema)
             self.aplicar_estilos_ttk()
             self.root.config(bg=COR_FUNDO_PRINCIPAL)
@@ -2309,14 +3256,14 @@ class GameApp:
         def depurar_dicionario():
             palavra_teste = 'pato'
             total = len(self.dicionario_palavras)
-            primeiras = sorted(list(self.dicionario_palavras))[:10]
+            primeiras = sorted(self.dicionario_palavras)[:10]
             contem_pato = 'SIM' if palavra_teste in self.dicionario_palavras else 'NÃO'
             msg = f"Total de palavras carregadas: {total}\n"
             msg += f"Primeiras palavras: {', '.join(primeiras)}\n"
             msg += f"A palavra '{palavra_teste}' está no dicionário: {contem_pato}"
             messagebox.showinfo("Depuração do Dicionário", msg)
 
-        ttk.Button(self.frame_configuracoes, text="Depurar Dicionário", command=depurar_dicionario, style="TButton").pack(pady=10)
+        ttk.Button(self.frame_configuracoes, text="Depurar Dicionário", command=lambda: self.quando_dicionario_pronto(depurar_dicionario), style="TButton").pack(pady=10)
 
     def mostrar_instrucoes(self):
         logging.info("Exibindo tela de instruções.")
@@ -2326,13 +3273,14 @@ class GameApp:
 
         tk.Label(self.frame_instrucoes, text="COMO JOGAR?", font=("Arial", 24, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL).pack(pady=20)
 
-        instrucoes_texto = """
+        instrucoes_texto = f"""
         BEM-VINDO(A) AO JOGO DE ADIVINHAÇÃO DE PALAVRAS - DESAFIO DE RIVAIS!
         
         MODO SOLO:
         1. O sistema escolherá uma palavra aleatória com base na dificuldade selecionada.
         2. As letras da palavra serão embaralhadas e exibidas.
         3. Seu objetivo é digitar a palavra correta, letra por letra, na ordem certa.
+           Se as letras formarem outra palavra válida (ex: ROMA e AMOR), ela também vale.
         4. Cada letra incorreta adicionará 3 segundos ao seu tempo final.
         5. O tempo é crucial para o ranking! Tente adivinhar o mais rápido possível.
         
@@ -2343,9 +3291,9 @@ class GameApp:
         4. Ao final da partida (quando todos definiram uma palavra), o jogador com o MENOR TEMPO acumulado nas rodadas em que ADIVINHOU (e menos erros em caso de empate) será o CAMPEÃO!
         
         DIFICULDADES:
-        - FÁCIL: Palavras de 4 a 5 letras (ex: casa, livro, mesa, porta)
-        - MÉDIO: Palavras de 4 a 10 letras (ex: computador, televisão, chocolate)
-        - DIFÍCIL: Palavras complexas de 6+ letras (ex: abduzir, acrimônia, ardiloso)
+        - FÁCIL: {REGRAS_DIFICULDADE['Fácil']['descricao']} (ex: casa, livro, mesa, porta)
+        - MÉDIO: {REGRAS_DIFICULDADE['Médio']['descricao']} (ex: cadeira, janela, abduzir)
+        - DIFÍCIL: {REGRAS_DIFICULDADE['Difícil']['descricao']} (ex: computador, televisão, chocolate)
         
         MULTIPLAYER:
         - Os jogadores definem suas próprias palavras
@@ -2370,9 +3318,10 @@ class GameApp:
     def confirmar_saida(self, forcar=False):
         logging.info("Usuário tentou fechar a janela. Confirmando saída.")
         if forcar or messagebox.askyesno("SAIR DO JOGO", "TEM CERTEZA QUE DESEJA SAIR?"):
-            if pygame.mixer.get_init():
-                pygame.mixer.quit()
-                logging.info("Pygame mixer encerrado.")
+            logging.info(f"Estatísticas de áudio: {self.audio.estatisticas()}")
+            if self.amostrador is not None:
+                self.alternar_amostrador()
+            self.audio.encerrar()
             self.root.destroy()
             logging.info("Confirmação de saída aceita. Encerrando aplicação.")
         else:
@@ -2406,6 +3355,11 @@ class GameApp:
         self.entry_palavra_secreta = tk.Entry(self.frame_jogador1, textvariable=self.palavra_secreta_var, font=("Arial", 24), bd=2, relief="solid", bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO, justify='center')
         self.entry_palavra_secreta.bind("<KeyRelease>", lambda event, var=self.palavra_secreta_var: self.on_entry_uppercase(var, event))
         self.entry_palavra_secreta.bind("<Return>", lambda event: self.processar_palavra_secreta())
+        self.entry_palavra_secreta.bind("<Tab>", self.aceitar_primeiro_autocompletar)
+        self.label_status_palavra = tk.Label(self.frame_jogador1, text="", font=("Arial", 12, "bold"), fg=COR_TEXTO_CLARO, bg=COR_FUNDO_PRINCIPAL)
+        self.listbox_completar = tk.Listbox(self.frame_jogador1, font=("Arial", 14), height=5, width=24, bg=COR_FUNDO_ESCURO_INPUT, fg=COR_TEXTO_CLARO,
+                                            selectbackground=COR_AZUL_SUAVE_BOTOES, selectforeground="white", activestyle='none', justify='center')
+        self.listbox_completar.bind("<<ListboxSelect>>", self.usar_autocompletar)
 
         # Frame Jogador 2 (Adivinhador da Palavra)
         self.frame_jogador2 = tk.Frame(self.root, bg=COR_FUNDO_PRINCIPAL)
@@ -2482,6 +3436,23 @@ class GameApp:
             pass
         return None
 
+    def alternar_amostrador(self, event=None):
+        """Liga/desliga o amostrador da thread principal; ao desligar grava as pilhas na pasta do jogo"""
+        if self.amostrador is None:
+            self.amostrador = perfil.Amostrador()
+            self.amostrador.iniciar()
+            logging.info("Amostrador de perfil ligado.")
+            return
+        amostrador, self.amostrador = self.amostrador, None
+        amostrador.parar()
+        caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), time.strftime(PADRAO_ARQUIVO_AMOSTRAS))
+        try:
+            amostrador.gravar(caminho)
+        except OSError as e:
+            logging.error(f"Não foi possível gravar o perfil em {caminho}: {e}")
+            return
+        logging.info(f"Amostrador de perfil desligado: {amostrador.resumo()}, gravado em {caminho}.")
+
     def mostrar_opcoes_esc(self, event=None):
         # Popup centralizado com confirmação de saída
         popup = tk.Toplevel(self.root)
@@ -2578,10 +3549,8 @@ class GameApp:
         palavra_secreta_gerada = self.gerar_palavra_sistema()
         self.fechar_carregando_palavra()
         if palavra_secreta_gerada:
-            self.jogadores[0]['palavra_a_adivinhar'] = palavra_secreta_gerada
-            self.jogadores[0]['dificuldade_rodada'] = self.dificuldade_selecionada.get()
-            self.jogador_atual_idx = 0
-            logging.info(f"Palavra solo '{palavra_secreta_gerada}' atribuída ao jogador {self.jogadores[0]['nome']}.")
+            self.partida.definir_palavra(palavra_secreta_gerada, self.dificuldade_selecionada.get())
+            logging.info(f"Palavra solo '{palavra_secreta_gerada}' atribuída ao jogador {self.jogadores[0].nome}.")
             self.iniciar_rodada_adivinhacao()
         else:
             logging.error("Falha ao gerar palavra para o jogo solo. Voltando ao menu.")
@@ -2606,8 +3575,19 @@ sys.excepthook = handle_exception
 
 # --- Início do Programa Principal ---
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = GameApp(root) # Cria uma instância da classe GameApp
+    import argparse
+    parser = argparse.ArgumentParser(description="Jogo de Adivinhação de Palavras - Desafio de Rivais")
+    parser.add_argument("--profile-startup", nargs="?", const=ARQUIVO_PERFIL_INICIALIZACAO, metavar="ARQUIVO",
+                        help="grava as fases da inicialização em JSON (Chrome trace; abra em chrome://tracing ou ui.perfetto.dev)")
+    argumentos = parser.parse_args()
+    configurar_logging()
+    if perfil.rastro is not None:
+        perfil.rastro.destino = argumentos.profile_startup
+        perfil.rastro.registrar("módulo game.py", 0, (time.perf_counter() - INICIO_PROCESSO) * 1e6)
+    with perfil.trecho("tk.Tk"):
+        root = tk.Tk()
+    with perfil.trecho("GameApp.__init__"):
+        app = GameApp(root) # Cria uma instância da classe GameApp
     
     logging.info("Entering root.mainloop()..")
     try:
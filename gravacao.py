@@ -0,0 +1,352 @@
+"""Gravação binária das rodadas (cada letra com o instante em nanossegundos) e reprodução.
+
+Cada rodada encerrada vira um registro acrescentado ao fim de
+`gravacoes.bin`; o arquivo nunca é reescrito. Um registro é:
+
+    MARCA (2 bytes) | tamanho (varint) | conteúdo | CRC32 do conteúdo (4 bytes)
+
+e o conteúdo:
+
+    versão, modo, status                     1 byte cada
+    início (time.time_ns)                    8 bytes
+    semente do embaralhamento                8 bytes
+    penalidade por erro (ms)                 2 bytes
+    duração (ns)                             varint
+    jogador, dificuldade, palavra, letras    texto (varint com o tamanho + UTF-8)
+    alternativas (anagramas aceitos)         varint com a quantidade + textos
+    eventos                                  varint com a quantidade + eventos
+
+Cada evento (uma letra enviada em verificar_letra) tem três varints: o
+intervalo desde o evento anterior em ns, o código da letra e
+posição * 2 + acertou. Uma tecla típica ocupa 6 bytes. Um registro
+truncado ou corrompido (queda de energia no meio da escrita) é pulado na
+leitura: procura-se a próxima MARCA com CRC válido.
+
+A reprodução refaz a rodada no motor com um relógio virtual (os mesmos
+tempos da gravação, em 1x ou na velocidade máxima). O GameApp também
+reproduz uma gravação na própria tela (GameApp.reproduzir_gravacao).
+
+Uso:
+    python gravacao.py listar
+    python gravacao.py reproduzir --indice -1              # última rodada, no motor, velocidade máxima
+    python gravacao.py reproduzir --indice 3 --velocidade 1
+    python gravacao.py reproduzir --indice -1 --tela       # na interface, em tempo real
+"""
+import argparse
+import logging
+import os
+import struct
+import sys
+import time
+import zlib
+
+from motor import Rodada, STATUS_ADIVINHOU, STATUS_INCOMPLETA, STATUS_DESISTIU
+
+ARQUIVO_GRAVACOES = "gravacoes.bin"
+MARCA = b'\xd7\x52'
+VERSAO = 1
+
+MODOS = ('solo', 'multiplayer')
+STATUS = (STATUS_ADIVINHOU, STATUS_INCOMPLETA, STATUS_DESISTIU)
+
+_CABECALHO = struct.Struct('<BBBQQH')  # versão, modo, status, início, semente, penalidade
+_CRC = struct.Struct('<I')
+
+
+def _varint(valor, saida):
+    while valor >= 0x80:
+        saida.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    saida.append(valor)
+
+
+def _ler_varint(dados, pos):
+    valor = deslocamento = 0
+    while True:
+        byte = dados[pos]
+        pos += 1
+        valor |= (byte & 0x7F) << deslocamento
+        if byte < 0x80:
+            return valor, pos
+        deslocamento += 7
+
+
+def _texto(texto, saida):
+    codificado = texto.encode('utf-8')
+    _varint(len(codificado), saida)
+    saida += codificado
+
+
+def _ler_texto(dados, pos):
+    tamanho, pos = _ler_varint(dados, pos)
+    return bytes(dados[pos:pos + tamanho]).decode('utf-8'), pos + tamanho
+
+
+class Evento:
+    """Uma letra enviada: `instante_ns` conta do início da rodada"""
+    __slots__ = ('instante_ns', 'letra', 'posicao', 'acertou')
+
+    def __init__(self, instante_ns, letra, posicao, acertou):
+        self.instante_ns = instante_ns
+        self.letra = letra
+        self.posicao = posicao
+        self.acertou = acertou
+
+
+class Gravacao:
+    """Uma rodada gravada; `deslocamento` é a posição do registro no arquivo (serve de identificador)"""
+    __slots__ = ('modo', 'status', 'inicio_ns', 'semente', 'penalidade_erro', 'duracao_ns', 'jogador',
+                 'dificuldade', 'palavra', 'letras', 'alternativas', 'eventos', 'deslocamento')
+
+    def __init__(self, modo, status, inicio_ns, semente, penalidade_erro, duracao_ns, jogador, dificuldade,
+                 palavra, letras, alternativas, eventos, deslocamento=None):
+        self.modo = modo
+        self.status = status
+        self.inicio_ns = inicio_ns
+        self.semente = semente
+        self.penalidade_erro = penalidade_erro
+        self.duracao_ns = duracao_ns
+        self.jogador = jogador
+        self.dificuldade = dificuldade
+        self.palavra = palavra
+        self.letras = letras
+        self.alternativas = alternativas
+        self.eventos = eventos
+        self.deslocamento = deslocamento
+
+    def codificar(self):
+        conteudo = bytearray(_CABECALHO.pack(VERSAO, MODOS.index(self.modo), STATUS.index(self.status),
+                                             self.inicio_ns, self.semente, round(self.penalidade_erro * 1000)))
+        _varint(self.duracao_ns, conteudo)
+        for texto in (self.jogador, self.dificuldade, self.palavra, self.letras):
+            _texto(texto, conteudo)
+        _varint(len(self.alternativas), conteudo)
+        for alternativa in self.alternativas:
+            _texto(alternativa, conteudo)
+        _varint(len(self.eventos), conteudo)
+        anterior = 0
+        for evento in self.eventos:
+            _varint(evento.instante_ns - anterior, conteudo)
+            _varint(ord(evento.letra), conteudo)
+            _varint(evento.posicao << 1 | evento.acertou, conteudo)
+            anterior = evento.instante_ns
+        registro = bytearray(MARCA)
+        _varint(len(conteudo), registro)
+        registro += conteudo
+        registro += _CRC.pack(zlib.crc32(conteudo))
+        return bytes(registro)
+
+    @classmethod
+    def decodificar(cls, conteudo, deslocamento=None):
+        versao, modo, status, inicio_ns, semente, penalidade_ms = _CABECALHO.unpack_from(conteudo, 0)
+        if versao != VERSAO:
+            raise ValueError(f"versão de gravação desconhecida: {versao}")
+        duracao_ns, pos = _ler_varint(conteudo, _CABECALHO.size)
+        textos = []
+        for _ in range(4):
+            texto, pos = _ler_texto(conteudo, pos)
+            textos.append(texto)
+        quantidade, pos = _ler_varint(conteudo, pos)
+        alternativas = []
+        for _ in range(quantidade):
+            alternativa, pos = _ler_texto(conteudo, pos)
+            alternativas.append(alternativa)
+        quantidade, pos = _ler_varint(conteudo, pos)
+        eventos = []
+        instante = 0
+        for _ in range(quantidade):
+            intervalo, pos = _ler_varint(conteudo, pos)
+            codigo, pos = _ler_varint(conteudo, pos)
+            posicao, pos = _ler_varint(conteudo, pos)
+            instante += intervalo
+            eventos.append(Evento(instante, chr(codigo), posicao >> 1, bool(posicao & 1)))
+        return cls(MODOS[modo], STATUS[status], inicio_ns, semente, penalidade_ms / 1000, duracao_ns, *textos,
+                   alternativas, eventos, deslocamento)
+
+    @property
+    def erros(self):
+        return sum(not evento.acertou for evento in self.eventos)
+
+    def tempo(self):
+        """Tempo da rodada como o motor calcula (duração + penalidades); infinito na desistência"""
+        if self.status == STATUS_DESISTIU:
+            return float('inf')
+        return self.duracao_ns / 1e9 + self.erros * self.penalidade_erro
+
+    def reproduzir_motor(self, velocidade=None, ao_evento=None):
+        """Refaz a rodada num Rodada com relógio virtual; `velocidade` None = o mais rápido possível.
+
+        Devolve a Rodada encerrada, para comparar tempo, erros e status com a
+        gravação. `ao_evento(evento, tentativa)` é chamado a cada letra.
+        """
+        agora = [0.0]
+        rodada = Rodada(self.palavra, self.penalidade_erro, relogio=lambda: agora[0], alternativas=self.alternativas)
+        rodada.iniciar()
+        partida = time.perf_counter()
+        for evento in self.eventos:
+            if velocidade:
+                espera = partida + evento.instante_ns / 1e9 / velocidade - time.perf_counter()
+                if espera > 0:
+                    time.sleep(espera)
+            agora[0] = evento.instante_ns / 1e9
+            tentativa = rodada.guess(evento.letra)
+            if ao_evento is not None:
+                ao_evento(evento, tentativa)
+        agora[0] = self.duracao_ns / 1e9
+        if self.status == STATUS_DESISTIU:
+            rodada.give_up()
+        else:
+            rodada.finish()
+        return rodada
+
+
+class Gravador:
+    """Grava a rodada em andamento na memória e acrescenta o registro ao arquivo quando ela acaba.
+
+    Uma rodada por vez (a da tela). A escrita é uma única chamada em modo
+    append, então duas instâncias do jogo na mesma pasta não embaralham
+    registros.
+    """
+
+    def __init__(self, caminho=ARQUIVO_GRAVACOES, relogio_ns=time.perf_counter_ns):
+        self.caminho = caminho
+        self.relogio_ns = relogio_ns
+        self.gravacao = None
+        self._inicio = 0
+
+    def iniciar(self, rodada, modo, jogador, dificuldade, letras, semente):
+        self._inicio = self.relogio_ns()
+        self.gravacao = Gravacao(modo, STATUS_INCOMPLETA, time.time_ns(), semente, rodada.penalidade_erro, 0,
+                                 jogador, dificuldade or '', rodada.palavra_sorteada, letras, rodada.solucoes[1:], [])
+
+    def letra(self, tentativa):
+        if self.gravacao is not None:
+            self.gravacao.eventos.append(Evento(self.relogio_ns() - self._inicio, tentativa.letra, tentativa.posicao,
+                                                tentativa.acertou))
+
+    def descartar(self):
+        self.gravacao = None
+
+    def encerrar(self, status):
+        """Grava a rodada encerrada; devolve o deslocamento do registro no arquivo (None se falhou)"""
+        gravacao, self.gravacao = self.gravacao, None
+        if gravacao is None:
+            return None
+        gravacao.status = status
+        gravacao.duracao_ns = self.relogio_ns() - self._inicio
+        try:
+            with open(self.caminho, 'ab', buffering=0) as f:
+                deslocamento = f.seek(0, os.SEEK_END)
+                f.write(gravacao.codificar())
+        except OSError as e:
+            logging.error(f"Não foi possível gravar a rodada em {self.caminho}: {e}")
+            return None
+        gravacao.deslocamento = deslocamento
+        return deslocamento
+
+
+def ler_gravacoes(caminho=ARQUIVO_GRAVACOES):
+    """Todas as gravações válidas do arquivo, em ordem; registros corrompidos são pulados"""
+    try:
+        with open(caminho, 'rb') as f:
+            dados = f.read()
+    except FileNotFoundError:
+        return
+    pos = 0
+    while True:
+        pos = dados.find(MARCA, pos)
+        if pos < 0:
+            return
+        try:
+            tamanho, inicio = _ler_varint(dados, pos + len(MARCA))
+            fim = inicio + tamanho
+            if fim + _CRC.size > len(dados):
+                raise ValueError("registro truncado")
+            conteudo = memoryview(dados)[inicio:fim]
+            if _CRC.unpack_from(dados, fim)[0] != zlib.crc32(conteudo):
+                raise ValueError("CRC não confere")
+            gravacao = Gravacao.decodificar(conteudo, pos)
+        except (ValueError, IndexError, struct.error, UnicodeDecodeError) as e:
+            logging.warning(f"Registro inválido em {caminho}@{pos} ignorado: {e}")
+            pos += 1
+            continue
+        yield gravacao
+        pos = fim + _CRC.size
+
+
+def ler_gravacao(arquivo, deslocamento):
+    """A gravação que começa em `deslocamento` (como devolvido por Gravador.encerrar).
+
+    `arquivo` é um caminho ou um arquivo binário já aberto, para ler
+    muitas gravações seguidas sem reabrir.
+    """
+    if isinstance(arquivo, (str, os.PathLike)):
+        with open(arquivo, 'rb') as f:
+            return ler_gravacao(f, deslocamento)
+    arquivo.seek(deslocamento)
+    cabeca = arquivo.read(len(MARCA) + 10)
+    if not cabeca.startswith(MARCA):
+        raise ValueError(f"não há gravação na posição {deslocamento}")
+    tamanho, inicio = _ler_varint(cabeca, len(MARCA))
+    arquivo.seek(deslocamento + inicio)
+    conteudo = arquivo.read(tamanho + _CRC.size)
+    if len(conteudo) < tamanho + _CRC.size or _CRC.unpack_from(conteudo, tamanho)[0] != zlib.crc32(conteudo[:tamanho]):
+        raise ValueError(f"gravação corrompida na posição {deslocamento}")
+    return Gravacao.decodificar(conteudo[:tamanho], deslocamento)
+
+
+def _descrever(indice, gravacao):
+    quando = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(gravacao.inicio_ns / 1e9))
+    tempo = gravacao.tempo()
+    tempo = "-" if tempo == float('inf') else f"{tempo:.2f}s"
+    return (f"{indice:>5} @{gravacao.deslocamento:<9} {quando}  {gravacao.modo:<11} {gravacao.jogador:<12} "
+            f"{gravacao.palavra:<16} {gravacao.status:<10} {tempo:>8}  {gravacao.erros} erros  {len(gravacao.eventos)} letras")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("acao", choices=("listar", "reproduzir"))
+    parser.add_argument("--arquivo", default=ARQUIVO_GRAVACOES)
+    parser.add_argument("--indice", type=int, default=-1, help="qual gravação reproduzir (negativo conta do fim)")
+    parser.add_argument("--velocidade", type=float, default=0.0, help="1 = tempo real; 0 = o mais rápido possível")
+    parser.add_argument("--tela", action="store_true", help="reproduz na interface do jogo em vez do motor")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    gravacoes = list(ler_gravacoes(args.arquivo))
+    if args.acao == "listar":
+        for indice, gravacao in enumerate(gravacoes):
+            print(_descrever(indice, gravacao))
+        tamanho = os.path.getsize(args.arquivo) if gravacoes else 0
+        eventos = sum(len(g.eventos) for g in gravacoes)
+        print(f"{len(gravacoes)} rodadas, {eventos} letras, {tamanho} bytes")
+        return
+    if not gravacoes:
+        sys.exit(f"Nenhuma gravação em {args.arquivo}.")
+    try:
+        gravacao = gravacoes[args.indice]
+    except IndexError:
+        sys.exit(f"Índice fora do intervalo: há {len(gravacoes)} gravações.")
+    print(_descrever(args.indice % len(gravacoes), gravacao))
+
+    if args.tela:
+        import tkinter as tk
+        from game import GameApp
+        root = tk.Tk()
+        app = GameApp(root)
+        root.after(500, lambda: app.reproduzir_gravacao(gravacao, args.velocidade or None))
+        root.mainloop()
+        return
+
+    def mostrar(evento, tentativa):
+        print(f"  {evento.instante_ns / 1e9:9.3f}s  {evento.letra}  posição {evento.posicao}  "
+              f"{'acertou' if tentativa and tentativa.acertou else 'errou'}")
+
+    rodada = gravacao.reproduzir_motor(args.velocidade or None, mostrar)
+    confere = rodada.status == gravacao.status and rodada.erros == gravacao.erros
+    print(f"motor: {rodada.status}, {rodada.tempo_final():.3f}s, {rodada.erros} erros "
+          f"({'confere' if confere else 'NÃO confere'} com a gravação)")
+
+
+if __name__ == "__main__":
+    main()
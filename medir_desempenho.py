@@ -0,0 +1,296 @@
+"""Bateria de medições de desempenho com dicionários sintéticos (sem janela e sem rede).
+
+Gera dicionários de 10 mil, 100 mil e 1 milhão de palavras com cara de
+português (sílabas, acentos, anagramas) e cronometra os caminhos do jogo
+que dependem do tamanho do dicionário:
+
+    carregar_dicionario          compilando (cache vazio) e lendo do cache
+    sugerir_palavras             palavra inexistente digitada pelo definidor
+    levenshtein_distance         por par de palavras
+    gerar_palavra_sistema        sorteio do solo, com e sem palavras comuns
+                                 (a consulta de definição online fica desligada)
+    equivalentes_sem_acento      "cafe" -> "café" em processar_palavra_secreta
+    filtrar_palavras_adequadas   sobre o dicionário inteiro
+    ranking                      adicionar_ao_ranking + salvar_ranking
+
+Os métodos são os do próprio GameApp, chamados sobre uma instância sem
+janela que só tem o estado que eles usam. Tudo roda numa pasta
+temporária (configurações, ranking e cache do dicionário compilado não
+tocam os arquivos do jogo).
+
+O resultado vai para um JSON e é comparado com a linha de base gravada
+(medir_desempenho_base.json): a razão atual/base de cada medição
+aparece no relatório, e o script sai com código 1 se alguma piorou além
+de --tolerancia.
+
+A linha de base não vem no repositório: os tempos só valem para a
+máquina em que foram medidos. Sem o arquivo, a primeira execução grava
+a base e as seguintes comparam com ela. Para regravá-la (outra máquina
+de referência, ou uma melhora que deve virar o novo padrão), use
+--gravar-base na máquina de referência, antes da mudança a avaliar.
+
+Uso:
+    python medir_desempenho.py
+    python medir_desempenho.py --tamanhos 10000 100000 --saida desempenho.json
+    python medir_desempenho.py --gravar-base
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_BASE = os.path.join(PASTA_JOGO, "medir_desempenho_base.json")
+TAMANHOS = (10_000, 100_000, 1_000_000)
+TOLERANCIA = 0.25  # 25% mais lento que a base conta como regressão
+
+SILABAS = ("ca", "ma", "ta", "pa", "ra", "la", "sa", "na", "da", "ba", "co", "mo", "to", "po", "ro", "lo", "so",
+           "ne", "de", "be", "te", "re", "me", "li", "ri", "ti", "ni", "mi", "vi", "tu", "mu", "lu", "cu", "ção",
+           "são", "lhe", "nha", "cha", "que", "gui", "tra", "pre", "bri", "cro", "fla", "gre", "pé", "ré", "tó",
+           "lá", "mê", "cê", "ví", "nú", "ão", "ões", "ar", "er", "ir", "or", "es", "as", "os", "in", "en", "an",
+           "xa", "zo", "ke", "wi", "ye")
+
+
+class Variavel:
+    """O get/set de um tk.StringVar, sem precisar de uma janela"""
+    __slots__ = ('valor',)
+
+    def __init__(self, valor=""):
+        self.valor = valor
+
+    def get(self):
+        return self.valor
+
+    def set(self, valor):
+        self.valor = valor
+
+
+# ============================================================================
+# DADOS SINTÉTICOS
+# ============================================================================
+
+def gerar_palavras(quantidade, semente=0):
+    """`quantidade` palavras distintas de 2 a 6 sílabas; uma em cada 50 ganha um anagrama"""
+    rng = random.Random(semente)
+    palavras = set()
+    while len(palavras) < quantidade:
+        palavra = "".join(rng.choice(SILABAS) for _ in range(rng.randint(2, 6)))
+        palavras.add(palavra)
+        if rng.random() < 0.02 and len(palavras) < quantidade:
+            letras = list(palavra)
+            rng.shuffle(letras)
+            palavras.add("".join(letras))
+    return sorted(palavras)
+
+
+def errar(palavra, rng):
+    """Uma letra trocada, como um definidor apressado digitaria"""
+    i = rng.randrange(len(palavra))
+    return palavra[:i] + rng.choice("abcdefghijlmnopqrstuvz") + palavra[i + 1:]
+
+
+def preparar_pasta(pasta, palavras):
+    import game
+    with open(os.path.join(pasta, game.ARQUIVO_DICIONARIO_BASE), "w", encoding="utf-8") as f:
+        f.write(f"{len(palavras)}\n")
+        f.write("\n".join(palavras))
+    with open(os.path.join(pasta, game.ARQUIVO_DICIONARIO), "w", encoding="utf-8") as f:
+        f.write("\n".join(sorted(game.PALAVRAS_COMUNS)))
+
+
+def montar_jogo():
+    """GameApp sem janela: só o estado que os métodos medidos usam (ver GameApp.__init__)"""
+    import game
+    app = game.GameApp.__new__(game.GameApp)
+    app.config = game.ConfiguracoesUsuario()
+    app.dificuldade_selecionada = Variavel(app.config.obter_config("jogo", "dificuldade_padrao"))
+    app.modo_jogo_selecionado = Variavel("solo")
+    app.ranking_solo = {'comum_on': {'Fácil': [], 'Médio': [], 'Difícil': []},
+                        'comum_off': {'Fácil': [], 'Médio': [], 'Difícil': []}}
+    app.ARQUIVO_RANKING = game.ARQUIVO_RANKING
+    app.ARQUIVO_LOCAL_DICIONARIO = game.ARQUIVO_DICIONARIO
+    app.dicionario_palavras = set()
+    app.dicionario_palavras_sem_acento = set()
+    app.dicionario_pronto = threading.Event()
+    app.dicionario_pronto.set()
+    app.indice_dificuldade = None
+    app.comuns_por_nivel = {}
+    app.camadas_do_modo = game.CAMADAS_POR_MODO.get('solo', ())
+    app.trava_camadas = threading.Lock()
+    app.arquivo_palavras_usadas = "palavras_usadas.json"
+    app.palavras_usadas = {"Fácil": [], "Médio": [], "Difícil": []}
+    return app
+
+
+# ============================================================================
+# CRONOMETRAGEM
+# ============================================================================
+
+def cronometrar(funcao, repeticoes, operacoes=1):
+    """Mediana e mínimo, em ms por operação, de `repeticoes` chamadas de `funcao`"""
+    amostras = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        amostras.append((time.perf_counter() - inicio) * 1000 / operacoes)
+    return {'mediana_ms': statistics.median(amostras), 'min_ms': min(amostras), 'repeticoes': repeticoes,
+            'operacoes': operacoes}
+
+
+def medir_tamanho(tamanho, repeticoes, rng):
+    import dicionario
+    import game
+    game.VERIFICAR_DEFINICAO_ONLINE = False  # Sem rede: a consulta de definição do solo não é medida
+    resultados = {}
+    palavras = gerar_palavras(tamanho, semente=tamanho)
+    with tempfile.TemporaryDirectory() as pasta:
+        anterior = os.getcwd()
+        cache = dicionario.PASTA_CACHE
+        os.chdir(pasta)
+        dicionario.PASTA_CACHE = os.path.join(pasta, "dicionario_compilado")
+        try:
+            preparar_pasta(pasta, palavras)
+            app = montar_jogo()
+            resultados['carregar_dicionario_compilando'] = cronometrar(app.carregar_dicionario, 1)
+            resultados['carregar_dicionario'] = cronometrar(app.carregar_dicionario, repeticoes)
+
+            amostra = rng.sample(palavras, 200)
+            erradas = [errar(p, rng) for p in amostra[:20]]
+            resultados['sugerir_palavras'] = cronometrar(
+                lambda: [app.sugerir_palavras(p) for p in erradas], repeticoes, len(erradas))
+
+            pares = list(zip(amostra[:100], amostra[100:]))
+            resultados['levenshtein_distance'] = cronometrar(
+                lambda: [app.levenshtein_distance(a, b) for a, b in pares], repeticoes * 10, len(pares))
+
+            sem_acento = [game.remover_acentos(p) for p in amostra]
+            resultados['equivalentes_sem_acento'] = cronometrar(
+                lambda: [app.equivalentes_sem_acento(p) for p in sem_acento], repeticoes * 10, len(sem_acento))
+
+            for nome, comuns in (('gerar_palavra_sistema', False), ('gerar_palavra_sistema_comuns', True)):
+                app.config.configuracoes["jogo"]["usar_palavras_comuns"] = comuns
+                for dificuldade in game.REGRAS_DIFICULDADE:
+                    app.dificuldade_selecionada.set(dificuldade)
+                    app.palavras_usadas = {"Fácil": [], "Médio": [], "Difícil": []}
+                    resultados[f'{nome}[{dificuldade}]'] = cronometrar(
+                        lambda: [app.gerar_palavra_sistema() for _ in range(20)], repeticoes, 20)
+
+            resultados['filtrar_palavras_adequadas'] = cronometrar(
+                lambda: app.filtrar_palavras_adequadas(palavras), max(1, repeticoes // 3), len(palavras))
+        finally:
+            dicionario.PASTA_CACHE = cache
+            os.chdir(anterior)
+    return resultados
+
+
+def medir_ranking(repeticoes, rng):
+    """Inserção + gravação no ranking cheio (10 por dificuldade, como no jogo)"""
+    with tempfile.TemporaryDirectory() as pasta:
+        anterior = os.getcwd()
+        os.chdir(pasta)
+        try:
+            app = montar_jogo()
+            dificuldades = ("Fácil", "Médio", "Difícil")
+
+            def inserir_e_salvar():
+                for i in range(50):
+                    app.adicionar_ao_ranking(f"JOGADOR {i}", rng.uniform(2, 60), rng.randint(0, 5),
+                                             dificuldades[i % 3], "palavra", gravacao=i * 100)
+                    app.salvar_ranking()
+
+            return {'ranking_inserir_e_salvar': cronometrar(inserir_e_salvar, repeticoes, 50)}
+        finally:
+            os.chdir(anterior)
+
+
+# ============================================================================
+# LINHA DE BASE E RELATÓRIO
+# ============================================================================
+
+def comparar(atual, base, tolerancia):
+    """{tamanho: {medição: razão atual/base}} e a lista das que passaram da tolerância"""
+    razoes, regressoes = {}, []
+    for grupo, medicoes in atual.items():
+        for nome, medida in medicoes.items():
+            referencia = base.get(grupo, {}).get(nome)
+            if not referencia or not referencia['mediana_ms']:
+                continue
+            razao = medida['mediana_ms'] / referencia['mediana_ms']
+            razoes.setdefault(grupo, {})[nome] = round(razao, 3)
+            if razao > 1 + tolerancia:
+                regressoes.append(f"{grupo} {nome}: {razao:.2f}x a base")
+    return razoes, regressoes
+
+
+def imprimir_relatorio(resultados, razoes):
+    for grupo, medicoes in resultados.items():
+        print(f"\n{grupo}")
+        print(f"  {'medição':<40}{'mediana (ms/op)':>16}{'mínimo':>12}{'x base':>10}")
+        for nome, medida in medicoes.items():
+            razao = razoes.get(grupo, {}).get(nome)
+            print(f"  {nome:<40}{medida['mediana_ms']:>16.4f}{medida['min_ms']:>12.4f}"
+                  + (f"{razao:>10.2f}" if razao is not None else f"{'-':>10}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS))
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--saida", help="grava os resultados e a comparação em JSON")
+    parser.add_argument("--base", default=ARQUIVO_BASE, help="linha de base para comparar")
+    parser.add_argument("--gravar-base", action="store_true", help="grava estes resultados como a nova base")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    args = parser.parse_args()
+    sys.path.insert(0, PASTA_JOGO)
+
+    rng = random.Random(args.semente)
+    resultados = {}
+    for tamanho in args.tamanhos:
+        print(f"Medindo com {tamanho} palavras...", flush=True)
+        resultados[f"{tamanho} palavras"] = medir_tamanho(tamanho, args.repeticoes, rng)
+    resultados["ranking"] = medir_ranking(args.repeticoes, rng)
+
+    base = {}
+    gravar_base = args.gravar_base
+    if not os.path.exists(args.base):
+        gravar_base = True  # Primeira execução nesta máquina: vira a base das próximas
+    elif not gravar_base:
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f).get('resultados', {})
+    razoes, regressoes = comparar(resultados, base, args.tolerancia)
+    imprimir_relatorio(resultados, razoes)
+
+    relatorio = {
+        'maquina': {'python': platform.python_version(), 'sistema': platform.platform(),
+                    'processador': platform.processor() or platform.machine()},
+        'quando': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'resultados': resultados,
+        'razao_base': razoes,
+        'regressoes': regressoes,
+    }
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    if gravar_base:
+        with open(args.base, "w", encoding="utf-8") as f:
+            json.dump({k: relatorio[k] for k in ('maquina', 'quando', 'resultados')}, f, ensure_ascii=False, indent=2)
+        if args.gravar_base:
+            print(f"\nLinha de base gravada em {args.base}.")
+        else:
+            print(f"\nNão havia linha de base: estes resultados foram gravados em {args.base}; "
+                  f"as próximas execuções comparam com eles.")
+    for regressao in regressoes:
+        print(f"REGRESSÃO: {regressao}")
+    if regressoes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
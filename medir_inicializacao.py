@@ -0,0 +1,98 @@
+"""Mede o tempo até a primeira tela do jogo e compara com outra revisão do git.
+
+Uso:
+    python medir_inicializacao.py                      # mede a versão atual
+    python medir_inicializacao.py --comparar-com HEAD~1 # relatório antes/depois
+
+Cada medição roda num processo novo (importações frias do Python) e precisa
+de um display (no kiosk, ou Xvfb em servidores).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import io
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+
+# Executado em um processo filho dentro da pasta do jogo medida
+MEDIDOR = r"""
+import time
+t0 = time.perf_counter()
+import importlib.util, json, sys, tkinter as tk
+spec = importlib.util.spec_from_file_location("game", "game.py")
+game = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(game)
+t_importacao = time.perf_counter()
+# O update_idletasks abaixo também roda a inicialização adiada (after_idle): a primeira
+# pintura é marcada quando o jogo a registra, antes desse trabalho. Revisões sem
+# inicialização adiada não têm o método e ficam com o instante do fim do update_idletasks.
+marcas = {}
+registrar = getattr(game.GameApp, "_registrar_primeira_pintura", None)
+if registrar is not None:
+    def registrar_primeira_pintura(self):
+        registrar(self)
+        marcas.setdefault("pintura", time.perf_counter())
+    game.GameApp._registrar_primeira_pintura = registrar_primeira_pintura
+root = tk.Tk()
+app = game.GameApp(root)
+t_init = time.perf_counter()
+root.update_idletasks()
+t_fim = time.perf_counter()
+t_pintura = marcas.get("pintura", t_fim)
+print(json.dumps({
+    "importacao_ms": (t_importacao - t0) * 1000,
+    "init_ms": (t_init - t_importacao) * 1000,
+    "primeira_pintura_ms": (t_pintura - t0) * 1000,
+    "adiada_ms": (t_fim - t_pintura) * 1000,
+}))
+root.destroy()
+"""
+
+
+def medir(pasta, repeticoes):
+    amostras = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", MEDIDOR], cwd=pasta,
+                               capture_output=True, text=True, timeout=120)
+        if saida.returncode != 0:
+            raise RuntimeError(f"Falha ao medir em {pasta}:\n{saida.stderr}")
+        amostras.append(json.loads(saida.stdout.strip().splitlines()[-1]))
+    return {chave: statistics.median(a[chave] for a in amostras) for chave in amostras[0]}
+
+
+def extrair_revisao(revisao, destino):
+    arquivo = subprocess.run(["git", "archive", revisao], cwd=PASTA_JOGO,
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(arquivo)) as tar:
+        tar.extractall(destino)
+
+
+def imprimir_relatorio(resultados):
+    nomes = list(resultados)
+    print(f"{'fase (mediana, ms)':<24}" + "".join(f"{nome:>16}" for nome in nomes))
+    for chave in ("importacao_ms", "init_ms", "primeira_pintura_ms", "adiada_ms"):
+        print(f"{chave:<24}" + "".join(f"{resultados[nome][chave]:>16.1f}" for nome in nomes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--comparar-com", metavar="REVISAO", help="revisão do git usada como 'antes'")
+    args = parser.parse_args()
+
+    resultados = {}
+    if args.comparar_com:
+        with tempfile.TemporaryDirectory() as pasta:
+            extrair_revisao(args.comparar_com, pasta)
+            resultados[f"antes ({args.comparar_com})"] = medir(pasta, args.repeticoes)
+    resultados["atual"] = medir(PASTA_JOGO, args.repeticoes)
+    imprimir_relatorio(resultados)
+
+
+if __name__ == "__main__":
+    main()
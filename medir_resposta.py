@@ -0,0 +1,338 @@
+"""Mede a resposta da tela de adivinhação a teclas e cliques sintéticos (latência até a pintura e eventos perdidos).
+
+Abre o GameApp de verdade num display virtual (Xvfb) e, numa rodada com
+uma palavra longa, injeta letras nos campos da palavra e cliques nos
+botões de letras embaralhadas a uma taxa fixa (5 a 30 por segundo).
+Para cada evento mede:
+
+    latência   do instante em que o evento deveria chegar até a tela
+               estar pintada com o resultado (campo, erros, letras tentadas);
+    perdido    o evento nunca chegou a verificar_letra (foco errado,
+               campo desabilitado, clique engolido).
+
+A injeção é de malha aberta: os instantes previstos seguem a taxa
+pedida, e se o loop do Tk travar, os eventos atrasados contam a trava
+como latência, em vez de simplesmente deixarem de ser enviados. Os
+eventos entram na fila de eventos do Tk (event generate), o mesmo
+caminho das teclas e cliques que chegam do X, então passam pelo foco e
+pelos bindings do jogo. As trocas de rodada (a palavra nunca é
+completada; uma nova rodada começa na última letra) não entram na
+medição.
+
+Cada combinação de modo, tema e taxa roda num processo novo, numa pasta
+temporária (ranking, gravações e configurações do jogo não são tocados),
+com o som no driver "dummy" do SDL. O relatório traz p50/p90/p99/máximo
+por combinação; com o matplotlib instalado, também um gráfico.
+
+Uso:
+    python medir_resposta.py --xvfb
+    python medir_resposta.py --xvfb --taxas 5 10 20 30 --duracao 30 --saida resposta.json --grafico resposta.png
+    python medir_resposta.py --modos solo --temas escuro --taxas 20    # no display atual (kiosk)
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+MODOS = ('solo', 'multiplayer')
+TEMAS = ('claro', 'escuro')
+TAXAS = (5, 10, 20, 30)
+PALAVRA = "DESPROPORCIONALMENTE"  # 20 letras, o máximo do solo: poucas trocas de rodada
+LETRAS_ERRADAS = "BKWXYZ"
+TEMPO_PERDIDO_S = 1.0  # Evento que não chegou ao jogo depois disto conta como perdido
+PERCENTIS = (50, 90, 99)
+
+
+# ============================================================================
+# DISPLAY VIRTUAL
+# ============================================================================
+
+def iniciar_xvfb(tela=99, resolucao="1920x1080x24"):
+    """Sobe um Xvfb em :tela e espera o socket aparecer; devolve o processo"""
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("Xvfb não encontrado (no Debian/Ubuntu: apt install xvfb)")
+    processo = subprocess.Popen(["Xvfb", f":{tela}", "-screen", "0", resolucao, "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    soquete = f"/tmp/.X11-unix/X{tela}"
+    limite = time.monotonic() + 10
+    while not os.path.exists(soquete):
+        if processo.poll() is not None or time.monotonic() > limite:
+            processo.kill()
+            raise RuntimeError(f"Xvfb não subiu em :{tela}")
+        time.sleep(0.05)
+    return processo
+
+
+# ============================================================================
+# MEDIÇÃO (PROCESSO FILHO, COM O JOGO ABERTO)
+# ============================================================================
+
+class Medidor:
+    """Injeta os eventos no ritmo pedido e casa cada um com a letra que chegou a verificar_letra"""
+
+    def __init__(self, app, taxa, duracao, cliques, erros, semente):
+        self.app = app
+        self.root = app.root
+        self.intervalo = 1.0 / taxa
+        self.duracao = duracao
+        self.cliques = cliques
+        self.erros = erros
+        self.rng = random.Random(semente)
+        self.pendentes = []  # [tipo, letra, previsto, recebido, pintado, acerto], ainda sem resposta
+        self.registros = []
+        self.perdidos = 0
+        self.proximo = 0.0
+        self.fim = 0.0
+        original = app.verificar_letra
+
+        def verificar_letra(letra, idx):
+            registro = self._casar(letra)
+            original(letra, idx)
+            if registro is not None:
+                self.root.after_idle(self._sondar_pintura, registro)
+
+        app.verificar_letra = verificar_letra
+
+    def iniciar(self):
+        self._nova_rodada()
+        self.proximo = time.perf_counter()
+        self.fim = self.proximo + self.duracao
+        self._injetar()
+
+    def _nova_rodada(self):
+        app = self.app
+        app.partida.definir_palavra(PALAVRA, app.dificuldade_selecionada.get())
+        app.iniciar_rodada_adivinhacao()
+        app.iniciar_partida_jogador()
+        self.root.update_idletasks()
+
+    def _injetar(self):
+        agora = time.perf_counter()
+        self._expirar(agora)
+        if agora >= self.fim:
+            self.root.after(int(TEMPO_PERDIDO_S * 1000) + 100, self._encerrar)
+            return
+        ultima = len(self.app.rodada.palavra) - 1
+        if self._posicao_alvo() >= ultima:
+            if self.pendentes:
+                self.root.after(5, self._injetar)
+                return
+            # Troca de rodada fora da medição: o horário previsto recomeça depois dela
+            self._nova_rodada()
+            self.proximo = time.perf_counter()
+        # Todos os eventos já vencidos saem agora, com o horário previsto original (malha aberta)
+        while self.proximo <= agora and self._posicao_alvo() < ultima:
+            self._enviar(self.proximo)
+            self.proximo += self.intervalo
+        self.root.after(max(1, int((self.proximo - time.perf_counter()) * 1000)), self._injetar)
+
+    def _posicao_alvo(self):
+        """Posição que o próximo evento vai encontrar: a atual mais os acertos ainda na fila do Tk"""
+        return self.app.rodada.indice + sum(registro[5] for registro in self.pendentes)
+
+    def _expirar(self, agora):
+        vencidos = [r for r in self.pendentes if agora - r[2] > TEMPO_PERDIDO_S]
+        if vencidos:
+            self.perdidos += len(vencidos)
+            self.pendentes = [r for r in self.pendentes if agora - r[2] <= TEMPO_PERDIDO_S]
+
+    def _enviar(self, previsto):
+        from motor import letra_sem_acento
+        rodada = self.app.rodada
+        correta = letra_sem_acento(rodada.palavra[self._posicao_alvo()])
+        acerto = self.rng.random() >= self.erros
+        letra = correta if acerto else self.rng.choice(LETRAS_ERRADAS.replace(correta, ""))
+        botoes = [b for b in self.app.botoes_letras_embaralhadas if letra_sem_acento(b.cget('text')) == letra]
+        if botoes and self.rng.random() < self.cliques:
+            botao = botoes[0]
+            x, y = botao.winfo_width() // 2, botao.winfo_height() // 2
+            botao.event_generate('<Enter>', x=x, y=y, when='tail')
+            botao.event_generate('<ButtonPress-1>', x=x, y=y, when='tail')
+            botao.event_generate('<ButtonRelease-1>', x=x, y=y, when='tail')
+            self.pendentes.append(['clique', botao.cget('text').upper(), previsto, None, None, acerto])
+            return
+        # A tecla vai para quem tem o foco, como uma tecla de verdade
+        campo = self.root.focus_get() or self.app.palavra_adivinhada_entries[rodada.indice]
+        campo.event_generate('<KeyPress>', keysym=letra.lower(), when='tail')
+        campo.event_generate('<KeyRelease>', keysym=letra.lower(), when='tail')
+        self.pendentes.append(['tecla', letra, previsto, None, None, acerto])
+
+    def _casar(self, letra):
+        """O evento pendente mais antigo com esta letra; os anteriores a ele se perderam (a fila do Tk é FIFO)"""
+        for i, registro in enumerate(self.pendentes):
+            if registro[1] == letra:
+                self.perdidos += i
+                del self.pendentes[:i + 1]
+                registro[3] = time.perf_counter()
+                return registro
+        return None
+
+    def _sondar_pintura(self, registro):
+        modelo = self.app.modelo_interface
+        if modelo.descarga_id or modelo.pendente:
+            # O modelo de interface pinta no máximo uma vez por quadro: espera essa pintura
+            self.root.after(1, self._sondar_pintura, registro)
+            return
+        self.root.update_idletasks()
+        self.root.winfo_pointerxy()  # Ida e volta ao servidor X: os comandos de desenho já foram processados
+        registro[4] = time.perf_counter()
+        self.registros.append(registro)
+
+    def _encerrar(self):
+        self.perdidos += len(self.pendentes)
+        self.pendentes.clear()
+        self.root.quit()
+
+
+def medir(parametros):
+    """Roda uma combinação no processo atual; devolve as amostras (ms) e a contagem de perdidos"""
+    sys.path.insert(0, PASTA_JOGO)
+    pasta = tempfile.mkdtemp(prefix="medir_resposta_")
+    for nome in ("pt_BR.dic", "palavras.txt"):
+        if os.path.exists(os.path.join(PASTA_JOGO, nome)):
+            os.symlink(os.path.join(PASTA_JOGO, nome), os.path.join(pasta, nome))
+    os.chdir(pasta)
+    import tkinter as tk
+    import game
+
+    game.GameApp.aplicar_paleta(parametros['tema'])
+    root = tk.Tk()
+    app = game.GameApp(root)
+    app.config.configuracoes["jogo"]["gravar_rodadas"] = False
+    modo = parametros['modo']
+    app.modo_jogo_selecionado.set(modo)
+    app.ativar_camadas_do_modo(modo)
+    app.nova_partida(["MEDIDOR"] if modo == 'solo' else ["DEFINIDOR", "MEDIDOR"])
+    medidor = Medidor(app, parametros['taxa'], parametros['duracao'], parametros['cliques'], parametros['erros'],
+                      parametros['semente'])
+    root.after(int(parametros['aquecimento'] * 1000), medidor.iniciar)
+    root.mainloop()
+    root.destroy()
+    shutil.rmtree(pasta, ignore_errors=True)
+
+    latencias = [(r[4] - r[2]) * 1000 for r in medidor.registros]
+    filas = [(r[3] - r[2]) * 1000 for r in medidor.registros]
+    return {'latencias_ms': latencias, 'fila_ms': filas, 'perdidos': medidor.perdidos,
+            'enviados': len(medidor.registros) + medidor.perdidos,
+            'cliques': sum(r[0] == 'clique' for r in medidor.registros)}
+
+
+# ============================================================================
+# RELATÓRIO
+# ============================================================================
+
+def percentil(valores, p):
+    if not valores:
+        return float('nan')
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def resumir(bruto):
+    latencias = bruto['latencias_ms']
+    resumo = {f'p{p}_ms': percentil(latencias, p) for p in PERCENTIS}
+    resumo['max_ms'] = max(latencias, default=float('nan'))
+    resumo['media_fila_ms'] = statistics.fmean(bruto['fila_ms']) if bruto['fila_ms'] else float('nan')
+    resumo['enviados'] = bruto['enviados']
+    resumo['perdidos'] = bruto['perdidos']
+    resumo['cliques'] = bruto['cliques']
+    return resumo
+
+
+def desenhar_grafico(resultados, caminho):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib não instalado: gráfico não gerado (pip install matplotlib).")
+        return
+    figura, eixos = plt.subplots(1, len(PERCENTIS), figsize=(5 * len(PERCENTIS), 4), sharey=True)
+    for eixo, p in zip(eixos, PERCENTIS):
+        for combinacao, por_taxa in resultados.items():
+            taxas = sorted(por_taxa, key=float)
+            eixo.plot([float(t) for t in taxas], [por_taxa[t][f'p{p}_ms'] for t in taxas], marker='o', label=combinacao)
+        eixo.set_title(f"p{p}")
+        eixo.set_xlabel("eventos por segundo")
+        eixo.grid(True, alpha=0.3)
+    eixos[0].set_ylabel("evento até a pintura (ms)")
+    eixos[-1].legend()
+    figura.tight_layout()
+    figura.savefig(caminho, dpi=120)
+    print(f"Gráfico gravado em {caminho}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modos", nargs="+", choices=MODOS, default=list(MODOS))
+    parser.add_argument("--temas", nargs="+", choices=TEMAS, default=list(TEMAS))
+    parser.add_argument("--taxas", type=float, nargs="+", default=list(TAXAS), help="eventos por segundo")
+    parser.add_argument("--duracao", type=float, default=20.0, help="segundos medidos por combinação")
+    parser.add_argument("--aquecimento", type=float, default=2.0, help="segundos entre abrir o jogo e medir")
+    parser.add_argument("--cliques", type=float, default=0.3, help="fração dos eventos que são cliques")
+    parser.add_argument("--erros", type=float, default=0.1, help="fração das letras que são erradas")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--xvfb", action="store_true", help="sobe um Xvfb próprio (padrão se não houver DISPLAY)")
+    parser.add_argument("--tela", type=int, default=99, help="número do display do Xvfb")
+    parser.add_argument("--saida", help="grava o relatório (e as amostras) em JSON")
+    parser.add_argument("--grafico", help="grava o gráfico dos percentis (PNG)")
+    parser.add_argument("--filho", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        print(json.dumps(medir(json.loads(args.filho))))
+        return
+
+    ambiente = dict(os.environ, SDL_AUDIODRIVER="dummy")
+    xvfb = None
+    if args.xvfb or not os.environ.get("DISPLAY"):
+        try:
+            xvfb = iniciar_xvfb(args.tela)
+        except RuntimeError as e:
+            parser.error(str(e))
+        ambiente["DISPLAY"] = f":{args.tela}"
+
+    resultados, amostras = {}, {}
+    try:
+        for modo in args.modos:
+            for tema in args.temas:
+                combinacao = f"{modo}/{tema}"
+                for taxa in args.taxas:
+                    parametros = {'modo': modo, 'tema': tema, 'taxa': taxa, 'duracao': args.duracao,
+                                  'aquecimento': args.aquecimento, 'cliques': args.cliques, 'erros': args.erros,
+                                  'semente': args.semente}
+                    print(f"{combinacao} a {taxa:g} eventos/s...", flush=True)
+                    saida = subprocess.run([sys.executable, os.path.abspath(__file__), "--filho", json.dumps(parametros)],
+                                           capture_output=True, text=True, env=ambiente,
+                                           timeout=args.duracao + args.aquecimento + 120)
+                    if saida.returncode != 0:
+                        raise RuntimeError(f"Falha ao medir {combinacao} a {taxa:g}/s:\n{saida.stderr}")
+                    bruto = json.loads(saida.stdout.strip().splitlines()[-1])
+                    resultados.setdefault(combinacao, {})[f"{taxa:g}"] = resumir(bruto)
+                    amostras.setdefault(combinacao, {})[f"{taxa:g}"] = bruto
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print(f"\n{'combinação':<22}{'taxa':>6}{'p50':>9}{'p90':>9}{'p99':>9}{'máx':>9}{'fila':>9}{'perdidos':>12}")
+    for combinacao, por_taxa in resultados.items():
+        for taxa, r in por_taxa.items():
+            print(f"{combinacao:<22}{taxa:>6}{r['p50_ms']:>9.1f}{r['p90_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+                  f"{r['max_ms']:>9.1f}{r['media_fila_ms']:>9.1f}{r['perdidos']:>6}/{r['enviados']:<5}")
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump({'parametros': vars(args), 'resultados': resultados, 'amostras': amostras}, f, indent=2)
+    if args.grafico:
+        desenhar_grafico(resultados, args.grafico)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""Lógica das rodadas do Desafio de Rivais, sem nenhuma dependência de interface.
+
+O GameApp (Tk) apenas exibe o estado destas classes; simulações, testes e
+benchmarks podem usá-las diretamente, sem abrir janela.
+"""
+import random
+import time
+import unicodedata
+
+STATUS_ADIVINHOU = "ADIVINHOU"
+STATUS_INCOMPLETA = "INCOMPLETA"
+STATUS_DESISTIU = "DESISTIU"
+
+PENALIDADE_ERRO_PADRAO = 3.0
+
+_SEM_ACENTO = {}  # cache letra -> letra sem acento
+
+
+def remover_acentos(txt):
+    return ''.join(c for c in unicodedata.normalize('NFD', txt) if unicodedata.category(c) != 'Mn')
+
+
+def letra_sem_acento(letra):
+    try:
+        return _SEM_ACENTO[letra]
+    except KeyError:
+        sem_acento = _SEM_ACENTO[letra] = remover_acentos(letra)
+        return sem_acento
+
+
+def embaralhar_letras(palavra, semente):
+    """Letras da palavra embaralhadas por uma semente: a mesma semente sempre dá a mesma ordem"""
+    letras = list(palavra)
+    random.Random(semente).shuffle(letras)
+    return ''.join(letras)
+
+
+class Tentativa:
+    """Resultado de uma letra enviada para a rodada"""
+    __slots__ = ('letra', 'letra_correta', 'posicao', 'acertou', 'completa')
+
+    def __init__(self, letra, letra_correta, posicao, acertou, completa):
+        self.letra = letra
+        self.letra_correta = letra_correta
+        self.posicao = posicao
+        self.acertou = acertou
+        self.completa = completa
+
+
+class Rodada:
+    """Uma palavra sendo adivinhada letra por letra, com penalidade por erro.
+
+    Letras sem acento valem pelas acentuadas (C acerta Ç, A acerta Á...).
+    As `alternativas` (anagramas válidos da palavra) também são aceitas: se
+    a letra só serve para uma delas, a rodada passa a seguir essa palavra.
+    """
+    __slots__ = ('palavra', 'letras_sem_acento', 'solucoes', 'indice', 'erros', 'penalidade_erro',
+                 'penalidade_acumulada', 'letras_tentadas', 'letras_erradas',
+                 'letras_erradas_desde_ultimo_acerto', 'inicio', 'fim', 'status', 'relogio')
+
+    def __init__(self, palavra, penalidade_erro=PENALIDADE_ERRO_PADRAO, relogio=time.time, alternativas=()):
+        self.palavra = palavra.upper()
+        self.letras_sem_acento = [letra_sem_acento(c) for c in self.palavra]
+        self.solucoes = [self.palavra]
+        for alternativa in alternativas:
+            alternativa = alternativa.upper()
+            if len(alternativa) == len(self.palavra) and alternativa not in self.solucoes:
+                self.solucoes.append(alternativa)
+        self.indice = 0
+        self.erros = 0
+        self.penalidade_erro = penalidade_erro
+        self.penalidade_acumulada = 0.0
+        self.letras_tentadas = set()
+        self.letras_erradas = set()
+        self.letras_erradas_desde_ultimo_acerto = set()
+        self.inicio = None
+        self.fim = None
+        self.status = None
+        self.relogio = relogio
+
+    @property
+    def completa(self):
+        return self.indice >= len(self.palavra)
+
+    @property
+    def palavra_sorteada(self):
+        return self.solucoes[0]
+
+    @property
+    def encerrada(self):
+        return self.status is not None
+
+    def iniciar(self):
+        self.inicio = self.relogio()
+
+    def tempo_decorrido(self):
+        """Tempo da rodada com as penalidades já somadas"""
+        if self.inicio is None:
+            return 0.0
+        fim = self.fim if self.fim is not None else self.relogio()
+        return (fim - self.inicio) + self.penalidade_acumulada
+
+    def guess(self, letra):
+        """Tenta a letra na posição atual; devolve uma Tentativa (None se a rodada já acabou)"""
+        if self.status is not None or self.indice >= len(self.palavra):
+            return None
+        letra = letra.upper()
+        posicao = self.indice
+        letra_correta = self.palavra[posicao]
+        self.letras_tentadas.add(letra)
+
+        sem_acento = letra_sem_acento(letra)
+        if letra != letra_correta and sem_acento != self.letras_sem_acento[posicao] and len(self.solucoes) > 1:
+            outra = self._outra_solucao(posicao, sem_acento)
+            if outra is not None:
+                self.palavra = outra
+                self.letras_sem_acento = [letra_sem_acento(c) for c in outra]
+                letra_correta = outra[posicao]
+
+        if letra == letra_correta or sem_acento == self.letras_sem_acento[posicao]:
+            self.letras_erradas.discard(letra)
+            self.letras_erradas_desde_ultimo_acerto.clear()
+            self.indice = posicao + 1
+            return Tentativa(letra, letra_correta, posicao, True, self.indice >= len(self.palavra))
+
+        self.erros += 1
+        self.letras_erradas.add(letra)
+        self.letras_erradas_desde_ultimo_acerto.add(letra)
+        self.penalidade_acumulada += self.penalidade_erro
+        return Tentativa(letra, letra_correta, posicao, False, False)
+
+    def _outra_solucao(self, posicao, sem_acento):
+        """Anagrama com o mesmo começo já acertado e que aceita a letra nesta posição"""
+        prefixo = self.letras_sem_acento[:posicao]
+        for solucao in self.solucoes:
+            if solucao == self.palavra:
+                continue
+            letras = [letra_sem_acento(c) for c in solucao]
+            if letras[:posicao] == prefixo and letras[posicao] == sem_acento:
+                return solucao
+        return None
+
+    def finish(self):
+        """Encerra a rodada: ADIVINHOU se todas as letras foram acertadas, senão INCOMPLETA"""
+        if self.status is None:
+            self.fim = self.relogio()
+            self.status = STATUS_ADIVINHOU if self.completa else STATUS_INCOMPLETA
+        return self.status
+
+    def give_up(self):
+        if self.status is None:
+            self.fim = self.relogio()
+            self.status = STATUS_DESISTIU
+        return self.status
+
+    def tempo_final(self):
+        return float('inf') if self.status == STATUS_DESISTIU else self.tempo_decorrido()
+
+    def erros_final(self):
+        return STATUS_DESISTIU if self.status == STATUS_DESISTIU else self.erros
+
+
+class Corrida:
+    """Uma palavra adivinhada por vários jogadores ao mesmo tempo (modo corrida em rede).
+
+    As regras são as da Rodada (acentos e anagramas valem), mas compiladas
+    uma vez por palavra numa tabela de transições: cada estado é um prefixo
+    (sem acento) de alguma das soluções e `transicoes[estado]` leva a letra
+    sem acento ao estado seguinte. Conferir uma letra é uma consulta a
+    dicionário, qualquer que seja o número de jogadores ou de anagramas.
+
+    Cada letra é conferida no instante em que chegou a quem hospeda a
+    corrida (relógio monotônico); o tempo de cada jogador vai do início da
+    corrida até a última letra dele, mais as penalidades.
+    """
+    __slots__ = ('palavra', 'tamanho', 'transicoes', 'esperadas', 'pais', 'profundidades', 'participantes',
+                 'estados', 'erros', 'fins', 'status', 'restantes', 'inicio', 'penalidade_erro', 'relogio')
+
+    def __init__(self, palavra, participantes, penalidade_erro=PENALIDADE_ERRO_PADRAO, relogio=time.monotonic,
+                 alternativas=()):
+        self.palavra = palavra.upper()
+        self.tamanho = len(self.palavra)
+        self._montar_tabela([self.palavra] + [a.upper() for a in alternativas
+                                              if len(a) == self.tamanho and a.upper() != self.palavra])
+        self.participantes = list(participantes)
+        quantidade = len(self.participantes)
+        self.estados = [0] * quantidade
+        self.erros = [0] * quantidade
+        self.fins = [None] * quantidade
+        self.status = [None] * quantidade
+        self.restantes = quantidade
+        self.inicio = None
+        self.penalidade_erro = penalidade_erro
+        self.relogio = relogio
+
+    def _montar_tabela(self, solucoes):
+        """Trie das soluções sem acento; cada estado guarda a letra (com acento) que leva até ele"""
+        self.transicoes = [{}]
+        self.esperadas = ['']
+        self.pais = [0]
+        self.profundidades = [0]
+        for solucao in solucoes:
+            estado = 0
+            for letra in solucao:
+                sem_acento = letra_sem_acento(letra)
+                proximo = self.transicoes[estado].get(sem_acento)
+                if proximo is None:
+                    proximo = self.transicoes[estado][sem_acento] = len(self.transicoes)
+                    self.transicoes.append({})
+                    self.esperadas.append(letra)
+                    self.pais.append(estado)
+                    self.profundidades.append(self.profundidades[estado] + 1)
+                estado = proximo
+
+    @property
+    def encerrada(self):
+        return self.restantes == 0
+
+    def iniciar(self):
+        self.inicio = self.relogio()
+
+    def posicao(self, idx):
+        """Quantas letras o participante já acertou"""
+        return self.profundidades[self.estados[idx]]
+
+    def palavra_de(self, idx):
+        """O que o participante montou até agora, com os acentos da solução que ele seguiu"""
+        letras = []
+        estado = self.estados[idx]
+        while estado:
+            letras.append(self.esperadas[estado])
+            estado = self.pais[estado]
+        return ''.join(reversed(letras))
+
+    def guess(self, idx, letra, instante=None):
+        """Confere a letra do participante `idx`; devolve uma Tentativa (None se ele já terminou)"""
+        if self.status[idx] is not None:
+            return None
+        letra = letra.upper()
+        estado = self.estados[idx]
+        proximo = self.transicoes[estado].get(letra_sem_acento(letra))
+        if proximo is None:
+            self.erros[idx] += 1
+            return Tentativa(letra, None, self.profundidades[estado], False, False)
+        self.estados[idx] = proximo
+        completa = self.profundidades[proximo] == self.tamanho
+        if completa:
+            self._terminar(idx, STATUS_ADIVINHOU, instante)
+        return Tentativa(letra, self.esperadas[proximo], self.profundidades[estado], True, completa)
+
+    def give_up(self, idx, instante=None):
+        if self.status[idx] is None:
+            self._terminar(idx, STATUS_DESISTIU, instante)
+        return self.status[idx]
+
+    def finish(self, instante=None):
+        """Encerra a corrida (tempo esgotado): quem ainda não terminou fica INCOMPLETA"""
+        for idx, status in enumerate(self.status):
+            if status is None:
+                self._terminar(idx, STATUS_INCOMPLETA, instante)
+
+    def _terminar(self, idx, status, instante):
+        self.fins[idx] = self.relogio() if instante is None else instante
+        self.status[idx] = status
+        self.restantes -= 1
+
+    def tempo(self, idx, instante=None):
+        """Tempo do participante com as penalidades (até agora, se ele ainda não terminou)"""
+        if self.inicio is None:
+            return 0.0
+        fim = self.fins[idx]
+        if fim is None:
+            fim = self.relogio() if instante is None else instante
+        return (fim - self.inicio) + self.erros[idx] * self.penalidade_erro
+
+    def tempo_final(self, idx):
+        return self.tempo(idx) if self.status[idx] == STATUS_ADIVINHOU else float('inf')
+
+    def classificacao(self):
+        """Índices dos participantes: quem terminou por tempo, depois quem está mais adiantado, desistentes no fim"""
+        def chave(idx):
+            status = self.status[idx]
+            if status == STATUS_ADIVINHOU:
+                return (0, self.tempo(idx), self.erros[idx])
+            if status == STATUS_DESISTIU:
+                return (2, 0, 0)
+            return (1, -self.posicao(idx), self.erros[idx])
+        return sorted(range(len(self.participantes)), key=chave)
+
+
+class Jogador:
+    __slots__ = ('nome', 'erros_rodada', 'tempo_rodada', 'palavra_a_adivinhar', 'dificuldade_rodada',
+                 'status_rodada', 'palavra_adivinhada_rodada', 'tempo_total', 'erros_acumulados',
+                 'tempo_total_partida', 'erros_total_partida', 'palavra_definida_por_mim', 'rodadas_adivinhadas')
+
+    def __init__(self, nome):
+        self.nome = nome
+        self.tempo_total = 0.0
+        self.erros_acumulados = 0
+        self.tempo_total_partida = 0.0
+        self.erros_total_partida = 0
+        self.rodadas_adivinhadas = 0
+        self.palavra_definida_por_mim = ''
+        self.limpar_rodada()
+
+    def limpar_rodada(self):
+        self.erros_rodada = 0
+        self.tempo_rodada = 0.0
+        self.palavra_a_adivinhar = ''
+        self.dificuldade_rodada = ''
+        self.status_rodada = ''
+        self.palavra_adivinhada_rodada = ''
+
+
+class Partida:
+    """Jogadores de uma partida e o rodízio de quem define e quem adivinha.
+
+    No modo solo há um único jogador, que adivinha palavras do sistema. No
+    multiplayer cada jogador define uma palavra para o seguinte; a partida
+    acaba quando o papel de definidor volta ao primeiro jogador. Na corrida
+    (só em rede) o rodízio do definidor é o mesmo, mas todos os outros
+    adivinham a palavra dele ao mesmo tempo (ver Corrida).
+    """
+    __slots__ = ('jogadores', 'modo', 'definidor_idx', 'atual_idx', 'penalidade_erro', 'relogio')
+
+    def __init__(self, nomes=(), modo='solo', penalidade_erro=PENALIDADE_ERRO_PADRAO, relogio=time.time):
+        self.jogadores = [Jogador(nome) for nome in nomes]
+        self.modo = modo
+        self.definidor_idx = 0
+        self.atual_idx = 0
+        self.penalidade_erro = penalidade_erro
+        self.relogio = relogio
+
+    @property
+    def definidor(self):
+        return self.jogadores[self.definidor_idx]
+
+    @property
+    def adivinhador_idx(self):
+        if self.modo == 'solo':
+            return 0
+        return (self.definidor_idx + 1) % len(self.jogadores)
+
+    @property
+    def jogador_atual(self):
+        return self.jogadores[self.atual_idx]
+
+    @property
+    def ultima_rodada(self):
+        """No multiplayer, indica se a rodada em andamento é a última da partida"""
+        return self.modo == 'multiplayer' and self.adivinhador_idx == 0
+
+    def definir_palavra(self, palavra, dificuldade):
+        """Entrega a palavra ao próximo adivinhador e o torna o jogador atual"""
+        self.atual_idx = self.adivinhador_idx
+        jogador = self.jogadores[self.atual_idx]
+        jogador.palavra_a_adivinhar = palavra.upper()
+        jogador.dificuldade_rodada = dificuldade
+        if self.modo == 'multiplayer':
+            self.definidor.palavra_definida_por_mim = palavra.upper()
+        return jogador
+
+    def nova_rodada(self, alternativas=()):
+        return Rodada(self.jogador_atual.palavra_a_adivinhar, self.penalidade_erro, self.relogio, alternativas)
+
+    def registrar_resultado(self, rodada):
+        """Copia o resultado da rodada encerrada para o jogador atual"""
+        jogador = self.jogador_atual
+        jogador.erros_rodada = rodada.erros_final()
+        jogador.tempo_rodada = rodada.tempo_final()
+        jogador.palavra_adivinhada_rodada = rodada.palavra
+        jogador.status_rodada = rodada.status
+        if self.modo == 'solo':
+            jogador.tempo_total = jogador.tempo_rodada
+            jogador.erros_acumulados = jogador.erros_rodada
+        return jogador
+
+    def registrar_corrida(self, corrida):
+        """Soma o resultado de cada participante da corrida encerrada ao total dele na partida"""
+        por_nome = {jogador.nome: jogador for jogador in self.jogadores}
+        for idx, nome in enumerate(corrida.participantes):
+            jogador = por_nome[nome]
+            status = corrida.status[idx]
+            jogador.status_rodada = status
+            jogador.tempo_rodada = corrida.tempo_final(idx)
+            jogador.erros_rodada = STATUS_DESISTIU if status == STATUS_DESISTIU else corrida.erros[idx]
+            jogador.palavra_adivinhada_rodada = corrida.palavra_de(idx)
+            if status == STATUS_ADIVINHOU:
+                jogador.rodadas_adivinhadas += 1
+                jogador.tempo_total_partida += jogador.tempo_rodada
+                jogador.erros_total_partida += corrida.erros[idx]
+
+    def avancar_definidor(self):
+        """Passa o papel de definidor adiante; devolve True quando a partida terminou"""
+        self.definidor_idx = (self.definidor_idx + 1) % len(self.jogadores)
+        return self.definidor_idx == 0
+
+    def classificacao(self):
+        """Totaliza a partida multiplayer: (quem adivinhou por tempo/erros, demais por nome)"""
+        if self.modo == 'corrida':
+            # Totais já somados a cada corrida: mais palavras adivinhadas, depois menor tempo e menos erros
+            ordenados = sorted([j for j in self.jogadores if j.rodadas_adivinhadas],
+                               key=lambda j: (-j.rodadas_adivinhadas, j.tempo_total_partida, j.erros_total_partida))
+            demais = sorted([j for j in self.jogadores if not j.rodadas_adivinhadas], key=lambda j: j.nome)
+            return ordenados, demais
+        for jogador in self.jogadores:
+            jogador.tempo_total_partida = 0.0
+            jogador.erros_total_partida = 0
+            if jogador.status_rodada == STATUS_ADIVINHOU and jogador.tempo_rodada != float('inf'):
+                jogador.tempo_total_partida += jogador.tempo_rodada
+                jogador.erros_total_partida += jogador.erros_rodada
+            elif jogador.status_rodada == STATUS_INCOMPLETA:
+                jogador.tempo_total_partida = float('inf')
+                jogador.erros_total_partida = 9999
+
+        ordenados = sorted(
+            [j for j in self.jogadores if j.status_rodada == STATUS_ADIVINHOU and j.tempo_rodada != float('inf')],
+            key=lambda j: (j.tempo_total_partida, j.erros_total_partida)
+        )
+        demais = sorted(
+            [j for j in self.jogadores if j.status_rodada != STATUS_ADIVINHOU or j.tempo_rodada == float('inf')],
+            key=lambda j: j.nome
+        )
+        return ordenados, demais
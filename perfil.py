@@ -0,0 +1,210 @@
+"""Perfis do jogo: rastro da inicialização e amostrador da thread principal.
+
+Rastro (game.py --profile-startup): formato Chrome trace (chrome://tracing,
+Perfetto). Desligado, trecho() devolve sempre o mesmo contexto vazio: o
+custo no jogo normal é uma chamada de função. Ligado, cada fase da
+inicialização vira um evento com início e duração, na thread em que rodou
+(o dicionário e os sons carregam em threads próprias), e cada módulo
+importado vira um trecho "import <módulo>" aninhado sob quem o importou.
+
+Amostrador (atalho escondido no jogo): uma thread que, enquanto ligada,
+lê a pilha da thread principal algumas centenas de vezes por segundo e
+conta as pilhas iguais. Grava no formato "collapsed" do flamegraph.pl /
+speedscope / inferno. Desligado não existe thread nenhuma; ligado, o
+intervalo cresce sozinho se ler a pilha custar mais que CUSTO_MAXIMO do
+tempo.
+"""
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+INTERVALO_AMOSTRAGEM_S = 0.005  # 200 amostras por segundo, se o custo permitir
+CUSTO_MAXIMO = 0.02  # Fração do tempo que o amostrador pode tirar do jogo (ele disputa o GIL)
+
+_NADA = contextlib.nullcontext()
+
+rastro = None  # Rastro ativo, ou None com o perfil desligado
+
+
+class Rastro:
+    """Eventos "X" (início + duração) em microssegundos desde `origem` (um time.perf_counter())"""
+
+    def __init__(self, origem=None):
+        self.origem = time.perf_counter() if origem is None else origem
+        self.pid = os.getpid()
+        self.eventos = []  # list.append é atômico: threads registram sem trava
+        self.threads = {}
+        self.destino = None  # Arquivo onde encerrar() grava o rastro
+
+    def _agora_us(self):
+        return (time.perf_counter() - self.origem) * 1e6
+
+    def registrar(self, nome, inicio_us, fim_us, categoria="inicializacao"):
+        thread = threading.current_thread()
+        self.threads[thread.ident] = thread.name
+        self.eventos.append({"name": nome, "cat": categoria, "ph": "X", "ts": round(inicio_us, 1),
+                             "dur": round(fim_us - inicio_us, 1), "pid": self.pid, "tid": thread.ident})
+
+    @contextlib.contextmanager
+    def trecho(self, nome, categoria="inicializacao"):
+        inicio = self._agora_us()
+        try:
+            yield
+        finally:
+            self.registrar(nome, inicio, self._agora_us(), categoria)
+
+    def marco(self, nome):
+        """Evento instantâneo (ex.: primeira pintura)"""
+        thread = threading.current_thread()
+        self.threads[thread.ident] = thread.name
+        self.eventos.append({"name": nome, "cat": "marco", "ph": "i", "s": "p", "ts": round(self._agora_us(), 1),
+                             "pid": self.pid, "tid": thread.ident})
+
+    def gravar(self, caminho):
+        nomes = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": ident, "args": {"name": nome}}
+                 for ident, nome in list(self.threads.items())]
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": nomes + list(self.eventos), "displayTimeUnit": "ms"}, f)
+
+
+class _CarregadorMedido:
+    """Envolve o loader de um módulo e mede a execução dele (os imports internos ficam aninhados)"""
+
+    def __init__(self, carregador, nome):
+        self._carregador = carregador
+        self._nome = nome
+
+    def create_module(self, spec):
+        return self._carregador.create_module(spec)
+
+    def exec_module(self, modulo):
+        with trecho(f"import {self._nome}", "importacao"):
+            self._carregador.exec_module(modulo)
+
+    def __getattr__(self, nome):
+        return getattr(self._carregador, nome)
+
+
+class _MedidorImportacoes:
+    """Primeiro da sys.meta_path: acha o módulo pelos outros finders e troca o loader pelo medido"""
+
+    def find_spec(self, nome, caminho, alvo=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(nome, caminho, alvo)
+            if spec is not None:
+                break
+        else:
+            return None
+        if rastro is not None and spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _CarregadorMedido(spec.loader, nome)
+        return spec
+
+
+def iniciar(origem=None):
+    """Liga o perfil; chame antes dos imports que devem ser medidos"""
+    global rastro
+    rastro = Rastro(origem)
+    sys.meta_path.insert(0, _MedidorImportacoes())
+    return rastro
+
+
+def trecho(nome, categoria="inicializacao"):
+    if rastro is None:
+        return _NADA
+    return rastro.trecho(nome, categoria)
+
+
+def marco(nome):
+    if rastro is not None:
+        rastro.marco(nome)
+
+
+def encerrar(caminho=None):
+    """Grava o rastro (em `caminho` ou no destino do rastro) e desliga a medição de imports"""
+    global rastro
+    if rastro is None:
+        return
+    caminho = caminho or rastro.destino
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, _MedidorImportacoes)]
+    try:
+        rastro.gravar(caminho)
+        logging.info(f"Perfil da inicialização gravado em {caminho} ({len(rastro.eventos)} eventos).")
+    except OSError as e:
+        logging.error(f"Não foi possível gravar o perfil da inicialização em {caminho}: {e}")
+    rastro = None
+
+
+# ============================================================================
+# AMOSTRADOR DA THREAD PRINCIPAL
+# ============================================================================
+
+class Amostrador:
+    """Conta as pilhas da thread `ident` (a principal, por padrão) até parar()"""
+
+    def __init__(self, ident=None, intervalo=INTERVALO_AMOSTRAGEM_S, custo_maximo=CUSTO_MAXIMO):
+        self.ident = threading.main_thread().ident if ident is None else ident
+        self.intervalo = intervalo
+        self.custo_maximo = custo_maximo
+        self.pilhas = Counter()  # tupla de code objects (raiz primeiro) -> amostras
+        self.amostras = 0
+        self.custo_s = 0.0
+        self.inicio = 0.0
+        self.duracao = 0.0
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        self.inicio = time.perf_counter()
+        self._thread = threading.Thread(target=self._amostrar, name="amostrador-perfil", daemon=True)
+        self._thread.start()
+
+    def _amostrar(self):
+        ident = self.ident
+        intervalo = self.intervalo
+        pilhas = self.pilhas
+        while not self._parar.wait(intervalo):
+            inicio = time.perf_counter()
+            quadro = sys._current_frames().get(ident)
+            if quadro is None:
+                break  # A thread principal acabou
+            pilha = []
+            while quadro is not None:
+                pilha.append(quadro.f_code)
+                quadro = quadro.f_back
+            del quadro
+            pilhas[tuple(reversed(pilha))] += 1
+            self.amostras += 1
+            custo = time.perf_counter() - inicio
+            self.custo_s += custo
+            # Pilhas fundas custam mais: espaça as amostras para o custo não passar do limite
+            intervalo = max(self.intervalo, custo / self.custo_maximo)
+
+    def parar(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duracao = time.perf_counter() - self.inicio
+
+    def gravar(self, caminho):
+        """Uma linha por pilha: "raiz;...;folha contagem" (formato collapsed)"""
+        nomes = {}
+
+        def nome(codigo):
+            if codigo not in nomes:
+                nomes[codigo] = f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})"
+            return nomes[codigo]
+
+        with open(caminho, "w", encoding="utf-8") as f:
+            for pilha, quantidade in self.pilhas.most_common():
+                f.write(";".join(nome(c).replace(";", ":") for c in pilha) + f" {quantidade}\n")
+
+    def resumo(self):
+        return (f"{self.amostras} amostras em {self.duracao:.1f}s "
+                f"(custo da amostragem: {100 * self.custo_s / max(self.duracao, 1e-9):.2f}% do tempo)")
@@ -0,0 +1,141 @@
+"""Protocolo do jogo em rede: mensagens JSON, uma por linha, sobre TCP.
+
+Toda mensagem é um objeto com o campo "tipo". O servidor (servidor.py) é
+quem decide tudo (palavra secreta, acertos, tempo e placar); o cliente só
+envia o que o jogador fez e exibe o que o servidor respondeu.
+
+Cliente -> servidor:
+    entrar      {sala, nome}       sala vazia cria uma sala nova
+    iniciar     {modo}             só o anfitrião (primeiro a entrar); modo "turnos" ou "corrida"
+    palavra     {palavra}          palavra secreta, só do definidor da vez
+    letra       {letra}            tentativa, só do adivinhador da vez
+    desistir    {}
+    assistir    {sala}             entra como espectador (só leitura) de uma sala existente
+    sair        {}
+
+Servidor -> cliente:
+    entrou      {sala, jogador, anfitriao}
+    sala        {jogadores, anfitriao, em_jogo, modo}
+    definir     {adivinhador}              sua vez de escolher a palavra
+    aguardando  {definidor, adivinhador}
+    rodada      {adivinhador, definidor, tamanho, letras[, modo]}
+    tentativa   {letra, posicao, acertou, letra_correta, erros, tempo}   só a quem enviou a letra
+    progresso   {adivinhador, posicao, acertou, letra_correta, erros}     aos demais (turnos)
+    corrida     {classificacao: [{nome, posicao, erros, status, tempo}]} ao vivo (corrida)
+    fim_rodada  {jogador, palavra, status, tempo, erros}                  turnos
+                {modo, palavra, resultados: [como em "corrida"]}          corrida
+    placar      {classificacao: [{nome, tempo, erros, status[, adivinhadas]}]}
+    encerrada   {motivo}
+    erro        {mensagem}
+
+Servidor -> espectador:
+    estado      {v, s, t}          estado completo: ao entrar e depois de ficar para trás
+    delta       {v, d, r, t}       campos de `s` que mudaram (d) e que sumiram (r)
+    encerrada   {motivo}           a sala foi fechada
+
+`v` é a versão do estado, `t` os segundos decorridos da rodada (null fora
+dela). Os campos de `s` são sala, modo, jogadores, fase ("saguao",
+"definindo" ou "rodada"), definidor, letras, palavra (a última revelada) e
+placar, mais um "c.<nome>" por adivinhador com [reveladas, erros, status,
+tempo]. Um delta substitui cada campo inteiro; aplicar é `s.update(d)` e
+apagar as chaves de `r`.
+"""
+import json
+import logging
+import queue
+import socket
+import threading
+
+PORTA_PADRAO = 5050
+TAMANHO_MAX_MENSAGEM = 4096  # Linhas maiores derrubam a conexão (ninguém manda isso jogando)
+
+
+def codificar(mensagem):
+    return json.dumps(mensagem, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def decodificar(linha):
+    mensagem = json.loads(linha)
+    if not isinstance(mensagem, dict) or not isinstance(mensagem.get('tipo'), str):
+        raise ValueError("mensagem sem 'tipo'")
+    return mensagem
+
+
+def separar_endereco(texto, porta_padrao=PORTA_PADRAO):
+    """'host:porta' (ou só 'host') -> (host, porta)"""
+    host, _, porta = texto.strip().rpartition(':')
+    if not host:
+        return texto.strip() or '127.0.0.1', porta_padrao
+    return host, int(porta)
+
+
+def aumentar_limite_arquivos():
+    """Sobe o limite de arquivos abertos até o máximo permitido (cada conexão é um descritor)"""
+    try:
+        import resource
+    except ImportError:  # Windows: o limite de sockets não passa por aqui
+        return None
+    atual, maximo = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if maximo != resource.RLIM_INFINITY and atual < maximo:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (maximo, maximo))
+            atual = maximo
+        except (ValueError, OSError) as e:
+            logging.warning(f"Não foi possível aumentar o limite de arquivos abertos: {e}")
+    return atual
+
+
+class ClienteRede:
+    """Conexão do cliente fino com o servidor, para usar de uma interface síncrona.
+
+    Uma thread lê as mensagens e as coloca numa fila; a interface as
+    recolhe com `receber()` (sem bloquear) no seu próprio laço. Quando a
+    conexão cai, a fila recebe {'tipo': 'desconectado'}.
+    """
+
+    def __init__(self, host, porta=PORTA_PADRAO, timeout=5):
+        self.mensagens = queue.Queue()
+        self.conexao = socket.create_connection((host, porta), timeout=timeout)
+        self.conexao.settimeout(None)
+        self.conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._trava_envio = threading.Lock()
+        self._leitor = threading.Thread(target=self._ler, daemon=True)
+        self._leitor.start()
+        logging.info(f"Conectado ao servidor {host}:{porta}.")
+
+    def _ler(self):
+        try:
+            with self.conexao.makefile('rb') as arquivo:
+                for linha in arquivo:
+                    try:
+                        self.mensagens.put(decodificar(linha))
+                    except ValueError as e:
+                        logging.warning(f"Mensagem inválida do servidor ignorada: {e}")
+        except OSError as e:
+            logging.info(f"Conexão com o servidor encerrada: {e}")
+        self.mensagens.put({'tipo': 'desconectado'})
+
+    def enviar(self, tipo, **campos):
+        dados = codificar({'tipo': tipo, **campos})
+        with self._trava_envio:
+            self.conexao.sendall(dados)
+
+    def receber(self):
+        """Mensagens que chegaram desde a última chamada"""
+        recebidas = []
+        while True:
+            try:
+                recebidas.append(self.mensagens.get_nowait())
+            except queue.Empty:
+                return recebidas
+
+    def fechar(self):
+        try:
+            self.enviar('sair')
+        except OSError:
+            pass
+        try:
+            self.conexao.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.conexao.close()
@@ -0,0 +1,671 @@
+"""Servidor de partidas em rede do Desafio de Rivais (asyncio, um processo, um núcleo).
+
+Cada sala roda uma Partida do motor; o servidor guarda a palavra secreta,
+confere as letras, marca o tempo com o relógio monotônico dele e monta o
+placar. Há dois modos: "turnos" (o multiplayer de sempre, um adivinha
+enquanto os outros assistem) e "corrida" (todos menos o definidor
+adivinham a mesma palavra ao mesmo tempo, com classificação ao vivo).
+
+Qualquer número de espectadores (telão, transmissão) pode acompanhar uma
+sala sem participar: recebem o estado inteiro ao entrar e depois só os
+campos que mudaram, agrupados em no máximo um envio por
+INTERVALO_ESPECTADORES_S, serializado uma única vez para todos.
+
+Os clientes (GameApp no modo "JOGAR EM REDE", ou o carga_servidor.py) só
+mandam o que o jogador fez. O protocolo está descrito em rede.py.
+
+Nada é feito por sala em segundo plano: não há tarefa por sala, só uma
+corrotina por conexão esperando a próxima linha (na corrida, dois timers
+do laço: o tempo limite e o próximo envio da classificação), e cada mensagem é
+tratada por inteiro (sem await) antes da próxima. Por isso milhares de
+salas cabem num único laço de eventos. O envio não espera o cliente ler:
+quem acumula mais que LIMITE_BUFFER_ENVIO sem ler é desconectado.
+
+Uso:
+    python servidor.py                              # 127.0.0.1:5050, pt_BR.dic + palavras.txt
+    python servidor.py --host 0.0.0.0 --porta 5050  # aceita jogadores da rede local
+    python servidor.py --sem-dicionario             # aceita qualquer palavra de 4 a 20 letras
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+
+from motor import Corrida, Partida, PENALIDADE_ERRO_PADRAO, STATUS_ADIVINHOU
+from rede import PORTA_PADRAO, TAMANHO_MAX_MENSAGEM, codificar, decodificar, aumentar_limite_arquivos
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+
+MAX_JOGADORES_SALA = 16
+TAMANHO_MIN_PALAVRA = 4
+TAMANHO_MAX_PALAVRA = 20
+TAMANHO_MAX_NOME = 20
+LIMITE_BUFFER_ENVIO = 256 * 1024  # bytes pendentes para um cliente antes de desconectá-lo
+LETRAS_CODIGO_SALA = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # Sem 0/O e 1/I, fáceis de confundir
+TAMANHO_CODIGO_SALA = 5
+
+MODO_TURNOS = "turnos"
+MODO_CORRIDA = "corrida"
+MODOS_SALA = (MODO_TURNOS, MODO_CORRIDA)
+TODOS = "TODOS OS RIVAIS"  # "Adivinhador" de uma corrida
+INTERVALO_CLASSIFICACAO_S = 0.2  # Classificação ao vivo da corrida: no máximo um envio por intervalo
+TEMPO_LIMITE_CORRIDA_S = 180.0  # Quem não terminou até aqui fica INCOMPLETA
+
+INTERVALO_ESPECTADORES_S = 0.1  # Atualizações para espectadores: no máximo uma por intervalo e por sala
+LOTE_ESPECTADORES = 64  # Envios por vez antes de devolver o laço aos jogadores
+LIMITE_ATRASO_ESPECTADOR = 64 * 1024  # Bytes pendentes a partir dos quais o espectador deixa de receber deltas
+
+
+class Conexao:
+    """Um cliente conectado; `sala` (jogador) e `assistindo` (espectador) são None enquanto ele não entrou"""
+    __slots__ = ('escritor', 'nome', 'sala', 'assistindo', 'atrasado')
+
+    def __init__(self, escritor):
+        self.escritor = escritor
+        self.nome = ''
+        self.sala = None
+        self.assistindo = None
+        self.atrasado = False  # Espectador que perdeu deltas e espera um estado completo
+
+    def enviar(self, mensagem):
+        self.enviar_bytes(codificar(mensagem))
+
+    def enviar_bytes(self, dados):
+        transporte = self.escritor.transport
+        if transporte.is_closing():
+            return
+        if transporte.get_write_buffer_size() > LIMITE_BUFFER_ENVIO:
+            logging.warning(f"Cliente '{self.nome}' não está lendo as mensagens; conexão encerrada.")
+            transporte.abort()
+            return
+        self.escritor.write(dados)
+
+    def recusar(self, mensagem):
+        self.enviar({'tipo': 'erro', 'mensagem': mensagem})
+
+
+class Sala:
+    """Jogadores conectados e, durante o jogo, a partida e a rodada em andamento.
+
+    `conexoes` segue a ordem de entrada (o primeiro é o anfitrião);
+    `na_partida` congela essa ordem no início, pois os índices da Partida
+    apontam para ela.
+    """
+    __slots__ = ('codigo', 'conexoes', 'modo', 'partida', 'na_partida', 'rodada', 'corrida', 'corredores',
+                 'aviso_classificacao', 'aviso_limite', 'letras', 'ultima_palavra', 'ultimos_resultados', 'placar',
+                 'espectadores', 'estado_publicado', 'versao', 'aviso_espectadores')
+
+    def __init__(self, codigo):
+        self.codigo = codigo
+        self.conexoes = []
+        self.modo = MODO_TURNOS
+        self.partida = None
+        self.na_partida = []
+        self.rodada = None
+        self.corrida = None
+        self.corredores = {}  # conexão -> índice dela na corrida
+        self.aviso_classificacao = None
+        self.aviso_limite = None
+        # Só para os espectadores: o que mostrar entre uma rodada e outra
+        self.letras = ''
+        self.ultima_palavra = ''
+        self.ultimos_resultados = {}
+        self.placar = None
+        self.espectadores = []
+        self.estado_publicado = {}
+        self.versao = 0
+        self.aviso_espectadores = None
+
+    @property
+    def em_rodada(self):
+        return self.rodada is not None or self.corrida is not None
+
+    def cancelar_avisos(self):
+        for aviso in (self.aviso_classificacao, self.aviso_limite):
+            if aviso is not None:
+                aviso.cancel()
+        self.aviso_classificacao = self.aviso_limite = None
+
+    @property
+    def anfitriao(self):
+        return self.conexoes[0] if self.conexoes else None
+
+    def transmitir(self, mensagem, exceto=None):
+        """Serializa uma vez e manda a mesma linha para todos (menos `exceto`)"""
+        dados = codificar(mensagem)
+        for conexao in self.conexoes:
+            if conexao is not exceto:
+                conexao.enviar_bytes(dados)
+
+    def estado_espectador(self):
+        """Estado da sala em campos planos, para comparar campo a campo (cada adivinhador em 'c.<nome>')"""
+        partida = self.partida
+        estado = {
+            'sala': self.codigo, 'modo': self.modo, 'jogadores': [c.nome for c in self.conexoes],
+            'fase': 'saguao' if partida is None else ('rodada' if self.em_rodada else 'definindo'),
+            'definidor': self.na_partida[partida.definidor_idx].nome if partida is not None else '',
+            'letras': self.letras, 'palavra': self.ultima_palavra, 'placar': self.placar,
+        }
+        if self.rodada is not None:
+            rodada = self.rodada
+            estado['c.' + partida.jogador_atual.nome] = [rodada.palavra[:rodada.indice], rodada.erros, None, None]
+        elif self.corrida is not None:
+            corrida = self.corrida
+            for idx, nome in enumerate(corrida.participantes):
+                tempo = _tempo_json(corrida.tempo(idx)) if corrida.status[idx] == STATUS_ADIVINHOU else None
+                estado['c.' + nome] = [corrida.palavra_de(idx), corrida.erros[idx], corrida.status[idx], tempo]
+        else:
+            estado.update(self.ultimos_resultados)
+        return estado
+
+    def estado(self):
+        return {'tipo': 'sala', 'jogadores': [c.nome for c in self.conexoes],
+                'anfitriao': self.anfitriao.nome if self.anfitriao else '', 'em_jogo': self.partida is not None,
+                'modo': self.modo}
+
+
+class ServidorPartidas:
+    """Salas e regras do jogo em rede; `atender` é o callback do asyncio.start_server"""
+
+    def __init__(self, indice=None, penalidade_erro=PENALIDADE_ERRO_PADRAO, relogio=time.monotonic, rng=None):
+        self.indice = indice
+        self.penalidade_erro = penalidade_erro
+        self.relogio = relogio
+        self.rng = rng or random.Random()
+        self.salas = {}
+        self.conexoes = 0
+        self.mensagens = 0
+        self.instante = 0.0  # Chegada da mensagem em tratamento, no relógio do servidor
+        self.tratadores = {
+            'entrar': self._entrar,
+            'iniciar': self._iniciar,
+            'palavra': self._palavra,
+            'letra': self._letra,
+            'desistir': self._desistir,
+            'assistir': self._assistir,
+        }
+
+    async def iniciar(self, host='127.0.0.1', porta=PORTA_PADRAO):
+        return await asyncio.start_server(self.atender, host, porta, limit=TAMANHO_MAX_MENSAGEM, backlog=4096)
+
+    async def atender(self, leitor, escritor):
+        conexao = Conexao(escritor)
+        self.conexoes += 1
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                self.instante = self.relogio()
+                self.mensagens += 1
+                try:
+                    mensagem = decodificar(linha)
+                except ValueError:
+                    conexao.recusar("Mensagem inválida.")
+                    continue
+                if mensagem['tipo'] == 'sair':
+                    break
+                tratador = self.tratadores.get(mensagem['tipo'])
+                if tratador is None:
+                    conexao.recusar(f"Tipo de mensagem desconhecido: {mensagem['tipo']}")
+                    continue
+                tratador(conexao, mensagem)
+                if conexao.sala is not None and conexao.sala.espectadores:
+                    self._agendar_espectadores(conexao.sala)
+        except (ConnectionError, ValueError) as e:
+            # ValueError: linha acima de TAMANHO_MAX_MENSAGEM
+            logging.info(f"Conexão de '{conexao.nome}' encerrada: {e}")
+        finally:
+            self.conexoes -= 1
+            self._sair(conexao)
+            escritor.close()
+
+    # ============================================================================
+    # SALAS
+    # ============================================================================
+
+    def _novo_codigo(self):
+        while True:
+            codigo = ''.join(self.rng.choice(LETRAS_CODIGO_SALA) for _ in range(TAMANHO_CODIGO_SALA))
+            if codigo not in self.salas:
+                return codigo
+
+    def _entrar(self, conexao, mensagem):
+        if conexao.sala is not None or conexao.assistindo is not None:
+            return conexao.recusar("Você já está numa sala.")
+        nome = str(mensagem.get('nome') or '').strip().upper()[:TAMANHO_MAX_NOME] or "JOGADOR"
+        codigo = str(mensagem.get('sala') or '').strip().upper() or self._novo_codigo()
+        sala = self.salas.get(codigo)
+        if sala is None:
+            sala = self.salas[codigo] = Sala(codigo)
+        elif sala.partida is not None:
+            return conexao.recusar("A partida desta sala já começou.")
+        elif len(sala.conexoes) >= MAX_JOGADORES_SALA:
+            return conexao.recusar(f"Sala cheia ({MAX_JOGADORES_SALA} jogadores).")
+        elif any(c.nome == nome for c in sala.conexoes):
+            return conexao.recusar(f"Já existe um jogador chamado {nome} nesta sala.")
+
+        conexao.nome = nome
+        conexao.sala = sala
+        sala.conexoes.append(conexao)
+        conexao.enviar({'tipo': 'entrou', 'sala': codigo, 'jogador': nome, 'anfitriao': sala.anfitriao.nome})
+        sala.transmitir(sala.estado())
+
+    def _sair(self, conexao):
+        if conexao.assistindo is not None:
+            conexao.assistindo.espectadores.remove(conexao)
+            conexao.assistindo = None
+        sala = conexao.sala
+        if sala is None:
+            return
+        conexao.sala = None
+        sala.conexoes.remove(conexao)
+        if not sala.conexoes:
+            self._fechar_sala(sala)
+            return
+        if sala.espectadores:
+            self._agendar_espectadores(sala)
+        if sala.partida is not None:
+            sala.cancelar_avisos()
+            sala.partida = None
+            sala.na_partida = []
+            sala.rodada = sala.corrida = None
+            sala.corredores = {}
+            sala.letras = ''
+            sala.ultimos_resultados = {}
+            sala.transmitir({'tipo': 'encerrada', 'motivo': f"{conexao.nome} saiu da sala."})
+        sala.transmitir(sala.estado())
+
+    # ============================================================================
+    # PARTIDA (AUTORIDADE DO SERVIDOR)
+    # ============================================================================
+
+    def _iniciar(self, conexao, mensagem):
+        sala = conexao.sala
+        if sala is None or conexao is not sala.anfitriao:
+            return conexao.recusar("Só o anfitrião da sala pode iniciar a partida.")
+        if sala.partida is not None:
+            return conexao.recusar("A partida já começou.")
+        if len(sala.conexoes) < 2:
+            return conexao.recusar("São necessários pelo menos 2 jogadores.")
+        modo = str(mensagem.get('modo') or MODO_TURNOS)
+        if modo not in MODOS_SALA:
+            return conexao.recusar(f"Modo desconhecido: {modo}")
+        sala.modo = modo
+        sala.placar = None
+        sala.ultimos_resultados = {}
+        sala.na_partida = list(sala.conexoes)
+        sala.partida = Partida([c.nome for c in sala.na_partida], 'corrida' if modo == MODO_CORRIDA else 'multiplayer',
+                               penalidade_erro=self.penalidade_erro, relogio=self.relogio)
+        logging.debug(f"Sala {sala.codigo}: partida iniciada com {len(sala.na_partida)} jogadores.")
+        sala.transmitir(sala.estado())
+        self._pedir_palavra(sala)
+
+    def _pedir_palavra(self, sala):
+        partida = sala.partida
+        definidor = sala.na_partida[partida.definidor_idx]
+        adivinhador = TODOS if sala.modo == MODO_CORRIDA else sala.na_partida[partida.adivinhador_idx].nome
+        definidor.enviar({'tipo': 'definir', 'adivinhador': adivinhador})
+        sala.transmitir({'tipo': 'aguardando', 'definidor': definidor.nome, 'adivinhador': adivinhador},
+                        exceto=definidor)
+
+    def validar_palavra(self, palavra):
+        """(palavra aceita, None) ou (None, motivo da recusa)"""
+        if not palavra.isalpha():
+            return None, "Digite uma palavra válida (apenas letras)."
+        if not TAMANHO_MIN_PALAVRA <= len(palavra) <= TAMANHO_MAX_PALAVRA:
+            return None, f"A palavra deve ter de {TAMANHO_MIN_PALAVRA} a {TAMANHO_MAX_PALAVRA} letras."
+        if self.indice is None or palavra in self.indice:
+            return palavra, None
+        # Sem acento digitado: aceita se só há uma forma acentuada no dicionário
+        equivalentes = [p for p in self.indice.equivalentes_sem_acento(palavra) if p in self.indice]
+        if len(equivalentes) == 1:
+            return equivalentes[0], None
+        if equivalentes:
+            return None, f"Digite com acento: {', '.join(p.upper() for p in equivalentes)}."
+        return None, "Palavra não encontrada no dicionário."
+
+    def _palavra(self, conexao, mensagem):
+        sala = conexao.sala
+        partida = sala.partida if sala else None
+        if partida is None or sala.em_rodada or conexao is not sala.na_partida[partida.definidor_idx]:
+            return conexao.recusar("Não é sua vez de definir a palavra.")
+        palavra, motivo = self.validar_palavra(str(mensagem.get('palavra') or '').strip().lower())
+        if palavra is None:
+            return conexao.recusar(motivo)
+
+        dificuldade, alternativas = '', ()
+        if self.indice is not None:
+            dificuldade = self.indice.nivel_da_palavra(palavra) or ''
+            alternativas = self.indice.anagramas(palavra)
+        if sala.modo == MODO_CORRIDA:
+            return self._iniciar_corrida(sala, conexao, palavra, alternativas)
+        partida.definir_palavra(palavra, dificuldade)
+        sala.rodada = rodada = partida.nova_rodada(alternativas)
+        letras = list(rodada.palavra)
+        self.rng.shuffle(letras)
+        sala.letras = ''.join(letras)
+        sala.ultima_palavra = ''
+        rodada.iniciar()
+        sala.transmitir({'tipo': 'rodada', 'adivinhador': partida.jogador_atual.nome, 'definidor': conexao.nome,
+                         'tamanho': len(letras), 'letras': ''.join(letras)})
+
+    def _adivinhador_da_vez(self, conexao):
+        """A rodada em andamento, se `conexao` é quem está adivinhando nela"""
+        sala = conexao.sala
+        if sala is None or sala.rodada is None or sala.rodada.encerrada:
+            return None
+        if conexao is not sala.na_partida[sala.partida.atual_idx]:
+            return None
+        return sala.rodada
+
+    def _letra(self, conexao, mensagem):
+        letra = str(mensagem.get('letra') or '')
+        if len(letra) != 1 or not letra.isalpha():
+            return conexao.recusar("Envie uma única letra.")
+        if conexao.sala is not None and conexao.sala.corrida is not None:
+            return self._letra_corrida(conexao, conexao.sala, letra)
+        rodada = self._adivinhador_da_vez(conexao)
+        if rodada is None:
+            return conexao.recusar("Não é sua vez de adivinhar.")
+        tentativa = rodada.guess(letra)
+        letra_correta = tentativa.letra_correta if tentativa.acertou else None
+        conexao.enviar({'tipo': 'tentativa', 'letra': tentativa.letra, 'posicao': tentativa.posicao,
+                        'acertou': tentativa.acertou, 'letra_correta': letra_correta, 'erros': rodada.erros,
+                        'tempo': round(rodada.tempo_decorrido(), 3)})
+        conexao.sala.transmitir({'tipo': 'progresso', 'adivinhador': conexao.nome, 'posicao': tentativa.posicao,
+                                 'acertou': tentativa.acertou, 'letra_correta': letra_correta,
+                                 'erros': rodada.erros}, exceto=conexao)
+        if tentativa.completa:
+            self._encerrar_rodada(conexao.sala)
+
+    def _desistir(self, conexao, mensagem):
+        if conexao.sala is not None and conexao.sala.corrida is not None:
+            return self._desistir_corrida(conexao, conexao.sala)
+        rodada = self._adivinhador_da_vez(conexao)
+        if rodada is None:
+            return conexao.recusar("Não há rodada sua para desistir.")
+        rodada.give_up()
+        self._encerrar_rodada(conexao.sala)
+
+    def _encerrar_rodada(self, sala):
+        partida, rodada = sala.partida, sala.rodada
+        rodada.finish()
+        jogador = partida.registrar_resultado(rodada)
+        sala.rodada = None
+        sala.ultima_palavra = rodada.palavra
+        sala.ultimos_resultados = {'c.' + jogador.nome: [rodada.palavra[:rodada.indice], rodada.erros, rodada.status,
+                                                         _tempo_json(jogador.tempo_rodada)]}
+        sala.transmitir({'tipo': 'fim_rodada', 'jogador': jogador.nome, 'palavra': rodada.palavra,
+                         'status': rodada.status, 'tempo': _tempo_json(jogador.tempo_rodada),
+                         'erros': rodada.erros})
+        if partida.avancar_definidor():
+            self._encerrar_partida(sala)
+        else:
+            self._pedir_palavra(sala)
+
+    def _encerrar_partida(self, sala):
+        ordenados, demais = sala.partida.classificacao()
+        # Só quem adivinhou tem tempo e erros; os demais aparecem com o status
+        classificacao = [{'nome': j.nome, 'tempo': _tempo_json(j.tempo_total_partida), 'erros': j.erros_total_partida,
+                          'status': j.status_rodada} for j in ordenados]
+        classificacao += [{'nome': j.nome, 'tempo': None, 'erros': None, 'status': j.status_rodada} for j in demais]
+        if sala.modo == MODO_CORRIDA:
+            for item, jogador in zip(classificacao, ordenados + demais):
+                item['adivinhadas'] = jogador.rodadas_adivinhadas
+        logging.debug(f"Sala {sala.codigo}: partida encerrada.")
+        sala.partida = None
+        sala.na_partida = []
+        sala.placar = classificacao
+        sala.transmitir({'tipo': 'placar', 'classificacao': classificacao})
+        sala.transmitir(sala.estado())
+
+
+    # ============================================================================
+    # CORRIDA (TODOS ADIVINHAM A MESMA PALAVRA)
+    # ============================================================================
+
+    def _iniciar_corrida(self, sala, definidor, palavra, alternativas):
+        corredores = [c for c in sala.na_partida if c is not definidor]
+        sala.partida.definidor.palavra_definida_por_mim = palavra.upper()
+        sala.corrida = corrida = Corrida(palavra, [c.nome for c in corredores], self.penalidade_erro, self.relogio,
+                                         alternativas)
+        sala.corredores = {c: idx for idx, c in enumerate(corredores)}
+        letras = list(corrida.palavra)
+        self.rng.shuffle(letras)
+        sala.letras = ''.join(letras)
+        sala.ultima_palavra = ''
+        corrida.iniciar()
+        sala.aviso_limite = asyncio.get_running_loop().call_later(TEMPO_LIMITE_CORRIDA_S, self._esgotar_corrida,
+                                                                  sala, corrida)
+        sala.transmitir({'tipo': 'rodada', 'modo': MODO_CORRIDA, 'adivinhador': TODOS, 'definidor': definidor.nome,
+                         'tamanho': len(letras), 'letras': ''.join(letras)})
+
+    def _letra_corrida(self, conexao, sala, letra):
+        idx = sala.corredores.get(conexao)
+        if idx is None:
+            return conexao.recusar("Você definiu a palavra desta corrida.")
+        corrida = sala.corrida
+        tentativa = corrida.guess(idx, letra, self.instante)
+        if tentativa is None:
+            return conexao.recusar("Você já terminou esta corrida.")
+        conexao.enviar({'tipo': 'tentativa', 'letra': tentativa.letra, 'posicao': tentativa.posicao,
+                        'acertou': tentativa.acertou, 'letra_correta': tentativa.letra_correta,
+                        'erros': corrida.erros[idx], 'tempo': round(corrida.tempo(idx, self.instante), 3)})
+        if corrida.encerrada:
+            self._encerrar_corrida(sala)
+        elif tentativa.completa:
+            self._publicar_classificacao(sala)
+        elif sala.aviso_classificacao is None:
+            # Letras chegam muito mais rápido do que vale a pena redesenhar a classificação
+            sala.aviso_classificacao = asyncio.get_running_loop().call_later(
+                INTERVALO_CLASSIFICACAO_S, self._publicar_classificacao, sala)
+
+    def _desistir_corrida(self, conexao, sala):
+        idx = sala.corredores.get(conexao)
+        if idx is None or sala.corrida.status[idx] is not None:
+            return conexao.recusar("Não há corrida sua para desistir.")
+        sala.corrida.give_up(idx, self.instante)
+        if sala.corrida.encerrada:
+            self._encerrar_corrida(sala)
+        else:
+            self._publicar_classificacao(sala)
+
+    def _classificacao_corrida(self, corrida):
+        """Posição de cada corredor; tempo só para quem já adivinhou"""
+        return [{'nome': corrida.participantes[idx], 'posicao': corrida.posicao(idx), 'erros': corrida.erros[idx],
+                 'status': corrida.status[idx],
+                 'tempo': _tempo_json(corrida.tempo(idx)) if corrida.status[idx] == STATUS_ADIVINHOU else None}
+                for idx in corrida.classificacao()]
+
+    def _publicar_classificacao(self, sala):
+        if sala.aviso_classificacao is not None:
+            sala.aviso_classificacao.cancel()
+            sala.aviso_classificacao = None
+        if sala.corrida is not None:
+            sala.transmitir({'tipo': 'corrida', 'classificacao': self._classificacao_corrida(sala.corrida)})
+
+    def _esgotar_corrida(self, sala, corrida):
+        sala.aviso_limite = None
+        if sala.corrida is corrida:
+            corrida.finish()
+            self._encerrar_corrida(sala)
+            if sala.espectadores:
+                self._agendar_espectadores(sala)
+
+    def _encerrar_corrida(self, sala):
+        corrida = sala.corrida
+        sala.cancelar_avisos()
+        sala.ultimos_resultados = {k: v for k, v in sala.estado_espectador().items() if k.startswith('c.')}
+        sala.ultima_palavra = corrida.palavra
+        sala.corrida = None
+        sala.corredores = {}
+        sala.partida.registrar_corrida(corrida)
+        sala.transmitir({'tipo': 'fim_rodada', 'modo': MODO_CORRIDA, 'palavra': corrida.palavra,
+                         'resultados': self._classificacao_corrida(corrida)})
+        if sala.partida.avancar_definidor():
+            self._encerrar_partida(sala)
+        else:
+            self._pedir_palavra(sala)
+
+
+    # ============================================================================
+    # ESPECTADORES (SÓ LEITURA)
+    # ============================================================================
+
+    def _assistir(self, conexao, mensagem):
+        if conexao.sala is not None or conexao.assistindo is not None:
+            return conexao.recusar("Você já está numa sala.")
+        sala = self.salas.get(str(mensagem.get('sala') or '').strip().upper())
+        if sala is None:
+            return conexao.recusar("Sala não encontrada.")
+        # Estado atual, não o último publicado: os deltas trazem valores absolutos, então reaplicar
+        # um campo que já está certo não muda nada
+        estado = sala.estado_espectador()
+        if not sala.espectadores:
+            sala.estado_publicado = estado  # Sem ninguém assistindo, o publicado ficou para trás
+        conexao.assistindo = sala
+        sala.espectadores.append(conexao)
+        conexao.enviar({'tipo': 'estado', 'v': sala.versao, 's': estado, 't': self._decorrido_rodada(sala)})
+
+    def _decorrido_rodada(self, sala):
+        """Segundos desde o início da rodada em andamento (o espectador conta o relógio a partir daqui)"""
+        em_jogo = sala.rodada or sala.corrida
+        if em_jogo is None or em_jogo.inicio is None:
+            return None
+        return round(self.relogio() - em_jogo.inicio, 3)
+
+    def _agendar_espectadores(self, sala):
+        if sala.aviso_espectadores is None:
+            sala.aviso_espectadores = asyncio.get_running_loop().call_later(
+                INTERVALO_ESPECTADORES_S, self._publicar_espectadores, sala)
+
+    def _publicar_espectadores(self, sala):
+        """Um delta (só os campos que mudaram) por intervalo, serializado uma vez para todos os espectadores"""
+        sala.aviso_espectadores = None
+        if not sala.espectadores:
+            return
+        estado = sala.estado_espectador()
+        anterior = sala.estado_publicado
+        alterados = {chave: valor for chave, valor in estado.items() if anterior.get(chave) != valor}
+        removidos = [chave for chave in anterior if chave not in estado]
+        decorrido = self._decorrido_rodada(sala)
+        delta = None
+        if alterados or removidos:
+            sala.estado_publicado = estado
+            sala.versao += 1
+            delta = codificar({'tipo': 'delta', 'v': sala.versao, 'd': alterados, 'r': removidos, 't': decorrido})
+        elif not any(espectador.atrasado for espectador in sala.espectadores):
+            return
+        completo = []  # Estado inteiro, serializado só se algum espectador atrasado precisar
+
+        def estado_completo():
+            if not completo:
+                completo.append(codificar({'tipo': 'estado', 'v': sala.versao, 's': estado, 't': decorrido}))
+            return completo[0]
+
+        self._espalhar(sala, tuple(sala.espectadores), delta, estado_completo, 0)
+
+    def _espalhar(self, sala, espectadores, delta, estado_completo, inicio):
+        """Envia em lotes, devolvendo o laço entre eles, para centenas de espectadores não atrasarem os jogadores.
+
+        Cada espectador tem seu próprio controle de fluxo: com muitos bytes
+        pendentes ele para de receber deltas (que dependem dos anteriores) e,
+        quando esvaziar, recebe de uma vez o estado completo mais recente.
+        """
+        fim = inicio + LOTE_ESPECTADORES
+        ainda_atrasados = False
+        for espectador in espectadores[inicio:fim]:
+            transporte = espectador.escritor.transport
+            if transporte.is_closing():
+                continue
+            pendente = transporte.get_write_buffer_size()
+            if espectador.atrasado:
+                if pendente == 0:
+                    espectador.atrasado = False
+                    espectador.enviar_bytes(estado_completo())
+                else:
+                    ainda_atrasados = True
+            elif delta is None:
+                continue
+            elif pendente > LIMITE_ATRASO_ESPECTADOR:
+                espectador.atrasado = ainda_atrasados = True
+            else:
+                espectador.enviar_bytes(delta)
+        if ainda_atrasados:
+            self._agendar_espectadores(sala)  # Tenta de novo mesmo que nada mude na sala
+        if fim < len(espectadores):
+            asyncio.get_running_loop().call_soon(self._espalhar, sala, espectadores, delta, estado_completo, fim)
+
+    def _fechar_sala(self, sala):
+        sala.cancelar_avisos()
+        if sala.aviso_espectadores is not None:
+            sala.aviso_espectadores.cancel()
+        dados = codificar({'tipo': 'encerrada', 'motivo': "A sala foi fechada."})
+        for espectador in sala.espectadores:
+            espectador.assistindo = None
+            espectador.enviar_bytes(dados)
+        sala.espectadores = []
+        del self.salas[sala.codigo]
+
+
+def _tempo_json(tempo):
+    """JSON não tem infinito: rodada sem tempo válido vai como null"""
+    return None if tempo == float('inf') else round(tempo, 3)
+
+
+def carregar_indice(base, camadas, mapear=False):
+    """Mesmo dicionário do multiplayer local: base compilada + camadas (palavras.txt)"""
+    if not os.path.exists(base):
+        logging.warning(f"Dicionário '{base}' não encontrado; o servidor aceitará qualquer palavra.")
+        return None
+    import dicionario
+    indice = dicionario.carregar_ou_compilar([base], mapear=mapear)
+    nomes = []
+    for caminho in camadas:
+        nome = os.path.splitext(os.path.basename(caminho))[0]
+        indice.carregar_camada(nome, caminho)
+        nomes.append(nome)
+    indice.ativar(*nomes)
+    logging.info(f"Dicionário do servidor: {len(indice.palavras)} palavras na base, camadas {nomes or 'nenhuma'}.")
+    return indice
+
+
+async def servir(servidor, host, porta):
+    tcp = await servidor.iniciar(host, porta)
+    enderecos = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in tcp.sockets)
+    logging.info(f"Servidor de partidas ouvindo em {enderecos}.")
+    print(f"Servidor ouvindo em {enderecos}", flush=True)
+    async with tcp:
+        await tcp.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO, help="0 escolhe uma porta livre")
+    parser.add_argument("--dicionario", default=os.path.join(PASTA_JOGO, "pt_BR.dic"), metavar="ARQUIVO")
+    parser.add_argument("--camada", action="append", metavar="ARQUIVO",
+                        help="palavras extras por cima da base (pode repetir; padrão: palavras.txt)")
+    parser.add_argument("--sem-dicionario", action="store_true", help="não valida as palavras no dicionário")
+    parser.add_argument("--pouca-memoria", action="store_true", help="lê o dicionário compilado via mmap")
+    parser.add_argument("--penalidade", type=float, default=PENALIDADE_ERRO_PADRAO)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    aumentar_limite_arquivos()
+    indice = None
+    if not args.sem_dicionario:
+        camadas = args.camada if args.camada is not None else [os.path.join(PASTA_JOGO, "palavras.txt")]
+        indice = carregar_indice(args.dicionario, camadas, args.pouca_memoria)
+    servidor = ServidorPartidas(indice, args.penalidade)
+    try:
+        asyncio.run(servir(servidor, args.host, args.porta))
+    except KeyboardInterrupt:
+        logging.info("Servidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Simulador Monte Carlo para calibrar as faixas de REGRAS_DIFICULDADE.
+
+Joga o dicionário inteiro com adivinhadores sintéticos (usando o motor,
+sem janela) e mede, palavra por palavra, quantos erros e quanto tempo
+cada uma custa. Dois modelos de jogador:
+
+- frequencia: sempre tenta a letra restante mais provável depois da
+  anterior (bigramas do próprio dicionário);
+- humano: igual, mas às vezes chuta uma letra qualquer e demora mais
+  quanto mais letras diferentes ainda sobram.
+
+As palavras rodam em lotes num pool de processos e cada lote concluído
+vai para um checkpoint; rodar de novo depois de uma interrupção só
+simula as palavras que ainda não estão lá. O checkpoint guarda uma
+impressão digital do dicionário: se ele mudou (por exemplo depois de
+atualizar o pt_BR.dic), a tabela de bigramas também mudou e os
+resultados antigos não valem mais, então tudo é simulado de novo.
+
+Uso:
+    python simulador.py
+    python simulador.py --jogadas 50 --processos 4
+    python simulador.py --dicionario pt_BR.dic --saida tabela_dificuldade.json
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import statistics
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dicionario import NIVEIS, TAMANHO_MAX, TAMANHO_MIN, ler_palavras
+from motor import Rodada, PENALIDADE_ERRO_PADRAO, letra_sem_acento
+
+PASTA_JOGO = os.path.dirname(os.path.abspath(__file__))
+
+MODELOS = {
+    'frequencia': {'ruido': 0.0, 'tempo_tecla': 0.25, 'variacao': 0.0, 'tempo_por_candidato': 0.0},
+    'humano': {'ruido': 0.3, 'tempo_tecla': 0.45, 'variacao': 0.5, 'tempo_por_candidato': 0.12},
+}
+MODELO_REFERENCIA = 'humano'  # Modelo cujo tempo médio define a dificuldade da palavra
+
+INICIO = '^'  # "Letra anterior" da primeira posição na tabela de bigramas
+
+
+# ============================================================================
+# TABELA DE BIGRAMAS
+# ============================================================================
+
+def montar_bigramas(palavras):
+    """Conta, para cada letra (sem acento), quais letras costumam vir depois dela"""
+    tabela = {}
+    for palavra in palavras:
+        anterior = INICIO
+        for letra in palavra.upper():
+            letra = letra_sem_acento(letra)
+            seguintes = tabela.setdefault(anterior, {})
+            seguintes[letra] = seguintes.get(letra, 0) + 1
+            anterior = letra
+    return tabela
+
+
+def impressao_dicionario(palavras):
+    """SHA-256 da lista de palavras: muda sempre que a lista (e com ela a tabela de bigramas) muda"""
+    resumo = hashlib.sha256()
+    for palavra in sorted(palavras):
+        resumo.update(palavra.encode("utf-8") + b"\n")
+    return resumo.hexdigest()
+
+
+# ============================================================================
+# ADIVINHADORES SINTÉTICOS
+# ============================================================================
+
+class RelogioSimulado:
+    """Relógio controlado pelo simulador, injetado na Rodada"""
+    __slots__ = ('agora',)
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def jogar(palavra, modelo, tabela, rng, penalidade_erro=PENALIDADE_ERRO_PADRAO):
+    """Joga uma rodada completa; devolve (erros, tempo com penalidades)"""
+    relogio = RelogioSimulado()
+    rodada = Rodada(palavra, penalidade_erro, relogio)
+    rodada.iniciar()
+    restantes = list(rodada.palavra)  # Letras embaralhadas ainda não colocadas
+    anterior = INICIO
+
+    while not rodada.completa:
+        seguintes = tabela.get(anterior, {})
+        # Cada letra diferente que sobrou, da mais provável para a menos provável
+        candidatos = sorted(set(restantes),
+                            key=lambda c: (seguintes.get(letra_sem_acento(c), 0), rng.random()),
+                            reverse=True)
+        while True:
+            if modelo['ruido'] and len(candidatos) > 1 and rng.random() < modelo['ruido']:
+                letra = rng.choice(candidatos)
+            else:
+                letra = candidatos[0]
+            pensar = modelo['tempo_por_candidato'] * len(candidatos)
+            tecla = modelo['tempo_tecla']
+            if modelo['variacao']:
+                tecla *= rng.lognormvariate(0.0, modelo['variacao'])
+            relogio.agora += tecla + pensar
+
+            tentativa = rodada.guess(letra)
+            if tentativa.acertou:
+                restantes.remove(tentativa.letra_correta)
+                anterior = letra_sem_acento(tentativa.letra_correta)
+                break
+            candidatos.remove(letra)  # Não repete uma letra já errada nesta posição
+
+    rodada.finish()
+    return rodada.erros, rodada.tempo_final()
+
+
+# ============================================================================
+# EXECUÇÃO EM PARALELO
+# ============================================================================
+
+_tabela_trabalhador = None
+
+
+def _iniciar_trabalhador(tabela):
+    global _tabela_trabalhador
+    _tabela_trabalhador = tabela
+
+
+def simular_lote(palavras, jogadas, semente, penalidade_erro, tabela=None):
+    """Roda `jogadas` partidas de cada modelo por palavra; devolve as médias por palavra"""
+    tabela = tabela if tabela is not None else _tabela_trabalhador
+    resultados = []
+    for palavra in palavras:
+        # Semente por palavra: o resultado não depende de lote, processo ou ordem
+        rng = random.Random(zlib.crc32(palavra.encode("utf-8")) ^ semente)
+        medias = {}
+        for nome, modelo in MODELOS.items():
+            erros = tempo = 0.0
+            for _ in range(jogadas):
+                e, t = jogar(palavra, modelo, tabela, rng, penalidade_erro)
+                erros += e
+                tempo += t
+            medias[nome] = {'erros': round(erros / jogadas, 3), 'tempo': round(tempo / jogadas, 3)}
+        resultados.append({'palavra': palavra, **medias})
+    return resultados
+
+
+def carregar_checkpoint(caminho, parametros, impressao):
+    """Resultados já simulados com os mesmos parâmetros e o mesmo dicionário ({palavra: resultado})"""
+    if not os.path.exists(caminho):
+        return {}
+    resultados = {}
+    with open(caminho, "r", encoding="utf-8") as f:
+        cabecalho = json.loads(f.readline() or "{}")
+        if cabecalho.get('parametros') != parametros:
+            logging.warning(f"Checkpoint {caminho} foi gerado com outros parâmetros; simulando tudo de novo.")
+            return {}
+        if cabecalho.get('dicionario') != impressao:
+            logging.warning(f"Checkpoint {caminho} foi gerado com outro dicionário (a tabela de bigramas mudou); "
+                            f"simulando tudo de novo.")
+            return {}
+        for linha in f:
+            try:
+                resultado = json.loads(linha)
+            except json.JSONDecodeError:
+                break  # Última linha cortada por uma interrupção
+            resultados[resultado['palavra']] = resultado
+    return resultados
+
+
+def simular(palavras, parametros, caminho_checkpoint, processos=None, tamanho_lote=500):
+    impressao = impressao_dicionario(palavras)
+    resultados = carregar_checkpoint(caminho_checkpoint, parametros, impressao)
+    pendentes = sorted(p for p in palavras if p not in resultados)
+    logging.info(f"{len(resultados)} palavras no checkpoint, {len(pendentes)} para simular.")
+
+    with open(caminho_checkpoint, "w", encoding="utf-8") as f:
+        f.write(json.dumps({'parametros': parametros, 'dicionario': impressao}) + "\n")
+        for palavra in sorted(resultados):
+            f.write(json.dumps(resultados[palavra], ensure_ascii=False) + "\n")
+
+        if pendentes:
+            tabela = montar_bigramas(palavras)
+            lotes = [pendentes[i:i + tamanho_lote] for i in range(0, len(pendentes), tamanho_lote)]
+            inicio = time.perf_counter()
+            concluidas = 0
+            with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                     initargs=(tabela,)) as pool:
+                futuros = [pool.submit(simular_lote, lote, parametros['jogadas'], parametros['semente'],
+                                       parametros['penalidade_erro']) for lote in lotes]
+                for futuro in as_completed(futuros):
+                    for resultado in futuro.result():
+                        resultados[resultado['palavra']] = resultado
+                        f.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+                    f.flush()
+                    concluidas += 1
+                    logging.info(f"Lote {concluidas}/{len(lotes)} concluído ({time.perf_counter() - inicio:.1f}s).")
+
+    return {p: resultados[p] for p in palavras}
+
+
+# ============================================================================
+# TABELA DE DIFICULDADE
+# ============================================================================
+
+def montar_tabela(resultados):
+    """Agrega por tamanho e sugere faixas de tamanho contíguas para cada nível.
+
+    Os cortes entre níveis são os tercis do tempo médio do modelo de
+    referência; cada tamanho vai para o nível em que cai a sua mediana.
+    """
+    pontuacoes = sorted(r[MODELO_REFERENCIA]['tempo'] for r in resultados.values())
+    if not pontuacoes:
+        return {}
+    cortes = [pontuacoes[len(pontuacoes) * i // len(NIVEIS)] for i in range(1, len(NIVEIS))]
+
+    por_tamanho = {}
+    for palavra, resultado in resultados.items():
+        por_tamanho.setdefault(len(palavra), []).append(resultado)
+
+    tamanhos = {}
+    nivel_anterior = 0
+    for tamanho in sorted(por_tamanho):
+        grupo = por_tamanho[tamanho]
+        mediana = statistics.median(r[MODELO_REFERENCIA]['tempo'] for r in grupo)
+        # Nunca volta para um nível mais fácil: as faixas ficam contíguas
+        nivel = max(nivel_anterior, sum(mediana >= corte for corte in cortes))
+        nivel_anterior = nivel
+        tamanhos[tamanho] = {
+            'palavras': len(grupo),
+            'nivel': NIVEIS[nivel],
+            'mediana_tempo': round(mediana, 2),
+            **{f'{nome}_erros': round(statistics.fmean(r[nome]['erros'] for r in grupo), 2) for nome in MODELOS},
+            **{f'{nome}_tempo': round(statistics.fmean(r[nome]['tempo'] for r in grupo), 2) for nome in MODELOS},
+        }
+
+    regras = {}
+    for nivel in NIVEIS:
+        faixa = [t for t, dados in tamanhos.items() if dados['nivel'] == nivel]
+        if faixa:
+            minimo, maximo = min(faixa), max(faixa)
+            regras[nivel] = {"min": minimo, "max": maximo,
+                             "descricao": f"Palavras de {minimo} a {maximo} letras"}
+    return {'cortes_tempo': [round(c, 2) for c in cortes], 'por_tamanho': tamanhos, 'regras_sugeridas': regras}
+
+
+def imprimir_tabela(tabela):
+    print(f"{'letras':>6} {'palavras':>9} {'erros (freq)':>13} {'erros (hum)':>12} {'tempo (hum)':>12}  nível")
+    for tamanho, dados in tabela['por_tamanho'].items():
+        print(f"{tamanho:>6} {dados['palavras']:>9} {dados['frequencia_erros']:>13.2f} "
+              f"{dados['humano_erros']:>12.2f} {dados['humano_tempo']:>11.2f}s  {dados['nivel']}")
+    print("\nREGRAS_DIFICULDADE = {")
+    for nivel, regra in tabela['regras_sugeridas'].items():
+        print(f'    "{nivel}": {json.dumps(regra, ensure_ascii=False)},')
+    print("}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dicionario", action="append", metavar="ARQUIVO",
+                        help="lista de palavras (pode repetir; padrão: pt_BR.dic e palavras.txt)")
+    parser.add_argument("--jogadas", type=int, default=20, help="partidas por palavra e por modelo")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--lote", type=int, default=500, help="palavras por tarefa do pool")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--penalidade", type=float, default=PENALIDADE_ERRO_PADRAO)
+    parser.add_argument("--checkpoint", default=os.path.join(PASTA_JOGO, "simulacao_checkpoint.jsonl"))
+    parser.add_argument("--saida", default=os.path.join(PASTA_JOGO, "tabela_dificuldade.json"))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    arquivos = args.dicionario or [os.path.join(PASTA_JOGO, nome) for nome in ("pt_BR.dic", "palavras.txt")]
+    palavras = set()
+    for arquivo in arquivos:
+        if os.path.exists(arquivo):
+            palavras |= ler_palavras(arquivo)
+    palavras = {p for p in palavras if TAMANHO_MIN <= len(p) <= TAMANHO_MAX}
+    if not palavras:
+        parser.error("nenhuma palavra encontrada nos dicionários informados")
+
+    parametros = {'jogadas': args.jogadas, 'semente': args.semente,
+                  'penalidade_erro': args.penalidade, 'modelos': MODELOS}
+    resultados = simular(palavras, parametros, args.checkpoint, args.processos, args.lote)
+    tabela = montar_tabela(resultados)
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump({'parametros': parametros, **tabela}, f, ensure_ascii=False, indent=2)
+    imprimir_tabela(tabela)
+    print(f"\nTabela salva em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
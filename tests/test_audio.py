@@ -0,0 +1,124 @@
+"""audio.GerenciadorAudio sem placa de som (driver "dummy" do SDL) e com relógio injetado."""
+import os
+import sys
+import unittest
+
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame.mixer  # noqa: E402
+
+from audio import ARQUIVOS_SOM, BancoSons, GerenciadorAudio  # noqa: E402
+
+
+class Relogio:
+    """Relógio manual: o teste decide quanto tempo passou entre duas teclas"""
+
+    def __init__(self):
+        self.agora = 100.0
+
+    def __call__(self):
+        return self.agora
+
+    def avancar(self, ms):
+        self.agora += ms / 1000
+
+
+class BancoFalso:
+    """Banco com sons longos (2 s de silêncio) para os canais ficarem ocupados durante o teste"""
+
+    def __init__(self, nomes):
+        frequencia, _, canais = pygame.mixer.get_init()
+        silencio = np.zeros(2 * frequencia * canais, dtype=np.int16).tobytes()
+        self.sons = {nome: pygame.mixer.Sound(buffer=silencio) for nome in nomes}
+
+    def obter(self, nome):
+        return self.sons.get(nome)
+
+
+class TesteGerenciadorAudio(unittest.TestCase):
+
+    def setUp(self):
+        self.relogio = Relogio()
+        self.audio = GerenciadorAudio(None, canais_por_classe={'teclado': 3}, janela_aglutinacao_ms=25.0,
+                                      relogio=self.relogio)
+        self.audio.inicializar_mixer(buffer=256)
+        self.audio.banco = BancoFalso(['som_teclado', 'som_acerto'])
+
+    def tearDown(self):
+        self.audio.encerrar()
+
+    def tecla(self, depois_de_ms):
+        self.relogio.avancar(depois_de_ms)
+        return self.audio.tocar('som_teclado')
+
+    def test_aglutina_teclas_dentro_da_janela(self):
+        self.assertTrue(self.tecla(0))
+        self.assertFalse(self.tecla(10))   # 10 ms depois da anterior: aglutinada
+        self.assertFalse(self.tecla(10))   # A janela conta da última tecla tocada (20 ms)
+        self.assertTrue(self.tecla(10))    # 30 ms depois da última tocada
+        self.assertEqual(self.audio.contadores['aglutinados'], 2)
+        self.assertEqual(self.audio.contadores['tocados'], 2)
+
+    def test_rouba_a_voz_mais_antiga_com_canais_ocupados(self):
+        canais = self.audio.canais['teclado']
+        for _ in canais:
+            self.assertTrue(self.tecla(50))
+        self.assertTrue(all(canal.get_busy() for canal in canais))
+        mais_antigo = min(canais, key=lambda c: self.audio.inicio_canal[id(c)])
+
+        self.assertTrue(self.tecla(50))
+        self.assertEqual(self.audio.contadores['roubados'], 1)
+        # O canal roubado recomeçou agora; os outros mantêm o início de antes
+        self.assertEqual(self.audio.inicio_canal[id(mais_antigo)], self.relogio.agora)
+        self.assertEqual(sum(self.audio.inicio_canal[id(c)] == self.relogio.agora for c in canais), 1)
+
+    def test_classes_nao_disputam_canais(self):
+        for _ in range(len(self.audio.canais['teclado']) + 2):
+            self.tecla(50)
+        self.assertTrue(self.audio.tocar('som_acerto'))
+        self.assertEqual(self.audio.contadores['roubados'], 2)  # Só o teclado roubou vozes
+        self.assertTrue(self.audio.tocando('acerto'))
+
+    def test_estatisticas(self):
+        self.tecla(0)
+        self.tecla(5)                      # aglutinada
+        for _ in range(3):
+            self.tecla(50)                 # a terceira destas rouba uma voz
+        self.assertFalse(self.audio.tocar('som_inexistente'))
+        estatisticas = self.audio.estatisticas()
+        self.assertEqual(estatisticas['tocados'], 4)
+        self.assertEqual(estatisticas['aglutinados'], 1)
+        self.assertEqual(estatisticas['roubados'], 1)
+        self.assertEqual(estatisticas['descartados'], 0)
+        self.assertEqual(estatisticas['vozes_perdidas'], 2)
+        # Com o relógio parado durante o play, o despacho medido é zero
+        self.assertEqual(estatisticas['despacho_medio_ms'], 0.0)
+        self.assertEqual(estatisticas['despacho_max_ms'], 0.0)
+        frequencia = pygame.mixer.get_init()[0]
+        self.assertAlmostEqual(estatisticas['latencia_buffer_ms'], round(256 / frequencia * 1000, 2))
+
+
+class TesteBancoSons(unittest.TestCase):
+
+    def setUp(self):
+        pygame.mixer.init()
+
+    def tearDown(self):
+        pygame.mixer.quit()
+
+    def test_um_carregador_por_banco(self):
+        banco = BancoSons(0.5, 0.5)
+        primeiro = banco.carregar_em_segundo_plano()
+        self.assertIs(banco.carregar_em_segundo_plano(), primeiro)  # Pedido repetido no meio: mesmo carregador
+        self.assertTrue(banco.concluido.wait(10))
+        self.assertEqual(set(banco.sons) | set(banco.falhas), set(ARQUIVOS_SOM.values()))
+        segundo = banco.carregar_em_segundo_plano()  # Depois de terminar, pode carregar de novo
+        self.assertIsNot(segundo, primeiro)
+        self.assertTrue(banco.concluido.wait(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""download.baixar_arquivo contra um servidor HTTP local (http.server), sem rede externa."""
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from download import ErroDownload, baixar_arquivo  # noqa: E402
+
+CONTEUDO = "".join(f"palavra{i}\n" for i in range(20000)).encode("utf-8")
+
+
+class Arquivo:
+    """O que o servidor de teste serve e o que ele registrou dos pedidos"""
+
+    def __init__(self, conteudo, etag):
+        self.conteudo = conteudo
+        self.etag = etag
+        self.cortar_em = None  # Se definido, a próxima resposta cai depois de tantos bytes
+        self.pedidos = []  # (status, cabeçalhos do pedido)
+
+
+class Servidor(BaseHTTPRequestHandler):
+    """GET com Range / If-Range / If-None-Match, como um servidor de arquivos estáticos"""
+
+    arquivo = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        arquivo = self.arquivo
+        conteudo = arquivo.conteudo
+        if self.headers.get('If-None-Match') == arquivo.etag:
+            self._responder(304, {'ETag': arquivo.etag}, b"")
+            return
+        intervalo = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if intervalo and (if_range is None or if_range == arquivo.etag):
+            inicio = int(intervalo.split('=')[1].split('-')[0])
+            if inicio >= len(conteudo):
+                self._responder(416, {'Content-Range': f"bytes */{len(conteudo)}"}, b"")
+                return
+            cabecalhos = {'ETag': arquivo.etag,
+                          'Content-Range': f"bytes {inicio}-{len(conteudo) - 1}/{len(conteudo)}"}
+            self._responder(206, cabecalhos, conteudo[inicio:])
+            return
+        self._responder(200, {'ETag': arquivo.etag}, conteudo)
+
+    def _responder(self, status, cabecalhos, corpo):
+        self.arquivo.pedidos.append((status, dict(self.headers)))
+        self.send_response(status)
+        for nome, valor in cabecalhos.items():
+            self.send_header(nome, valor)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        cortar_em, self.arquivo.cortar_em = self.arquivo.cortar_em, None
+        if cortar_em is not None:
+            # Conexão caindo no meio: parte do corpo e fecha
+            self.wfile.write(corpo[:cortar_em])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(corpo)
+
+
+class TesteBaixarArquivo(unittest.TestCase):
+
+    def setUp(self):
+        self.arquivo = Arquivo(CONTEUDO, '"v1"')
+        manipulador = type('Manipulador', (Servidor,), {'arquivo': self.arquivo})
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), manipulador)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.servidor.server_address[1]}/pt_BR.dic"
+        self.pasta = tempfile.TemporaryDirectory()
+        self.destino = os.path.join(self.pasta.name, "pt_BR.dic")
+        self.parcial = self.destino + ".parcial"
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.pasta.cleanup()
+
+    def baixar(self, **opcoes):
+        return baixar_arquivo(self.url, self.destino, timeout=5, tamanho_pedaco=4096, **opcoes)
+
+    def ler_destino(self):
+        with open(self.destino, "rb") as f:
+            return f.read()
+
+    def interromper(self, em_bytes):
+        self.arquivo.cortar_em = em_bytes
+        with self.assertRaises(ErroDownload):
+            self.baixar()
+        self.assertFalse(os.path.exists(self.destino))
+        self.assertTrue(os.path.exists(self.parcial))
+
+    def test_download_completo(self):
+        progresso = []
+        self.assertEqual(self.baixar(ao_progredir=lambda b, t: progresso.append((b, t))), self.destino)
+        self.assertEqual(self.ler_destino(), CONTEUDO)
+        self.assertEqual(progresso[-1], (len(CONTEUDO), len(CONTEUDO)))
+        self.assertFalse(os.path.exists(self.parcial))
+
+    def test_retoma_com_range_e_if_range(self):
+        self.interromper(50000)
+        recebido = os.path.getsize(self.parcial)
+        self.assertGreater(recebido, 0)
+        self.assertLess(recebido, len(CONTEUDO))
+
+        self.assertEqual(self.baixar(sha256=hashlib.sha256(CONTEUDO).hexdigest()), self.destino)
+        self.assertEqual(self.ler_destino(), CONTEUDO)
+        status, cabecalhos = self.arquivo.pedidos[-1]
+        self.assertEqual(status, 206)
+        self.assertEqual(cabecalhos['Range'], f"bytes={recebido}-")
+        self.assertEqual(cabecalhos['If-Range'], '"v1"')
+
+    def test_recomeca_quando_o_etag_muda(self):
+        self.interromper(50000)
+        novo = CONTEUDO.replace(b"palavra1\n", b"palavra1nova\n")
+        self.arquivo.conteudo, self.arquivo.etag = novo, '"v2"'
+
+        self.assertEqual(self.baixar(), self.destino)
+        self.assertEqual(self.ler_destino(), novo)  # Nada do parcial antigo foi emendado
+        status, cabecalhos = self.arquivo.pedidos[-1]
+        self.assertEqual(status, 200)
+        self.assertEqual(cabecalhos['If-Range'], '"v1"')
+
+    def test_304_quando_nada_mudou(self):
+        self.baixar()
+        self.assertIsNone(self.baixar(se_mudou=True))
+        status, cabecalhos = self.arquivo.pedidos[-1]
+        self.assertEqual(status, 304)
+        self.assertEqual(cabecalhos['If-None-Match'], '"v1"')
+        self.assertEqual(self.ler_destino(), CONTEUDO)
+
+        self.arquivo.conteudo, self.arquivo.etag = CONTEUDO + b"zebra\n", '"v2"'
+        self.assertEqual(self.baixar(se_mudou=True), self.destino)
+        self.assertEqual(self.ler_destino(), CONTEUDO + b"zebra\n")
+
+    def test_descarta_sha256_diferente(self):
+        with self.assertRaises(ErroDownload):
+            self.baixar(sha256="0" * 64)
+        self.assertFalse(os.path.exists(self.destino))
+        self.assertFalse(os.path.exists(self.parcial))
+        self.assertFalse(os.path.exists(self.parcial + ".json"))
+
+    def test_descarta_tamanho_diferente(self):
+        with self.assertRaises(ErroDownload):
+            self.baixar(tamanho=len(CONTEUDO) + 1)
+        self.assertFalse(os.path.exists(self.destino))
+        self.assertFalse(os.path.exists(self.parcial))
+
+    def test_descarta_conteudo_recusado_pelo_validador(self):
+        def poucas_palavras(caminho):
+            raise ErroDownload("Dicionário com poucas palavras.")
+
+        with self.assertRaises(ErroDownload):
+            self.baixar(validar=poucas_palavras)
+        self.assertFalse(os.path.exists(self.parcial))
+        self.assertFalse(os.path.exists(self.parcial + ".json"))
+        # A próxima tentativa baixa tudo de novo (200), sem retomar os bytes recusados
+        self.assertEqual(self.baixar(validar=lambda caminho: True), self.destino)
+        self.assertEqual(self.arquivo.pedidos[-1][0], 200)
+        self.assertEqual(self.ler_destino(), CONTEUDO)
+
+        with self.assertRaises(ErroDownload):
+            self.baixar(validar=lambda caminho: False)
+        self.assertFalse(os.path.exists(self.parcial))
+
+    def test_falha_nao_substitui_o_destino(self):
+        with open(self.destino, "wb") as f:
+            f.write(b"antigo\n")
+        with self.assertRaises(ErroDownload):
+            self.baixar(sha256="0" * 64)
+        self.assertEqual(self.ler_destino(), b"antigo\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
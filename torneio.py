@@ -0,0 +1,371 @@
+"""Torneios do Desafio de Rivais: chaveamento dos confrontos e classificação incremental.
+
+Cada confronto é um duelo (uma partida multiplayer de dois jogadores: cada
+um define a palavra do outro). Quem adivinhou vence quem não adivinhou;
+se os dois adivinharam, vence o menor tempo e depois o menor número de
+erros. Como o motor, nada aqui depende de interface: o GameApp joga os
+duelos e entrega os resultados a `Torneio.registrar`.
+
+Formatos:
+    todos_contra_todos  cada um enfrenta todos os outros (método do círculo)
+    suico               N rodadas; a cada rodada, adversários de pontuação parecida que ainda não se enfrentaram
+    eliminatoria        mata-mata com cabeças de chave; folgas para os melhores quando não é potência de 2
+
+A classificação não é reordenada do zero: cada resultado tira o jogador
+da lista ordenada e o reinsere na nova posição (busca binária), então a
+posição de qualquer um e o topo da tabela saem sem ordenar de novo.
+
+Uso (simulação para medir o chaveamento com muitos jogadores):
+    python torneio.py --jogadores 500 --formato suico
+    python torneio.py --jogadores 1024 --formato eliminatoria
+"""
+import argparse
+import bisect
+import math
+import random
+import time
+
+from motor import STATUS_ADIVINHOU
+
+FORMATO_TODOS_CONTRA_TODOS = "todos_contra_todos"
+FORMATO_SUICO = "suico"
+FORMATO_ELIMINATORIA = "eliminatoria"
+FORMATOS = (FORMATO_TODOS_CONTRA_TODOS, FORMATO_SUICO, FORMATO_ELIMINATORIA)
+
+PONTOS_VITORIA = 3
+PONTOS_EMPATE = 1
+TOLERANCIA_EMPATE_S = 0.01  # Tempos mais próximos que isto contam como iguais
+
+
+class ResultadoDuelo:
+    """O que um jogador fez ao adivinhar a palavra do adversário"""
+    __slots__ = ('status', 'tempo', 'erros')
+
+    def __init__(self, status, tempo, erros):
+        self.status = status
+        self.tempo = tempo
+        self.erros = erros if isinstance(erros, int) else 0  # Desistência vem como texto
+
+    @property
+    def adivinhou(self):
+        return self.status == STATUS_ADIVINHOU and self.tempo != float('inf')
+
+
+def decidir_duelo(resultado_a, resultado_b):
+    """'a', 'b' ou None (empate)"""
+    if resultado_a.adivinhou != resultado_b.adivinhou:
+        return 'a' if resultado_a.adivinhou else 'b'
+    if not resultado_a.adivinhou:
+        return None
+    if abs(resultado_a.tempo - resultado_b.tempo) > TOLERANCIA_EMPATE_S:
+        return 'a' if resultado_a.tempo < resultado_b.tempo else 'b'
+    if resultado_a.erros != resultado_b.erros:
+        return 'a' if resultado_a.erros < resultado_b.erros else 'b'
+    return None
+
+
+class Participante:
+    __slots__ = ('nome', 'semente', 'pontos', 'vitorias', 'empates', 'derrotas', 'tempo_total', 'erros_total',
+                 'adversarios', 'folgas', 'eliminado_na_rodada')
+
+    def __init__(self, nome, semente):
+        self.nome = nome
+        self.semente = semente  # Ordem de inscrição: desempate final e cabeça de chave
+        self.pontos = 0
+        self.vitorias = 0
+        self.empates = 0
+        self.derrotas = 0
+        self.tempo_total = 0.0  # Só das palavras adivinhadas
+        self.erros_total = 0
+        self.adversarios = set()
+        self.folgas = 0
+        self.eliminado_na_rodada = None
+
+    def chave(self):
+        """Mais pontos, depois menos tempo, menos erros e a inscrição mais antiga (nunca empata)"""
+        return (-self.pontos, self.tempo_total, self.erros_total, self.semente)
+
+
+class Confronto:
+    """Um duelo de uma rodada; sem `b` é uma folga (vitória sem jogar)"""
+    __slots__ = ('rodada', 'a', 'b', 'vencedor', 'jogado')
+
+    def __init__(self, rodada, a, b):
+        self.rodada = rodada
+        self.a = a
+        self.b = b
+        self.vencedor = None  # None também no empate
+        self.jogado = False
+
+    @property
+    def folga(self):
+        return self.b is None
+
+
+class Classificacao:
+    """Lista de chaves sempre ordenada; atualizar um jogador custa duas buscas binárias.
+
+    As chaves são tuplas únicas (a inscrição desempata), então a posição de
+    um jogador é a posição da chave dele na lista.
+    """
+    __slots__ = ('participantes', 'chaves', '_chave_de')
+
+    def __init__(self, participantes):
+        self.participantes = participantes
+        self._chave_de = [p.chave() for p in participantes]
+        self.chaves = sorted(self._chave_de)
+
+    def atualizar(self, participante):
+        antiga = self._chave_de[participante.semente]
+        del self.chaves[bisect.bisect_left(self.chaves, antiga)]
+        nova = self._chave_de[participante.semente] = participante.chave()
+        bisect.insort(self.chaves, nova)
+
+    def posicao(self, participante):
+        """1 para o líder"""
+        return bisect.bisect_left(self.chaves, self._chave_de[participante.semente]) + 1
+
+    def topo(self, quantidade=None):
+        chaves = self.chaves if quantidade is None else self.chaves[:quantidade]
+        return [self.participantes[chave[-1]] for chave in chaves]
+
+
+class Torneio:
+    """Inscritos, rodadas e classificação de um torneio.
+
+    Uso: `proxima_rodada()` devolve os confrontos da rodada (folgas já
+    vêm decididas); cada duelo jogado entra com `registrar()`; quando não
+    houver mais pendentes, pede-se a próxima rodada até `encerrado`.
+    """
+
+    def __init__(self, nomes, formato=FORMATO_SUICO, rodadas=None):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de torneio desconhecido: {formato}")
+        nomes = list(nomes)
+        if len(nomes) < 2:
+            raise ValueError("São necessários pelo menos 2 jogadores.")
+        if len(set(nomes)) != len(nomes):
+            raise ValueError("Há nomes repetidos na inscrição.")
+        self.formato = formato
+        self.participantes = [Participante(nome, i) for i, nome in enumerate(nomes)]
+        self.classificacao = Classificacao(self.participantes)
+        self.rodada = 0
+        self.confrontos = []  # Os da rodada atual
+        self.pendentes = 0
+        if formato == FORMATO_TODOS_CONTRA_TODOS:
+            self.total_rodadas = len(nomes) - 1 if len(nomes) % 2 == 0 else len(nomes)
+        elif formato == FORMATO_SUICO:
+            self.total_rodadas = rodadas or math.ceil(math.log2(len(nomes)))
+        else:
+            self.total_rodadas = math.ceil(math.log2(len(nomes)))
+        self.vivos = list(self.participantes)  # Eliminatória: quem segue na chave, na ordem da chave
+
+    @property
+    def encerrado(self):
+        return self.pendentes == 0 and self.rodada >= self.total_rodadas
+
+    def proxima_rodada(self):
+        if self.pendentes:
+            raise ValueError(f"Ainda há {self.pendentes} confronto(s) da rodada {self.rodada} por jogar.")
+        if self.encerrado:
+            raise ValueError("O torneio já terminou.")
+        self.rodada += 1
+        if self.formato == FORMATO_TODOS_CONTRA_TODOS:
+            pares = self._parear_todos_contra_todos()
+        elif self.formato == FORMATO_SUICO:
+            pares = self._parear_suico()
+        else:
+            pares = self._parear_eliminatoria()
+        self.confrontos = [Confronto(self.rodada, a, b) for a, b in pares]
+        self.pendentes = len(self.confrontos)
+        for confronto in self.confrontos:
+            if confronto.folga:
+                self._registrar_folga(confronto)
+        return self.confrontos
+
+    # ============================================================================
+    # CHAVEAMENTO
+    # ============================================================================
+
+    def _parear_todos_contra_todos(self):
+        """Método do círculo: o primeiro fica parado e os demais giram uma casa por rodada"""
+        roda = list(self.participantes)
+        if len(roda) % 2:
+            roda.append(None)  # Quem cai com None folga
+        giro = (self.rodada - 1) % (len(roda) - 1)
+        resto = roda[1:]
+        roda = [roda[0]] + resto[-giro:] + resto[:-giro] if giro else roda
+        metade = len(roda) // 2
+        pares = []
+        for a, b in zip(roda[:metade], reversed(roda[metade:])):
+            if a is None:
+                a, b = b, a
+            pares.append((a, b))
+        return pares
+
+    def _parear_suico(self):
+        """Na ordem da classificação, cada um pega o próximo livre que ainda não enfrentou.
+
+        Se ninguém livre servir (fim de torneio com poucos jogadores), aceita
+        a revanche com o próximo livre em vez de procurar um emparelhamento
+        perfeito, que custaria muito mais com centenas de jogadores.
+        """
+        ordem = self.classificacao.topo()
+        pares = []
+        if len(ordem) % 2:
+            # Folga para o pior colocado que ainda não folgou
+            folgado = next((p for p in reversed(ordem) if not p.folgas), ordem[-1])
+            ordem.remove(folgado)
+            pares.append((folgado, None))
+        tomado = bytearray(len(ordem))
+        proximo_livre = 0
+        for i, a in enumerate(ordem):
+            if tomado[i]:
+                continue
+            tomado[i] = 1
+            while tomado[proximo_livre]:
+                proximo_livre += 1
+            # Quase sempre o próximo livre serve; só se procura adiante quando já se enfrentaram
+            escolhido = proximo_livre
+            j = proximo_livre
+            while j < len(ordem):
+                if not tomado[j] and ordem[j] not in a.adversarios:
+                    escolhido = j
+                    break
+                j += 1
+            tomado[escolhido] = 1
+            pares.append((a, ordem[escolhido]))
+        return pares
+
+    def _parear_eliminatoria(self):
+        if self.rodada == 1:
+            # Cabeças de chave: 1 x último, 2 x penúltimo... na ordem clássica da chave; sem adversário é folga
+            tamanho = 1 << (len(self.participantes) - 1).bit_length()
+            return [(self.participantes[a], self.participantes[b] if b < len(self.participantes) else None)
+                    for a, b in _ordem_da_chave(tamanho)]
+        return [(self.vivos[i], self.vivos[i + 1]) for i in range(0, len(self.vivos), 2)]
+
+    # ============================================================================
+    # RESULTADOS
+    # ============================================================================
+
+    def registrar(self, confronto, resultado_a, resultado_b):
+        """Aplica o duelo jogado e devolve o vencedor (None no empate)"""
+        if confronto.rodada != self.rodada or confronto.jogado:
+            raise ValueError("Confronto fora da rodada atual ou já registrado.")
+        a, b = confronto.a, confronto.b
+        lado = decidir_duelo(resultado_a, resultado_b)
+        if lado is None and self.formato == FORMATO_ELIMINATORIA:
+            lado = 'a' if a.semente < b.semente else 'b'  # No mata-mata alguém precisa passar: a melhor cabeça de chave
+        for participante, resultado, adversario in ((a, resultado_a, b), (b, resultado_b, a)):
+            participante.adversarios.add(adversario)
+            if resultado.adivinhou:
+                participante.tempo_total += resultado.tempo
+                participante.erros_total += resultado.erros
+        if lado is None:
+            a.empates += 1
+            b.empates += 1
+            a.pontos += PONTOS_EMPATE
+            b.pontos += PONTOS_EMPATE
+        else:
+            vencedor, perdedor = (a, b) if lado == 'a' else (b, a)
+            vencedor.vitorias += 1
+            vencedor.pontos += PONTOS_VITORIA
+            perdedor.derrotas += 1
+            confronto.vencedor = vencedor
+            if self.formato == FORMATO_ELIMINATORIA:
+                perdedor.eliminado_na_rodada = self.rodada
+        self.classificacao.atualizar(a)
+        self.classificacao.atualizar(b)
+        self._concluir(confronto)
+        return confronto.vencedor
+
+    def _registrar_folga(self, confronto):
+        participante = confronto.a
+        participante.folgas += 1
+        participante.vitorias += 1
+        participante.pontos += PONTOS_VITORIA
+        confronto.vencedor = participante
+        self.classificacao.atualizar(participante)
+        self._concluir(confronto)
+
+    def _concluir(self, confronto):
+        confronto.jogado = True
+        self.pendentes -= 1
+        if self.formato == FORMATO_ELIMINATORIA and self.pendentes == 0:
+            self.vivos = [c.vencedor for c in self.confrontos]
+
+    def resultado_final(self):
+        """Ordem final: na eliminatória, quem caiu mais tarde fica à frente; nos outros, a classificação"""
+        if self.formato != FORMATO_ELIMINATORIA:
+            return self.classificacao.topo()
+        sem_queda = self.rodada + 1
+        return sorted(self.participantes, key=lambda p: (-(p.eliminado_na_rodada or sem_queda), p.chave()))
+
+
+def _ordem_da_chave(tamanho):
+    """Pares de índices da primeira rodada de uma chave de `tamanho` (potência de 2).
+
+    Na ordem clássica (1 x 16, 8 x 9, 4 x 13, 5 x 12...) os dois melhores
+    só se encontram na final.
+    """
+    posicoes = [0]
+    while len(posicoes) < tamanho:
+        soma = 2 * len(posicoes) - 1
+        posicoes = [x for p in posicoes for x in (p, soma - p)]
+    return [(posicoes[i], posicoes[i + 1]) for i in range(0, tamanho, 2)]
+
+
+# ============================================================================
+# SIMULAÇÃO
+# ============================================================================
+
+def simular(jogadores, formato, rodadas, rng):
+    """Joga um torneio inteiro com resultados aleatórios e mede chaveamento e atualizações"""
+    torneio = Torneio([f"J{i}" for i in range(jogadores)], formato, rodadas)
+    forca = [rng.random() for _ in range(jogadores)]
+    tempos_chaveamento = []
+    tempos_registro = []
+    while not torneio.encerrado:
+        inicio = time.perf_counter()
+        confrontos = torneio.proxima_rodada()
+        tempos_chaveamento.append(time.perf_counter() - inicio)
+        for confronto in confrontos:
+            if confronto.folga:
+                continue
+            resultados = []
+            for participante in (confronto.a, confronto.b):
+                adivinhou = rng.random() < 0.6 + 0.35 * forca[participante.semente]
+                tempo = rng.uniform(5, 60) * (1.5 - forca[participante.semente])
+                resultados.append(ResultadoDuelo(STATUS_ADIVINHOU if adivinhou else "INCOMPLETA", tempo,
+                                                 rng.randint(0, 4)))
+            inicio = time.perf_counter()
+            torneio.registrar(confronto, *resultados)
+            tempos_registro.append(time.perf_counter() - inicio)
+    return torneio, tempos_chaveamento, tempos_registro
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jogadores", type=int, default=500)
+    parser.add_argument("--formato", choices=FORMATOS, default=FORMATO_SUICO)
+    parser.add_argument("--rodadas", type=int, help="rodadas do suíço (padrão: log2 dos jogadores)")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10, help="quantos colocados mostrar")
+    args = parser.parse_args()
+
+    torneio, chaveamento, registro = simular(args.jogadores, args.formato, args.rodadas, random.Random(args.semente))
+    print(f"{args.jogadores} jogadores, {args.formato}, {torneio.rodada} rodadas, {len(registro)} duelos")
+    print(f"chaveamento por rodada: média {sum(chaveamento) / len(chaveamento) * 1e3:.3f} ms, "
+          f"máximo {max(chaveamento) * 1e3:.3f} ms")
+    if registro:
+        print(f"registro de um duelo (classificação incluída): média {sum(registro) / len(registro) * 1e6:.1f} µs, "
+              f"máximo {max(registro) * 1e6:.1f} µs")
+    for posicao, participante in enumerate(torneio.resultado_final()[:args.top], 1):
+        print(f"{posicao:>4}º {participante.nome:<8} {participante.pontos:>3} pts  "
+              f"{participante.vitorias}V {participante.empates}E {participante.derrotas}D  "
+              f"{participante.tempo_total:8.2f}s  {participante.erros_total} erros")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Verificação em lote do ranking solo contra as gravações das rodadas (antitrapaça).
+
+O ranking_solo.json é um JSON comum: qualquer um pode editar um tempo.
+Cada entrada nova aponta para a gravação da rodada em gravacoes.bin
+(campo "gravacao"); este script refaz a rodada no motor a partir das
+letras gravadas e recusa a entrada quando:
+
+    - não há gravação, ou ela está corrompida ou é de outro jogador/palavra/dificuldade;
+    - as letras embaralhadas não são as que a semente gravada produz;
+    - a reprodução não adivinha a palavra, ou dá outro número de erros,
+      ou um tempo diferente do anotado no ranking (além de TOLERANCIA_TEMPO_S);
+    - as marcações de acerto/erro gravadas não batem com a reprodução;
+    - há intervalos impossíveis entre teclas (abaixo de --intervalo-min-ms)
+      ou a primeira letra chega antes de --reacao-min-ms;
+    - a entrada tem assinatura e ela não confere (alterada depois de assinada).
+
+Cada quiosque é uma pasta com ranking_solo.json e gravacoes.bin; as
+entradas são repartidas em lotes entre vários processos. Com --assinar,
+as entradas aceitas ganham uma assinatura HMAC-SHA256 (chave em
+--chave), gravada de volta no ranking_solo.json de cada quiosque.
+
+Uso:
+    python verificar_ranking.py                                   # a pasta atual
+    python verificar_ranking.py /mnt/quiosques/* --processos 4 --saida verificacao.json
+    python verificar_ranking.py /mnt/quiosques/* --chave chave.bin --assinar
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gravacao import ARQUIVO_GRAVACOES, ler_gravacao
+from motor import STATUS_ADIVINHOU, embaralhar_letras
+
+ARQUIVO_RANKING = "ranking_solo.json"
+TOLERANCIA_TEMPO_S = 0.05  # Relógio da rodada x relógio da gravação, lidos um logo após o outro
+INTERVALO_MIN_MS = 30.0  # Ninguém digita duas letras em menos que isto
+REACAO_MIN_MS = 150.0  # Do clique em "INICIAR RODADA" à primeira letra
+TAMANHO_LOTE = 500
+
+
+def _mensagem_assinada(modo, dificuldade, entrada, inicio_ns):
+    """O que a assinatura cobre: a entrada inteira e a gravação a que ela aponta"""
+    campos = [modo, dificuldade, entrada.get('nome'), entrada.get('tempo'), entrada.get('erros'),
+              entrada.get('palavra'), entrada.get('gravacao'), inicio_ns]
+    return json.dumps(campos, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def assinar(chave, modo, dificuldade, entrada, inicio_ns):
+    return hmac.new(chave, _mensagem_assinada(modo, dificuldade, entrada, inicio_ns), hashlib.sha256).hexdigest()
+
+
+def verificar_entrada(arquivo, modo, dificuldade, entrada, limites, chave=None):
+    """Motivos da recusa (lista vazia = aceita) e a gravação lida (None se não houver)"""
+    deslocamento = entrada.get('gravacao')
+    if not isinstance(deslocamento, int):
+        return ["sem gravação"], None
+    if arquivo is None:
+        return ["gravacoes.bin não encontrado"], None
+    try:
+        gravacao = ler_gravacao(arquivo, deslocamento)
+    except (ValueError, IndexError, OSError, struct.error, UnicodeDecodeError) as e:
+        return [f"gravação ilegível: {e}"], None
+
+    motivos = []
+    if gravacao.jogador != entrada.get('nome') or gravacao.modo != 'solo' or gravacao.dificuldade != dificuldade:
+        motivos.append("gravação é de outro jogador, modo ou dificuldade")
+    if embaralhar_letras(gravacao.palavra, gravacao.semente) != gravacao.letras:
+        motivos.append("letras embaralhadas não conferem com a semente")
+
+    eventos = gravacao.eventos
+    divergentes = []
+
+    def conferir(evento, tentativa):
+        if tentativa is None or tentativa.acertou != evento.acertou or tentativa.posicao != evento.posicao:
+            divergentes.append(evento)
+
+    rodada = gravacao.reproduzir_motor(ao_evento=conferir)
+    if divergentes:
+        motivos.append(f"{len(divergentes)} letra(s) com acerto/posição gravados diferentes da reprodução")
+    if rodada.status != STATUS_ADIVINHOU or gravacao.status != STATUS_ADIVINHOU:
+        motivos.append(f"a reprodução não adivinha a palavra ({rodada.status})")
+    if rodada.palavra != entrada.get('palavra'):
+        motivos.append(f"palavra do ranking ({entrada.get('palavra')}) difere da reproduzida ({rodada.palavra})")
+    if rodada.erros != entrada.get('erros'):
+        motivos.append(f"erros do ranking ({entrada.get('erros')}) diferem da reprodução ({rodada.erros})")
+    tempo = entrada.get('tempo')
+    if not isinstance(tempo, (int, float)) or abs(rodada.tempo_final() - tempo) > limites['tolerancia_s']:
+        motivos.append(f"tempo do ranking ({tempo}) difere da reprodução ({rodada.tempo_final():.3f}s)")
+
+    if eventos and eventos[0].instante_ns < limites['reacao_min_ns']:
+        motivos.append(f"primeira letra em {eventos[0].instante_ns / 1e6:.1f} ms")
+    rapidos = sum(1 for anterior, evento in zip(eventos, eventos[1:])
+                  if evento.instante_ns - anterior.instante_ns < limites['intervalo_min_ns'])
+    if rapidos:
+        motivos.append(f"{rapidos} intervalo(s) entre teclas abaixo de {limites['intervalo_min_ns'] / 1e6:.0f} ms")
+    if eventos and eventos[-1].instante_ns > gravacao.duracao_ns:
+        motivos.append("letra gravada depois do fim da rodada")
+
+    if chave is not None and 'assinatura' in entrada:
+        esperada = assinar(chave, modo, dificuldade, entrada, gravacao.inicio_ns)
+        if not hmac.compare_digest(esperada, str(entrada['assinatura'])):
+            motivos.append("assinatura não confere (entrada alterada depois de assinada)")
+    return motivos, gravacao
+
+
+def verificar_lote(pasta, itens, limites, chave):
+    """Um processo: [(modo, dificuldade, posição, entrada)] de um quiosque -> resultados"""
+    caminho = os.path.join(pasta, ARQUIVO_GRAVACOES)
+    arquivo = open(caminho, 'rb') if os.path.exists(caminho) else None
+    resultados = []
+    try:
+        for modo, dificuldade, posicao, entrada in itens:
+            motivos, gravacao = verificar_entrada(arquivo, modo, dificuldade, entrada, limites, chave)
+            assinatura = None
+            if not motivos and chave is not None:
+                assinatura = assinar(chave, modo, dificuldade, entrada, gravacao.inicio_ns)
+            resultados.append((modo, dificuldade, posicao, motivos, assinatura))
+    finally:
+        if arquivo is not None:
+            arquivo.close()
+    return pasta, resultados
+
+
+def carregar_ranking(pasta):
+    with open(os.path.join(pasta, ARQUIVO_RANKING), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def salvar_ranking(pasta, ranking):
+    """Troca o arquivo de uma vez (um jogo aberto nunca lê um ranking pela metade)"""
+    caminho = os.path.join(pasta, ARQUIVO_RANKING)
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(ranking, f, indent=4)
+    os.replace(temporario, caminho)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("quiosques", nargs="*", default=["."], help="pastas com ranking_solo.json e gravacoes.bin")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--tolerancia-ms", type=float, default=TOLERANCIA_TEMPO_S * 1000)
+    parser.add_argument("--intervalo-min-ms", type=float, default=INTERVALO_MIN_MS)
+    parser.add_argument("--reacao-min-ms", type=float, default=REACAO_MIN_MS)
+    parser.add_argument("--chave", help="arquivo com a chave HMAC (confere assinaturas existentes)")
+    parser.add_argument("--assinar", action="store_true", help="assina as entradas aceitas (exige --chave)")
+    parser.add_argument("--saida", help="grava o relatório em JSON")
+    args = parser.parse_args()
+    if args.assinar and not args.chave:
+        parser.error("--assinar exige --chave")
+    chave = None
+    if args.chave:
+        with open(args.chave, "rb") as f:
+            chave = f.read().strip()
+    limites = {'tolerancia_s': args.tolerancia_ms / 1000, 'intervalo_min_ns': args.intervalo_min_ms * 1e6,
+               'reacao_min_ns': args.reacao_min_ms * 1e6}
+
+    rankings = {}
+    lotes = []
+    for pasta in args.quiosques:
+        try:
+            ranking = rankings[pasta] = carregar_ranking(pasta)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"{pasta}: ranking ilegível ({e})", file=sys.stderr)
+            continue
+        itens = [(modo, dificuldade, posicao, entrada)
+                 for modo, por_dificuldade in ranking.items() if isinstance(por_dificuldade, dict)
+                 for dificuldade, entradas in por_dificuldade.items()
+                 for posicao, entrada in enumerate(entradas)]
+        lotes += [(pasta, itens[i:i + TAMANHO_LOTE]) for i in range(0, len(itens), TAMANHO_LOTE)]
+
+    inicio = time.perf_counter()
+    if args.processos <= 1 or len(lotes) <= 1:
+        concluidos = [verificar_lote(pasta, itens, limites, chave) for pasta, itens in lotes]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processos) as executor:
+            futuros = [executor.submit(verificar_lote, pasta, itens, limites, chave) for pasta, itens in lotes]
+            concluidos = [futuro.result() for futuro in futuros]
+    duracao = time.perf_counter() - inicio
+
+    recusadas = []
+    total = aceitas = assinadas = 0
+    for pasta, resultados in concluidos:
+        for modo, dificuldade, posicao, motivos, assinatura in resultados:
+            total += 1
+            entrada = rankings[pasta][modo][dificuldade][posicao]
+            if motivos:
+                recusadas.append({'quiosque': pasta, 'modo': modo, 'dificuldade': dificuldade, 'posicao': posicao + 1,
+                                  'nome': entrada.get('nome'), 'tempo': entrada.get('tempo'), 'motivos': motivos})
+                continue
+            aceitas += 1
+            if args.assinar and entrada.get('assinatura') != assinatura:
+                entrada['assinatura'] = assinatura
+                assinadas += 1
+    if args.assinar and assinadas:
+        for pasta, ranking in rankings.items():
+            salvar_ranking(pasta, ranking)
+
+    relatorio = {
+        'quiosques': len(rankings),
+        'entradas': total,
+        'aceitas': aceitas,
+        'recusadas': len(recusadas),
+        'assinadas': assinadas,
+        'segundos': round(duracao, 3),
+        'entradas_por_s': round(total / duracao, 1) if duracao else 0.0,
+        'recusas': recusadas,
+    }
+    for recusa in recusadas:
+        print(f"RECUSADA {recusa['quiosque']} {recusa['modo']}/{recusa['dificuldade']} #{recusa['posicao']} "
+              f"{recusa['nome']} ({recusa['tempo']}): " + "; ".join(recusa['motivos']))
+    print(f"{total} entradas de {len(rankings)} quiosque(s): {aceitas} aceitas, {len(recusadas)} recusadas"
+          + (f", {assinadas} assinadas" if args.assinar else "") + f" em {duracao:.2f}s")
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    if recusadas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()